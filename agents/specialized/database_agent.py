@@ -3,7 +3,11 @@ from crewai import Agent
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
-from datetime import datetime
+import logging
+
+from tools.database.schema_diff import MigrationGenerator, SchemaDiff, SchemaSnapshotStore, diff_schemas
+
+logger = logging.getLogger(__name__)
 
 class DatabaseAgent(Agent):
     def __init__(self, llm):
@@ -18,6 +22,9 @@ class DatabaseAgent(Agent):
         )
         self._schema_path = Path("templates/database")
         self._schema_path.mkdir(parents=True, exist_ok=True)
+        # Last generated schema per project, used to emit incremental migrations
+        self._snapshots = SchemaSnapshotStore(self._schema_path / "snapshots")
+        self._migrations = MigrationGenerator()
 
     async def design_database_schema(self, requirements: Dict) -> Dict[str, Any]:
         """Design database schema based on requirements"""
@@ -58,15 +65,44 @@ class DatabaseAgent(Agent):
             })
         return relationships
 
-    async def generate_entity_framework(self, schema: Dict) -> Dict[str, str]:
-        """Generate Entity Framework code"""
+    async def generate_entity_framework(self, schema: Dict,
+                                        project: Optional[str] = None) -> Dict[str, str]:
+        """Generate Entity Framework code.
+
+        Migrations are incremental: the schema is diffed against the last
+        committed snapshot of `project` (default: the schema's `name`) and
+        only the required operations are emitted. Generating does not
+        advance the snapshot, so a retry or re-render yields the same
+        migration, with the same class name and timestamp, until the caller
+        persists or applies it and calls `commit_migration`.
+        """
+        snapshot_key = self._snapshot_key(schema, project)
+        previous = self._snapshots.load(snapshot_key)
+        diff = diff_schemas(previous, schema)
+        migration_name = 'InitialCreate' if previous is None else 'SchemaUpdate'
+        timestamp = None if diff.is_empty else self._snapshots.migration_timestamp(snapshot_key, diff)
+
         return {
             'context': self._generate_db_context(schema),
             'entities': self._generate_entity_classes(schema),
             'configurations': self._generate_entity_configurations(schema),
-            'migrations': self._generate_migration_script(schema)
+            'migrations': self._generate_migration_script(schema, diff, migration_name, timestamp),
+            'migration_sql': self._migrations.sql_script(diff),
+            'schema_changes': diff.summary()
         }
 
+    def commit_migration(self, schema: Dict, project: Optional[str] = None) -> None:
+        """Record `schema` as the applied schema of `project`.
+
+        Call once the migration returned by `generate_entity_framework` has
+        been persisted or applied; the next generation is diffed against it.
+        """
+        self._snapshots.save(self._snapshot_key(schema, project), schema)
+
+    @staticmethod
+    def _snapshot_key(schema: Dict, project: Optional[str]) -> str:
+        return project or schema.get('name') or 'default'
+
     def _define_properties(self, entity: Dict) -> List[Dict]:
         """Define properties for an entity"""
         properties = []
@@ -105,9 +141,14 @@ class DatabaseAgent(Agent):
             'boolean': 'bool',
             'datetime': 'DateTime',
             'guid': 'Guid',
-            'binary': 'byte[]'
+            'binary': 'byte[]',
+            'object': 'object'
         }
-        return type_mapping.get(db_type.lower(), 'object')
+        csharp_type = type_mapping.get(db_type.lower())
+        if csharp_type is None:
+            logger.warning(f"Unmapped database type {db_type!r}; using object (sql_variant)")
+            return 'object'
+        return csharp_type
 
     def _generate_db_context(self, schema: Dict) -> str:
         """Generate DbContext class"""
@@ -185,46 +226,15 @@ class DatabaseAgent(Agent):
         
         return configurations
 
-    def _generate_migration_script(self, schema: Dict) -> str:
-        """Generate initial migration script"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"""
-using Microsoft.EntityFrameworkCore.Migrations;
-
-namespace YourNamespace.Migrations
-{{
-    public partial class InitialCreate_{timestamp} : Migration
-    {{
-        protected override void Up(MigrationBuilder migrationBuilder)
-        {{
-            {self._generate_create_tables(schema)}
-        }}
-
-        protected override void Down(MigrationBuilder migrationBuilder)
-        {{
-            {self._generate_drop_tables(schema)}
-        }}
-    }}
-}}
-"""
-
-    def _generate_create_tables(self, schema: Dict) -> str:
-        """Generate CREATE TABLE statements"""
-        create_statements = []
-        for entity in schema['entities']:
-            create_statements.append(f"""
-            migrationBuilder.CreateTable(
-                name: "{entity['name']}s",
-                columns: table => new
-                {{
-                    {self._generate_column_definitions(entity)}
-                }},
-                constraints: table =>
-                {{
-                    {self._generate_constraints(entity, schema)}
-                }});
-            """)
-        return "\n".join(create_statements)
+    def _generate_migration_script(self, schema: Dict, diff: Optional[SchemaDiff] = None,
+                                   name: str = 'InitialCreate',
+                                   timestamp: Optional[str] = None) -> str:
+        """Generate the migration for the schema changes (full schema when no diff is given)"""
+        if diff is None:
+            diff = diff_schemas(None, schema)
+        if diff.is_empty:
+            return ""
+        return self._migrations.ef_migration(diff, name, timestamp)
 
     def save_schema(self, schema: Dict) -> None:
         """Save database schema for reuse"""
@@ -1,21 +1,94 @@
 # analysis/agent_analyzer.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
 from .requirements_analyzer import RequirementsAnalyzer
+from .agent_pool import AgentPool
+from .analysis_cache import SectionCache
 from agents.specialized.uiux_agent import UiUxAgent
 from agents.specialized.wpf_agent import WpfAgent
 from agents.specialized.database_agent import DatabaseAgent
 from agents.specialized.api_agent import ApiAgent
 from agents.specialized.security_agent import SecurityAgent
 
+# Agente e método de análise de cada especialista
+AGENT_ANALYSES = {
+    'uiux': (UiUxAgent, 'analyze_requirements'),
+    'wpf': (WpfAgent, 'design_interface'),
+    'database': (DatabaseAgent, 'design_database_schema'),
+    'api': (ApiAgent, 'design_service_layer'),
+    'security': (SecurityAgent, 'analyze_security')
+}
+
+# Seções do project_structure lidas por cada análise; usadas para reexecutar
+# apenas as análises cujas entradas mudaram. Manter em sincronia com os agentes.
+ANALYSIS_DEPENDENCIES = {
+    'requirements': ['features'],
+    'uiux': ['features', 'navigation_type', 'menu_style', 'auto_save'],
+    'wpf': [
+        'layout_type', 'rows', 'columns', 'margins', 'spacing', 'controls',
+        'colors', 'fonts', 'control_styles', 'animations', 'converters',
+        'template_types'
+    ],
+    'database': ['entities', 'relationships', 'tables'],
+    'api': ['services', 'entities'],
+    'security': ['metadata.path', 'database', 'dependencies', 'features']
+}
+
+# Pool de agentes do processo worker (quando use_process_pool está ativo)
+_worker_agent_pool: Optional[AgentPool] = None
+
+def create_agent_pool(max_idle: int = 4) -> AgentPool:
+    """Cria um pool com as fábricas dos agentes especializados"""
+    return AgentPool(
+        {agent_type: agent_class for agent_type, (agent_class, _) in AGENT_ANALYSES.items()},
+        max_idle=max_idle
+    )
+
+def _run_analysis_in_process(agent_type: str, structure: Dict) -> Dict:
+    """Executa a análise de um agente em um processo separado"""
+    global _worker_agent_pool
+    if _worker_agent_pool is None:
+        _worker_agent_pool = create_agent_pool()
+
+    _, method_name = AGENT_ANALYSES[agent_type]
+    with _worker_agent_pool.agent(agent_type) as agent:
+        return asyncio.run(getattr(agent, method_name)(structure))
+
 class AgentAnalyzer:
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = config or {}
         self.requirements_analyzer = RequirementsAnalyzer()
 
+        # Timeout (segundos) por agente e uso opcional de pool de processos
+        # para análises CPU-bound
+        self.agent_timeout = self.config.get('agent_timeout', 60)
+        self.use_process_pool = self.config.get('use_process_pool', False)
+        self.max_workers = self.config.get(
+            'max_workers',
+            min(len(AGENT_ANALYSES), os.cpu_count() or 1)
+        )
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        # Pool de instâncias reutilizáveis dos agentes (pode ser compartilhado)
+        self.llm = self.config.get('llm')
+        self.agent_pool = self.config.get('agent_pool') or create_agent_pool()
+        if self.config.get('warm_up', False):
+            self.agent_pool.warm_up(llm=self.llm)
+
+        # Cache de resultados para reanálise incremental
+        self.incremental = self.config.get('incremental', True)
+        self.analysis_cache = SectionCache(
+            ANALYSIS_DEPENDENCIES,
+            max_entries=self.config.get('analysis_cache_size', 64)
+        )
+
     async def analyze_with_agents(self, project_structure: Dict) -> Dict[str, Any]:
         """Coordena análise entre RequirementsAnalyzer e agentes"""
         try:
             # Primeira análise de requisitos
-            initial_analysis = await self.requirements_analyzer.analyze_requirements(project_structure)
+            initial_analysis = await self._analyze_requirements(project_structure)
             if not initial_analysis:
                 print("Aviso: Análise inicial retornou vazia")
                 initial_analysis = {}
@@ -28,7 +101,7 @@ class AgentAnalyzer:
             }
 
             # Coleta análises específicas dos agentes
-            agent_analyses = await self._collect_agent_analyses(enriched_structure)
+            agent_analyses, agent_errors = await self._collect_agent_analyses(enriched_structure)
 
             # Combina todas as análises
             final_analysis = self._combine_analyses(
@@ -36,6 +109,7 @@ class AgentAnalyzer:
                 agent_analyses,
                 project_structure
             )
+            final_analysis['agent_errors'] = agent_errors
 
             return final_analysis
 
@@ -46,45 +120,109 @@ class AgentAnalyzer:
                 'patterns': {},
                 'technical': {},
                 'recommendations': {},
-                'agent_analyses': {}
+                'agent_analyses': {},
+                'agent_errors': {}
             }
 
-    async def _collect_agent_analyses(self, enriched_structure: Dict) -> Dict[str, Any]:
-        """Coleta análises de cada agente especializado"""
+    async def _analyze_requirements(self, project_structure: Dict) -> Dict[str, Any]:
+        """Análise de requisitos, reaproveitada se as features não mudaram"""
+        if not self.incremental:
+            return await self.requirements_analyzer.analyze_requirements(project_structure)
+
+        key = self.analysis_cache.key_for('requirements', project_structure)
+        cached = self.analysis_cache.get(key)
+        if cached is not None:
+            return cached
+
+        analysis = await self.requirements_analyzer.analyze_requirements(project_structure)
+        if analysis:
+            self.analysis_cache.put(key, analysis)
+        return analysis
+
+    async def _collect_agent_analyses(self, enriched_structure: Dict) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Coleta análises de cada agente especializado em paralelo
+
+        Falhas ou timeouts de um agente não descartam os demais: o agente
+        afetado retorna análise vazia e o erro é reportado separadamente.
+        Com o modo incremental, apenas agentes cujas seções de entrada
+        mudaram desde a última análise são reexecutados.
+        """
         analyses = {}
+        cache_keys = {}
+        if self.incremental:
+            for agent_type in AGENT_ANALYSES:
+                cache_keys[agent_type] = self.analysis_cache.key_for(agent_type, enriched_structure)
+                cached = self.analysis_cache.get(cache_keys[agent_type])
+                if cached is not None:
+                    analyses[agent_type] = cached
 
-        try:
-            # UI/UX Analysis
-            uiux_agent = UiUxAgent(None)  # O LLM será injetado posteriormente
-            analyses['uiux'] = await uiux_agent.analyze_requirements(enriched_structure)
+        agent_types = [agent_type for agent_type in AGENT_ANALYSES if agent_type not in analyses]
+        results = await asyncio.gather(
+            *(self._run_agent_analysis(agent_type, enriched_structure)
+              for agent_type in agent_types),
+            return_exceptions=True
+        )
+
+        errors = {}
+        for agent_type, result in zip(agent_types, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.TimeoutError):
+                    errors[agent_type] = f"Timeout após {self.agent_timeout}s"
+                else:
+                    errors[agent_type] = str(result)
+                print(f"Erro na análise do agente {agent_type}: {errors[agent_type]}")
+                analyses[agent_type] = {}
+            else:
+                analyses[agent_type] = result
+                if agent_type in cache_keys:
+                    self.analysis_cache.put(cache_keys[agent_type], result)
 
-            # WPF Implementation Analysis
-            wpf_agent = WpfAgent(None)
-            analyses['wpf'] = await wpf_agent.design_interface(enriched_structure)
+        # Mantém a ordem original dos agentes no resultado
+        return {agent_type: analyses[agent_type] for agent_type in AGENT_ANALYSES}, errors
 
-            # Database Analysis
-            db_agent = DatabaseAgent(None)
-            analyses['database'] = await db_agent.design_database_schema(enriched_structure)
+    async def _run_agent_analysis(self, agent_type: str, structure: Dict) -> Dict:
+        """Executa a análise de um agente respeitando o timeout configurado"""
+        if self.use_process_pool:
+            loop = asyncio.get_running_loop()
+            analysis = loop.run_in_executor(
+                self._get_process_pool(),
+                _run_analysis_in_process,
+                agent_type,
+                structure
+            )
+            return await asyncio.wait_for(analysis, timeout=self.agent_timeout)
 
-            # API Analysis
-            api_agent = ApiAgent(None)
-            analyses['api'] = await api_agent.design_service_layer(enriched_structure)
+        # Os métodos dos agentes são síncronos por dentro (nenhum await):
+        # no event loop rodariam em sequência e o timeout nunca dispararia.
+        # Em threads, as análises se sobrepõem e wait_for pode abandoná-las.
+        analysis = asyncio.to_thread(self._run_pooled_analysis, agent_type, structure)
+        return await asyncio.wait_for(analysis, timeout=self.agent_timeout)
 
-            # Security Analysis
-            security_agent = SecurityAgent(None)
-            analyses['security'] = await security_agent.analyze_security(enriched_structure)
+    def _run_pooled_analysis(self, agent_type: str, structure: Dict) -> Dict:
+        """Executa a análise com um agente do pool (em uma thread própria)
 
-        except Exception as e:
-            print(f"Erro ao coletar análises dos agentes: {str(e)}")
-            analyses = {
-                'uiux': {},
-                'wpf': {},
-                'database': {},
-                'api': {},
-                'security': {}
-            }
+        O agente só volta ao pool quando a análise termina, mesmo que o
+        chamador já tenha desistido por timeout.
+        """
+        _, method_name = AGENT_ANALYSES[agent_type]
+        with self.agent_pool.agent(agent_type, self.llm) as agent:
+            return asyncio.run(getattr(agent, method_name)(structure))
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Cria o pool de processos sob demanda"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._process_pool
+
+    def clear_analysis_cache(self) -> None:
+        """Descarta resultados em cache, forçando reanálise completa"""
+        self.analysis_cache.clear()
 
-        return analyses
+    def close(self) -> None:
+        """Libera o pool de processos, se criado"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
 
     def _combine_analyses(self, 
                          initial_analysis: Dict,
@@ -190,4 +328,4 @@ class AgentAnalyzer:
                 recommendations.append(f"API: Suggested {len(api_analysis['interfaces'])} interfaces")
             return recommendations
         except Exception:
-            return []
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -0,0 +1,103 @@
+# analysis/agent_pool.py
+from typing import Dict, List, Any, Callable, Optional, Tuple, Iterable
+from contextlib import contextmanager
+import threading
+import time
+
+def llm_config_key(llm: Any) -> str:
+    """Gera chave estável para a configuração de um LLM"""
+    if llm is None:
+        return 'none'
+
+    parts = [type(llm).__name__]
+    for attr in ('model_name', 'model', 'temperature', 'max_tokens'):
+        value = getattr(llm, attr, None)
+        if value is not None:
+            parts.append(f"{attr}={value}")
+
+    # Sem atributos conhecidos, a própria instância identifica a configuração
+    if len(parts) == 1:
+        parts.append(f"id={id(llm)}")
+    return '|'.join(parts)
+
+class AgentPool:
+    """Pool thread-safe de instâncias de agentes, por tipo e configuração de LLM.
+
+    Instâncias são reutilizadas entre análises, evitando a inicialização do
+    CrewAI `Agent` (e a criação dos diretórios de templates) a cada requisição.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[Any], Any]], max_idle: int = 4):
+        self.factories = dict(factories)
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'constructions': 0,
+            'reuses': 0,
+            'construction_time': 0.0
+        }
+
+    def acquire(self, agent_type: str, llm: Any = None) -> Any:
+        """Obtém uma instância do pool, criando uma nova se necessário"""
+        if agent_type not in self.factories:
+            raise KeyError(f"Tipo de agente desconhecido: {agent_type}")
+
+        key = (agent_type, llm_config_key(llm))
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.stats['reuses'] += 1
+                return idle.pop()
+
+        return self._construct(agent_type, llm)
+
+    def release(self, agent_type: str, agent: Any, llm: Any = None) -> None:
+        """Devolve uma instância ao pool"""
+        key = (agent_type, llm_config_key(llm))
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(agent)
+
+    @contextmanager
+    def agent(self, agent_type: str, llm: Any = None):
+        """Context manager que adquire e devolve uma instância"""
+        instance = self.acquire(agent_type, llm)
+        try:
+            yield instance
+        finally:
+            self.release(agent_type, instance, llm)
+
+    def warm_up(self, agent_types: Optional[Iterable[str]] = None,
+                llm: Any = None, count: int = 1) -> None:
+        """Pré-constrói instâncias para evitar custo na primeira requisição"""
+        for agent_type in agent_types or self.factories.keys():
+            key = (agent_type, llm_config_key(llm))
+            with self._lock:
+                missing = count - len(self._idle.get(key, []))
+            for _ in range(max(0, missing)):
+                self.release(agent_type, self._construct(agent_type, llm), llm)
+
+    def idle_count(self, agent_type: Optional[str] = None) -> int:
+        """Quantidade de instâncias ociosas (opcionalmente por tipo)"""
+        with self._lock:
+            return sum(
+                len(instances)
+                for (pool_type, _), instances in self._idle.items()
+                if agent_type is None or pool_type == agent_type
+            )
+
+    def clear(self) -> None:
+        """Descarta todas as instâncias ociosas"""
+        with self._lock:
+            self._idle.clear()
+
+    def _construct(self, agent_type: str, llm: Any) -> Any:
+        start = time.perf_counter()
+        instance = self.factories[agent_type](llm)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.stats['constructions'] += 1
+            self.stats['construction_time'] += elapsed
+        return instance
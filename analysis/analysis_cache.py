@@ -0,0 +1,61 @@
+# analysis/analysis_cache.py
+from typing import Dict, List, Any, Optional, Iterable
+from collections import OrderedDict
+import hashlib
+import json
+import copy
+
+_MISSING = object()
+
+def resolve_section(structure: Dict, path: str) -> Any:
+    """Resolve uma seção do project_structure por caminho pontuado (ex.: 'metadata.database')"""
+    value: Any = structure
+    for part in path.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+def section_hash(structure: Dict, paths: Iterable[str]) -> str:
+    """Hash estável das seções das quais uma análise depende"""
+    sections = {}
+    for path in sorted(paths):
+        value = resolve_section(structure, path)
+        sections[path] = '<missing>' if value is _MISSING else value
+
+    payload = json.dumps(sections, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class SectionCache:
+    """Cache LRU de resultados de análise por agente e hash das seções de entrada"""
+
+    def __init__(self, dependencies: Dict[str, List[str]], max_entries: int = 64):
+        self.dependencies = dependencies
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def key_for(self, name: str, structure: Dict) -> tuple:
+        """Chave de cache de uma análise para a estrutura informada"""
+        return (name, section_hash(structure, self.dependencies[name]))
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Retorna cópia do resultado em cache, ou None"""
+        if key not in self._entries:
+            self.stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return copy.deepcopy(self._entries[key])
+
+    def put(self, key: tuple, result: Any) -> None:
+        """Armazena resultado, descartando o menos usado recentemente"""
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todos os resultados em cache"""
+        self._entries.clear()
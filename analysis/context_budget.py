@@ -0,0 +1,112 @@
+# analysis/context_budget.py
+from typing import Dict, List, Any, Optional, Tuple
+import json
+
+from .analysis_cache import resolve_section, _MISSING
+
+# Média aproximada dos tokenizadores BPE para texto em inglês/código
+CHARS_PER_TOKEN = 4
+
+# Seções da análise relevantes para a tarefa de cada agente, por prioridade
+TASK_CONTEXT_SECTIONS = {
+    'uiux': ['project_info', 'agent_analyses.uiux', 'recommendations.ui', 'domain_analysis'],
+    'wpf': ['project_info', 'agent_analyses.wpf', 'recommendations.ui',
+            'recommendations.implementation', 'patterns'],
+    'database': ['project_info', 'agent_analyses.database', 'recommendations.database',
+                 'domain_analysis'],
+    'api': ['project_info', 'agent_analyses.api', 'recommendations.api', 'patterns'],
+    'security': ['project_info', 'agent_analyses.security', 'recommendations.security',
+                 'technical_requirements']
+}
+
+# Níveis de compactação: (máximo de itens por lista/dicionário, máximo de caracteres por texto)
+COMPACTION_LEVELS = [
+    (None, None),
+    (10, 400),
+    (5, 160),
+    (3, 80),
+    (1, 40)
+]
+
+def estimate_tokens(text: str) -> int:
+    """Estimativa offline da quantidade de tokens de um texto"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def to_prompt_text(value: Any) -> str:
+    """Serialização compacta e determinística usada nos prompts"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+def compact(value: Any, max_items: Optional[int] = None, max_chars: Optional[int] = None) -> Any:
+    """Resume um valor de forma determinística.
+
+    Remove valores vazios, mantém apenas os primeiros `max_items` de listas e
+    dicionários (indicando quantos foram omitidos) e trunca textos longos.
+    """
+    if isinstance(value, dict):
+        items = [
+            (key, compact(item, max_items, max_chars))
+            for key, item in sorted(value.items(), key=lambda pair: str(pair[0]))
+        ]
+        items = [(key, item) for key, item in items if item not in (None, '', [], {})]
+        if max_items is not None and len(items) > max_items:
+            omitted = len(items) - max_items
+            items = items[:max_items] + [('...', f"+{omitted} omitidos")]
+        return dict(items)
+
+    if isinstance(value, (list, tuple, set)):
+        items = [compact(item, max_items, max_chars) for item in value]
+        items = [item for item in items if item not in (None, '', [], {})]
+        if max_items is not None and len(items) > max_items:
+            omitted = len(items) - max_items
+            items = items[:max_items] + [f"... +{omitted} omitidos"]
+        return items
+
+    if isinstance(value, str) and max_chars is not None and len(value) > max_chars:
+        return value[:max_chars] + '...'
+    return value
+
+class ContextBudget:
+    """Monta o contexto de análise de cada tarefa dentro de um limite de tokens.
+
+    Seleciona apenas as seções relevantes para o agente, compacta-as em
+    níveis crescentes até caberem em `max_tokens` e, se ainda necessário,
+    descarta as seções de menor prioridade.
+    """
+
+    def __init__(self, max_tokens: int = 1500, sections: Optional[Dict[str, List[str]]] = None):
+        self.max_tokens = max_tokens
+        self.sections = sections or TASK_CONTEXT_SECTIONS
+
+    def build(self, agent_type: str, analysis: Dict) -> Tuple[str, Dict[str, Any]]:
+        """Retorna o contexto da tarefa e o relatório de tokens economizados"""
+        full_tokens = estimate_tokens(to_prompt_text(analysis))
+
+        selected = {}
+        for path in self.sections.get(agent_type, []):
+            value = resolve_section(analysis, path)
+            if value is not _MISSING and value not in (None, '', [], {}):
+                selected[path] = value
+
+        dropped: List[str] = []
+        while True:
+            for level, (max_items, max_chars) in enumerate(COMPACTION_LEVELS):
+                text = to_prompt_text({
+                    path: compact(value, max_items, max_chars) for path, value in selected.items()
+                })
+                tokens = estimate_tokens(text)
+                if tokens <= self.max_tokens:
+                    break
+            if tokens <= self.max_tokens or len(selected) <= 1:
+                break
+            path = list(selected)[-1]
+            selected.pop(path)
+            dropped.append(path)
+
+        return text, {
+            'full_tokens': full_tokens,
+            'context_tokens': tokens,
+            'saved_tokens': max(full_tokens - tokens, 0),
+            'compaction_level': level,
+            'sections': list(selected),
+            'dropped_sections': dropped
+        }
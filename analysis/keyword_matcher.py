@@ -0,0 +1,130 @@
+# analysis/keyword_matcher.py
+from typing import Dict, List, Set, Iterable, Optional
+from collections import deque
+
+class KeywordMatcher:
+    """Matcher multi-padrão (autômato Aho-Corasick) para grupos de palavras-chave.
+
+    Cada palavra-chave pertence a um ou mais grupos (ex.: domínios). Uma única
+    passagem linear sobre o texto identifica todos os grupos encontrados.
+    """
+
+    def __init__(self, keyword_groups: Optional[Dict[str, Iterable[str]]] = None,
+                 case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self._keyword_groups: Dict[str, Set[str]] = {}
+
+        # Estrutura do autômato: transições, links de falha e saídas por estado
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+        self._compiled = True
+
+        for group, keywords in (keyword_groups or {}).items():
+            self.add_keywords(group, keywords)
+
+    @property
+    def groups(self) -> List[str]:
+        """Retorna os grupos registrados"""
+        return list(self._keyword_groups.keys())
+
+    def add_keywords(self, group: str, keywords: Iterable[str]) -> None:
+        """Adiciona palavras-chave a um grupo (criando-o se necessário)"""
+        group_keywords = self._keyword_groups.setdefault(group, set())
+        for keyword in keywords:
+            keyword = self._normalize(keyword)
+            if not keyword or keyword in group_keywords:
+                continue
+            group_keywords.add(keyword)
+            self._insert(keyword)
+
+    def remove_group(self, group: str) -> None:
+        """Remove um grupo e reconstrói a trie"""
+        if self._keyword_groups.pop(group, None) is None:
+            return
+        self._goto, self._fail, self._output = [{}], [0], [set()]
+        for keywords in self._keyword_groups.values():
+            for keyword in keywords:
+                self._insert(keyword)
+
+    def find_groups(self, text: str) -> Set[str]:
+        """Retorna os grupos com pelo menos uma palavra-chave presente no texto"""
+        return set(self.count_matches(text, stop_when_all=True))
+
+    def count_matches(self, text: str, stop_when_all: bool = False) -> Dict[str, int]:
+        """Conta ocorrências de palavras-chave por grupo em uma passagem"""
+        self._compile()
+        counts: Dict[str, int] = {}
+        goto, fail, output = self._goto, self._fail, self._output
+        total_groups = len(self._keyword_groups)
+        state = 0
+
+        for char in self._normalize(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for group in output[state]:
+                counts[group] = counts.get(group, 0) + 1
+            if stop_when_all and len(counts) == total_groups:
+                break
+
+        return counts
+
+    def score(self, texts: Iterable[str]) -> Dict[str, int]:
+        """Pontua cada grupo: +1 por texto que contém alguma palavra-chave do grupo"""
+        scores = {group: 0 for group in self._keyword_groups}
+        for text in texts:
+            for group in self.find_groups(text):
+                scores[group] += 1
+        return scores
+
+    def _normalize(self, text: str) -> str:
+        text = str(text)
+        return text if self.case_sensitive else text.lower()
+
+    def _insert(self, keyword: str) -> None:
+        """Insere palavra-chave na trie; links de falha são recalculados sob demanda"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._compiled = False
+
+    def _compile(self) -> None:
+        """Calcula links de falha (BFS) e propaga saídas"""
+        if self._compiled:
+            return
+
+        # Saídas terminais de cada palavra-chave; as herdadas vêm dos links de falha
+        terminal = [set() for _ in self._goto]
+        for group, keywords in self._keyword_groups.items():
+            for keyword in keywords:
+                state = 0
+                for char in keyword:
+                    state = self._goto[state][char]
+                terminal[state].add(group)
+        self._output = terminal
+
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            current = queue.popleft()
+            for char, next_state in self._goto[current].items():
+                queue.append(next_state)
+                fallback = self._fail[current]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+        self._compiled = True
@@ -1,6 +1,7 @@
 # analysis/requirements_analyzer.py
 from typing import Dict, List, Any, Optional
 from .pattern_matcher import PatternMatcher
+from .keyword_matcher import KeywordMatcher
 from pathlib import Path
 import json
 
@@ -25,6 +26,23 @@ class RequirementsAnalyzer:
                 'common_features': ['Notification', 'Status', 'Progress']
             }
         }
+
+        # Palavras-chave usadas na pontuação de domínio
+        self.domain_keywords = {
+            'business': ['crud', 'document', 'report'],
+            'data_analysis': ['dashboard', 'chart', 'analysis'],
+            'workflow': ['task', 'workflow', 'status']
+        }
+        self.domain_matcher = KeywordMatcher(self.domain_keywords)
+
+    def add_domain_keywords(self, domain: str, keywords: List[str]) -> None:
+        """Registra palavras-chave adicionais (ou um novo domínio) para a pontuação"""
+        domain_keywords = self.domain_keywords.setdefault(domain, [])
+        for keyword in keywords:
+            if keyword not in domain_keywords:
+                domain_keywords.append(keyword)
+        self.domain_matcher.add_keywords(domain, keywords)
+
     async def analyze_requirements(self, requirements: Dict) -> Dict[str, Any]:
         """Análise completa dos requisitos"""
         try:
@@ -57,26 +75,11 @@ class RequirementsAnalyzer:
 
     def _analyze_domain(self, requirements: Dict) -> Dict:
         """Analisa e identifica o domínio da aplicação"""
-        domain_scores = {
-            'business': 0,
-            'data_analysis': 0,
-            'workflow': 0
-        }
-
-        # Analisa features para identificar domínio
+        # Analisa features para identificar domínio: cada feature soma 1 ponto
+        # para cada domínio com alguma palavra-chave presente (uma única
+        # passagem pelo autômato por feature)
         features = requirements.get('features', {})
-        for feature in features:
-            # Pontuação para features de negócio
-            if any(kw in str(feature).lower() for kw in ['crud', 'document', 'report']):
-                domain_scores['business'] += 1
-            
-            # Pontuação para análise de dados
-            if any(kw in str(feature).lower() for kw in ['dashboard', 'chart', 'analysis']):
-                domain_scores['data_analysis'] += 1
-            
-            # Pontuação para workflow
-            if any(kw in str(feature).lower() for kw in ['task', 'workflow', 'status']):
-                domain_scores['workflow'] += 1
+        domain_scores = self.domain_matcher.score(features)
 
         # Identifica domínio principal
         primary_domain = max(domain_scores.items(), key=lambda x: x[1])
@@ -347,4 +350,4 @@ class RequirementsAnalyzer:
             if pattern['relevance'] == 'high':
                 recommendations.append(f"Priorizar implementação do padrão {pattern['name']}")
     
-        return recommendations
\ No newline at end of file
+        return recommendations
\ No newline at end of file
@@ -0,0 +1,48 @@
+# benchmarks/agent_construction.py
+"""Mede o custo de construção dos agentes especializados e o ganho do AgentPool.
+
+Uso: python -m benchmarks.agent_construction [--iterations N]
+"""
+import argparse
+import time
+
+from analysis.agent_analyzer import AGENT_ANALYSES, create_agent_pool
+
+def measure_construction(iterations: int) -> dict:
+    """Tempo médio (ms) para construir cada agente do zero"""
+    results = {}
+    for agent_type, (agent_class, _) in AGENT_ANALYSES.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            agent_class(None)
+        results[agent_type] = (time.perf_counter() - start) * 1000 / iterations
+    return results
+
+def measure_pooled(iterations: int) -> dict:
+    """Tempo médio (ms) para obter cada agente de um pool aquecido"""
+    pool = create_agent_pool()
+    pool.warm_up()
+    results = {}
+    for agent_type in AGENT_ANALYSES:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            with pool.agent(agent_type):
+                pass
+        results[agent_type] = (time.perf_counter() - start) * 1000 / iterations
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    constructed = measure_construction(args.iterations)
+    pooled = measure_pooled(args.iterations)
+
+    print(f"{'agente':<10} {'construção (ms)':>16} {'pool (ms)':>12}")
+    for agent_type in AGENT_ANALYSES:
+        print(f"{agent_type:<10} {constructed[agent_type]:>16.3f} {pooled[agent_type]:>12.4f}")
+    print(f"{'total':<10} {sum(constructed.values()):>16.3f} {sum(pooled.values()):>12.4f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/bulk_generation.py
+"""Compara a geração entidade a entidade com a API em lote.
+
+Gera N entidades (e um serviço por entidade) sintéticas e mede:
+- por entidade: `generate_entity_schema`/`generate_service` + gravação de cada arquivo;
+- em lote: `generate_entity_schemas`/`generate_services` + gravação paralela.
+
+Uso: python -m benchmarks.bulk_generation [--entities N] [--workers W] [--repeat R]
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from tools.api.service_generator import ServiceGenerator
+from tools.database.schema_generator import SchemaGenerator
+
+PROPERTY_TYPES = ('string', 'int', 'decimal', 'DateTime', 'bool')
+
+def synthetic_schema(entities: int, properties: int = 12) -> dict:
+    """Schema com `entities` entidades de `properties` propriedades cada"""
+    schema = {'namespace': 'Benchmark.Domain.Entities', 'entities': []}
+    for i in range(entities):
+        props = [{'name': 'Id', 'type': 'int', 'key': True, 'required': True}]
+        for j in range(properties - 1):
+            prop_type = PROPERTY_TYPES[j % len(PROPERTY_TYPES)]
+            prop = {'name': f"Field{j}", 'type': prop_type, 'nullable': j % 3 == 0}
+            if prop_type == 'string':
+                prop.update({'required': True, 'max_length': 100 + j, 'column_name': f"field_{j}"})
+            props.append(prop)
+        schema['entities'].append({
+            'name': f"Entity{i}",
+            'namespace': schema['namespace'],
+            'properties': props,
+            'navigation_properties': [
+                {'name': f"Children{i}", 'type': 'one_to_many', 'entity': f"Entity{(i + 1) % entities}"}
+            ]
+        })
+    return schema
+
+def synthetic_services(schema: dict) -> list:
+    """Um serviço CRUD por entidade do schema"""
+    services = []
+    for entity in schema['entities']:
+        name = entity['name']
+        services.append({
+            'name': name,
+            'namespace': 'Benchmark.Services',
+            'dependencies': [{'type': f"I{name}Repository", 'name': 'Repository'}],
+            'methods': [
+                {'name': 'GetByIdAsync', 'return_type': f"{name}Dto",
+                 'parameters': [{'type': 'int', 'name': 'id'}]},
+                {'name': 'CreateAsync', 'return_type': f"{name}Dto",
+                 'parameters': [{'type': f"Create{name}Dto", 'name': 'dto'}]}
+            ],
+            'dtos': [{
+                'name': f"Create{name}Dto",
+                'properties': [
+                    {'name': prop['name'], 'type': prop['type'],
+                     'validations': ['Required'] if prop.get('required') else []}
+                    for prop in entity['properties']
+                ],
+                'validation_rules': ['RuleFor(x => x.Id).GreaterThan(0)']
+            }]
+        })
+    return services
+
+def per_entity(schema: dict, services: list, root: Path) -> float:
+    schema_generator, service_generator = SchemaGenerator(), ServiceGenerator()
+    start = time.perf_counter()
+    for entity in schema['entities']:
+        (root / 'Entities').mkdir(parents=True, exist_ok=True)
+        (root / 'Entities' / f"{entity['name']}.cs").write_text(
+            schema_generator.generate_entity_schema(entity), encoding='utf-8'
+        )
+    for config in services:
+        service_dir = root / 'Services' / config['name']
+        for file_name, content in service_generator.generate_service(config).items():
+            if isinstance(content, dict):
+                (service_dir / 'DTOs').mkdir(parents=True, exist_ok=True)
+                for dto_name, dto_code in content.items():
+                    (service_dir / 'DTOs' / f"{dto_name}.cs").write_text(dto_code, encoding='utf-8')
+            else:
+                service_dir.mkdir(parents=True, exist_ok=True)
+                (service_dir / f"{file_name}.cs").write_text(content, encoding='utf-8')
+    return time.perf_counter() - start
+
+def bulk(schema: dict, services: list, root: Path, workers: int) -> float:
+    schema_generator, service_generator = SchemaGenerator(), ServiceGenerator()
+    start = time.perf_counter()
+    schema_generator.save_entity_schemas(
+        schema_generator.generate_entity_schemas(schema), root / 'Entities', workers
+    )
+    service_generator.save_services(
+        service_generator.generate_services(services), root / 'Services', workers
+    )
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--repeat', type=int, default=3, help='melhor de R execuções')
+    args = parser.parse_args()
+
+    schema = synthetic_schema(args.entities)
+    services = synthetic_services(schema)
+    work_dir = Path(tempfile.mkdtemp(prefix='kallista-bulk-'))
+    try:
+        sequential = min(
+            per_entity(schema, services, work_dir / f"per_entity{i}") for i in range(args.repeat)
+        )
+        batched = min(
+            bulk(schema, services, work_dir / f"bulk{i}", args.workers) for i in range(args.repeat)
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"Entidades: {args.entities} (+ {len(services)} serviços)")
+    print(f"Por entidade: {sequential * 1000:.1f} ms")
+    print(f"Em lote:      {batched * 1000:.1f} ms ({sequential / batched:.1f}x)")
+
+if __name__ == '__main__':
+    main()
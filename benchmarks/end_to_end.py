@@ -0,0 +1,90 @@
+# benchmarks/end_to_end.py
+"""Mede `AgentIntegrator.generate_project` ponta a ponta contra o servidor LLM local.
+
+O tempo do modelo é o tempo de parede em que havia ao menos uma requisição
+em andamento no servidor; o restante é overhead do pipeline (análise,
+CrewAI, geração de arquivos).
+
+Uso: python -m benchmarks.end_to_end [--projects N] [--first-token S] [--tokens-per-second R]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from cli.agent_integration import AgentIntegrator
+from cli.generation_status import generation_failure
+from cli.spec_converter import SpecificationConverter
+from core.llm.fake_server import FakeChatCompletionsServer, LatencyModel, load_recordings
+from core.llm.llm_factory import create_llm
+
+PROJECT_TYPES = ('kanban', 'dashboard', 'crud')
+
+async def run_benchmark(server: FakeChatCompletionsServer, projects: int) -> list:
+    """Gera os projetos em sequência e mede tempo total e tempo do modelo"""
+    integrator = AgentIntegrator(llm=create_llm({
+        'provider': 'openai',
+        'model': 'fake',
+        'base_url': server.url,
+        'cache_mode': 'off',
+        'coalesce': False
+    }))
+    converter = SpecificationConverter()
+
+    runs = []
+    for i in range(projects):
+        structure = converter.convert_to_project_structure({
+            'type': PROJECT_TYPES[i % len(PROJECT_TYPES)],
+            'name': f"Benchmark{i}"
+        })
+        server.reset_stats()
+        start = time.perf_counter()
+        result = await integrator.generate_project(structure)
+        wall_time = time.perf_counter() - start
+        model_time = server.busy_time()
+        runs.append({
+            'project': structure['metadata']['name'],
+            'status': 'error' if generation_failure(result) else 'success',
+            'wall_time': wall_time,
+            'model_time': model_time,
+            'overhead': wall_time - model_time,
+            'requests': server.stats['requests']
+        })
+    return runs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--projects', type=int, default=3)
+    parser.add_argument('--first-token', type=float, default=0.3)
+    parser.add_argument('--first-token-jitter', type=float, default=0.1)
+    parser.add_argument('--tokens-per-second', type=float, default=50.0)
+    parser.add_argument('--tokens-per-second-jitter', type=float, default=10.0)
+    parser.add_argument('--distribution', default='uniform')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--recordings', help='JSONL com respostas gravadas')
+    args = parser.parse_args()
+
+    latency = LatencyModel(
+        args.first_token, args.first_token_jitter,
+        args.tokens_per_second, args.tokens_per_second_jitter,
+        args.distribution, seed=args.seed
+    )
+    responses = load_recordings(args.recordings) if args.recordings else None
+    with FakeChatCompletionsServer(responses, latency) as server:
+        runs = asyncio.run(run_benchmark(server, args.projects))
+
+    print(f"{'projeto':<14} {'status':<8} {'req':>4} {'total (s)':>10} {'modelo (s)':>11} {'overhead (s)':>13}")
+    for run in runs:
+        print(f"{run['project']:<14} {run['status']:<8} {run['requests']:>4} {run['wall_time']:>10.3f} "
+              f"{run['model_time']:>11.3f} {run['overhead']:>13.3f}")
+    # Gerações com falha não entram nas estatísticas de overhead
+    overheads = [run['overhead'] for run in runs if run['status'] == 'success']
+    failed = len(runs) - len(overheads)
+    if overheads:
+        print(f"overhead médio: {statistics.mean(overheads):.3f}s  mediana: {statistics.median(overheads):.3f}s"
+              + (f"  ({failed} com falha, ignoradas)" if failed else ""))
+    else:
+        print(f"nenhuma geração concluída ({failed} com falha)")
+
+if __name__ == '__main__':
+    main()
@@ -1,51 +1,89 @@
 # cli/agent_integration.py
+# CrewAI, LangChain, agentes e geradores são importados sob demanda (ver
+# propriedades abaixo) para não pesar na inicialização do CLI.
+from __future__ import annotations
 
-from crewai import Crew, Task
-from langchain_openai import ChatOpenAI
-from agents.specialized.wpf_agent import WpfAgent
-from agents.specialized.api_agent import ApiAgent
-from agents.specialized.database_agent import DatabaseAgent
-from agents.specialized.security_agent import SecurityAgent
-from agents.specialized.uiux_agent import UiUxAgent
-from tools.wpf.project_generator import WPFProjectGenerator
-from analysis.agent_analyzer import AgentAnalyzer
 from datetime import datetime
-import os
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, TYPE_CHECKING
+from concurrent.futures import Executor
+from contextlib import contextmanager
 import json
+import time
+
+if TYPE_CHECKING:
+    from tasks.task_graph import TaskGraph
+
+# Formato reconhecido pelo StreamingProjectWriter para gravar arquivos durante a execução
+FILE_BLOCK_INSTRUCTIONS = (
+    "Emit each complete source file (XAML, C#) as a fenced code block whose opening "
+    "line has the language and the project-relative path, e.g. ```csharp Models/Customer.cs"
+)
+
+# Agentes usados pelas tarefas de geração
+TASK_AGENTS = ('wpf', 'api', 'database', 'security', 'uiux')
 
 class AgentIntegrator:
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None, task_concurrency: int = 4,
+                 context_tokens: int = 1500, llm: Any = None):
         load_dotenv()
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
-        self.output_path = Path("output")
-        self.output_path.mkdir(exist_ok=True)
-        self.project_generator = WPFProjectGenerator()
-        self.agent_analyzer = AgentAnalyzer()  # Novo analisador
-            
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        # Executor das chamadas bloqueantes do CrewAI (None = padrão do loop)
+        self.executor = executor
+        # Máximo de tarefas de agentes executando ao mesmo tempo
+        self.task_concurrency = task_concurrency
+        # Limite de tokens do contexto de análise enviado a cada tarefa
+        self.context_tokens = context_tokens
         self.output_path = Path("output")
         self.output_path.mkdir(exist_ok=True)
-        self.project_generator = WPFProjectGenerator()
+        self._llm = llm
+        self._project_generator = None
+        self._agent_analyzer = None
 
-    
-    async def generate_project(self, project_structure: Dict):
-        """Gera o projeto usando os agentes especializados"""
+    @property
+    def llm(self):
+        """LLM com cache de respostas em disco"""
+        if self._llm is None:
+            from core.llm.llm_factory import create_llm
+            self._llm = create_llm()
+        return self._llm
+
+    @property
+    def project_generator(self):
+        if self._project_generator is None:
+            from tools.wpf.project_generator import WPFProjectGenerator
+            self._project_generator = WPFProjectGenerator()
+        return self._project_generator
+
+    @property
+    def agent_analyzer(self):
+        if self._agent_analyzer is None:
+            from analysis.agent_analyzer import AgentAnalyzer
+            self._agent_analyzer = AgentAnalyzer({'warm_up': True})  # Agentes pré-construídos
+        return self._agent_analyzer
+
+    async def generate_project(self, project_structure: Dict, output_root: Optional[str] = None):
+        """Gera o projeto usando os agentes especializados.
+
+        `output_root` é o diretório de saída (padrão: `output` no diretório
+        atual); o daemon recebe o do cliente, já absoluto.
+        """
+        output_root = Path(output_root) if output_root else self.output_path
         print("\nIniciando geração com agentes...")
+        from core.llm.llm_metrics import LLMMetrics
+
+        # Chamadas ao LLM desta geração, por agente e tarefa
+        llm_metrics = LLMMetrics()
+        timings = {}
         try:
             # Análise inicial com o novo analisador
-            analysis_result = await self.agent_analyzer.analyze_with_agents(project_structure)
+            start = time.perf_counter()
+            with llm_metrics.scope(agent='AgentAnalyzer', task='analysis'):
+                analysis_result = await self.agent_analyzer.analyze_with_agents(project_structure)
+            timings['analysis'] = time.perf_counter() - start
             print("\nAnálise de requisitos concluída...")
 
-            # Criar agentes com o contexto da análise
+            # Agentes das tarefas vêm do pool do analisador (aquecido no daemon)
             agents = self._create_agents()
             
             # Criar e executar tarefas com contexto enriquecido
@@ -54,67 +92,76 @@ class AgentIntegrator:
                 'analysis': analysis_result
             }
             
-            tasks = self._create_tasks(agents, enriched_structure)
-            crew = Crew(agents=list(agents.values()), tasks=tasks)
+            # Cada tarefa recebe apenas as seções relevantes da análise,
+            # compactadas dentro do limite de tokens
+            task_contexts = self._build_task_contexts(agents, analysis_result)
+            # Arquivos emitidos pelos agentes são gravados assim que cada bloco
+            # termina de chegar por streaming
+            stream_writer = self.project_generator.stream_writer(
+                project_structure['metadata']['name'], output_root
+            )
+            task_graph = self._create_task_graph(agents, enriched_structure, task_contexts, stream_writer)
             
             # Executar projeto
             print("\nExecutando tarefas...")
-            results = crew.kickoff()
+            # Tarefas independentes rodam em paralelo (kickoff é bloqueante e
+            # executa no executor, fora do event loop)
+            start = time.perf_counter()
+            try:
+                results = await task_graph.run(
+                    self.executor, self.task_concurrency,
+                    task_scope=lambda name, task: self._task_scope(
+                        llm_metrics, stream_writer, name, task
+                    )
+                )
+            finally:
+                self._release_agents(agents)
+            timings['tasks'] = time.perf_counter() - start
             
             # Gerar código usando WPFProjectGenerator
-            generation_result = await self.project_generator.generate_project(
-                self._merge_specs(enriched_structure, results)
-            )
+            start = time.perf_counter()
+            generation_result = await self.project_generator.generate_project({
+                **self._merge_specs(enriched_structure, results),
+                'streamed_files': list(stream_writer.written),
+                'output_root': str(output_root)
+            })
+            generation_result['streaming'] = stream_writer.stats()
+            timings['generation'] = time.perf_counter() - start
             
             # Processar e salvar resultados
-            return await self._process_results(results, enriched_structure, generation_result)
+            return await self._process_results(
+                results, enriched_structure, generation_result,
+                {agent_type: report for agent_type, (_, report) in task_contexts.items()},
+                {
+                    'timings': timings,
+                    'task_timings': getattr(results, 'timings', {}),
+                    'llm': llm_metrics.snapshot()
+                },
+                output_root
+            )
             
         except Exception as e:
             print(f"Erro na geração: {str(e)}")
             return None
 
-    def _create_tasks(self, agents: Dict, enriched_structure: Dict) -> List[Task]:
-        """Cria tarefas para os agentes com contexto enriquecido"""
-        project_name = enriched_structure['metadata']['name']
-        analysis = enriched_structure.get('analysis', {})
-        domain = analysis.get('domain_analysis', {}).get('primary_domain', 'generic')
-
-        return [
-            Task(
-                description=f"Design user interface and experience for {project_name} ({domain} application)",
-                agent=agents['uiux'],
-                expected_output="UI/UX specifications and guidelines",
-                context=analysis.get('agent_analyses', {}).get('uiux', {})
-            ),
-            Task(
-                description=f"Implement WPF interface for {project_name} ({domain} application)",
-                agent=agents['wpf'],
-                expected_output="WPF implementation details",
-                context=analysis.get('agent_analyses', {}).get('wpf', {})
-            ),
-            Task(
-                description=f"Design and implement database structure for {project_name}",
-                agent=agents['database'],
-                expected_output="Database schema and Entity Framework implementation",
-                context=analysis.get('agent_analyses', {}).get('database', {})
-            ),
-            Task(
-                description=f"Design and implement service layer for {project_name}",
-                agent=agents['api'],
-                expected_output="API specifications and implementation",
-                context=analysis.get('agent_analyses', {}).get('api', {})
-            ),
-            Task(
-                description=f"Analyze and implement security measures for {project_name}",
-                agent=agents['security'],
-                expected_output="Security analysis and recommendations",
-                context=analysis.get('agent_analyses', {}).get('security', {})
-            )
-        ]
-    
+    @staticmethod
+    @contextmanager
+    def _task_scope(llm_metrics: Any, stream_writer: Any, name: str, task: Any) -> Iterator[None]:
+        """Escopo de métricas e de streaming de tokens de uma tarefa"""
+        from core.llm.stream_callback import stream_tokens
+
+        with llm_metrics.scope(agent=type(task.agent).__name__, task=name), \
+                stream_tokens(stream_writer, name):
+            yield
 
     async def _get_agent_specs(self, agent: Any, structure: Dict) -> Dict:
         """Obtém especificações de cada agente"""
+        from agents.specialized.wpf_agent import WpfAgent
+        from agents.specialized.api_agent import ApiAgent
+        from agents.specialized.database_agent import DatabaseAgent
+        from agents.specialized.security_agent import SecurityAgent
+        from agents.specialized.uiux_agent import UiUxAgent
+
         if isinstance(agent, UiUxAgent):
             return await agent.analyze_requirements(structure)
         elif isinstance(agent, WpfAgent):
@@ -137,38 +184,72 @@ class AgentIntegrator:
             'agent_results': str(results)
         }
    
-    def _create_tasks(self, agents: Dict, project_structure: Dict) -> List[Task]:
-        """Cria tarefas para os agentes"""
-        project_name = project_structure['metadata']['name']
-        project_type = project_structure['type']
-        
-        return [
-            Task(
-                description=f"Design user interface and experience for {project_name} ({project_type})",
-                agent=agents['uiux'],
-                expected_output="UI/UX specifications and guidelines"
-            ),
-            Task(
-                description=f"Implement WPF interface for {project_name} ({project_type})",
-                agent=agents['wpf'],
-                expected_output="WPF implementation details"
-            ),
-            Task(
-                description=f"Design and implement database structure for {project_name}",
-                agent=agents['database'],
-                expected_output="Database schema and Entity Framework implementation"
-            ),
-            Task(
-                description=f"Design and implement service layer for {project_name}",
-                agent=agents['api'],
-                expected_output="API specifications and implementation"
-            ),
-            Task(
-                description=f"Analyze and implement security measures for {project_name}",
-                agent=agents['security'],
-                expected_output="Security analysis and recommendations"
-            )
-        ]
+    def _build_task_contexts(self, agents: Dict, analysis: Dict) -> Dict[str, tuple]:
+        """Monta o contexto de análise (texto e relatório de tokens) de cada agente"""
+        from analysis.context_budget import ContextBudget
+
+        budget = ContextBudget(self.context_tokens)
+        return {agent_type: budget.build(agent_type, analysis) for agent_type in agents}
+
+    def _create_task_graph(self, agents: Dict, enriched_structure: Dict,
+                           task_contexts: Optional[Dict[str, tuple]] = None,
+                           stream_writer: Any = None) -> TaskGraph:
+        """Cria as tarefas dos agentes com suas dependências.
+
+        UI/UX, banco de dados, API e segurança são independentes e executam em
+        paralelo; a implementação WPF usa as saídas de UI/UX, banco e API.
+        """
+        from crewai import Task
+        from tasks.task_graph import TaskGraph
+
+        project_name = enriched_structure['metadata']['name']
+        project_type = enriched_structure['type']
+        domain = enriched_structure.get('analysis', {}) \
+            .get('domain_analysis', {}).get('primary_domain', 'generic')
+        task_contexts = task_contexts or {}
+
+        def describe(agent_type: str, description: str) -> str:
+            if stream_writer:
+                description = f"{description}\n\n{FILE_BLOCK_INSTRUCTIONS}"
+            if agent_type not in task_contexts:
+                return description
+            return f"{description}\n\nAnalysis context:\n{task_contexts[agent_type][0]}"
+
+        def callback(agent_type: str):
+            return stream_writer.task_callback(agent_type) if stream_writer else None
+
+        graph = TaskGraph()
+        graph.add('uiux', Task(
+            description=describe('uiux', f"Design user interface and experience for {project_name} ({project_type}, {domain} domain)"),
+            agent=agents['uiux'],
+            callback=callback('uiux'),
+            expected_output="UI/UX specifications and guidelines"
+        ))
+        graph.add('database', Task(
+            description=describe('database', f"Design and implement database structure for {project_name}"),
+            agent=agents['database'],
+            callback=callback('database'),
+            expected_output="Database schema and Entity Framework implementation"
+        ))
+        graph.add('api', Task(
+            description=describe('api', f"Design and implement service layer for {project_name}"),
+            agent=agents['api'],
+            callback=callback('api'),
+            expected_output="API specifications and implementation"
+        ))
+        graph.add('security', Task(
+            description=describe('security', f"Analyze and implement security measures for {project_name}"),
+            agent=agents['security'],
+            callback=callback('security'),
+            expected_output="Security analysis and recommendations"
+        ))
+        graph.add('wpf', Task(
+            description=describe('wpf', f"Implement WPF interface for {project_name} ({project_type}, {domain} domain)"),
+            agent=agents['wpf'],
+            callback=callback('wpf'),
+            expected_output="WPF implementation details"
+        ), depends_on=['uiux', 'database', 'api'])
+        return graph
 
     async def save_project_structure(self, structure: Dict):
         """Salva a estrutura do projeto"""
@@ -176,12 +257,15 @@ class AgentIntegrator:
         with open(structure_file, "w") as f:
             json.dump(structure, f, indent=4)
 
-    async def _process_results(self, results: Any, structure: Dict, generation_result: Dict) -> Dict:
+    async def _process_results(self, results: Any, structure: Dict, generation_result: Dict,
+                               context_reports: Optional[Dict] = None,
+                               metrics: Optional[Dict] = None,
+                               output_root: Optional[Path] = None) -> Dict:
         """Processa os resultados dos agentes"""
         try:
             project_name = structure['metadata']['name']
-            output_dir = self.output_path / project_name
-            output_dir.mkdir(exist_ok=True)
+            output_dir = (output_root or self.output_path) / project_name
+            output_dir.mkdir(parents=True, exist_ok=True)
             
             # Estruturar resultado
             results_dict = {
@@ -195,6 +279,8 @@ class AgentIntegrator:
                     'implementation': self._parse_implementation_details(str(results))
                 },
                 'generation': generation_result,
+                'context_tokens': self._summarize_context_reports(context_reports or {}),
+                'metrics': metrics or {},
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -212,6 +298,13 @@ class AgentIntegrator:
                 'message': str(e)
             }
 
+    def _summarize_context_reports(self, context_reports: Dict) -> Dict:
+        """Tokens de contexto por tarefa e total economizado"""
+        return {
+            'tasks': context_reports,
+            'saved_tokens': sum(report['saved_tokens'] for report in context_reports.values())
+        }
+
     def _parse_security_output(self, output: str) -> Dict:
         """Parse do output de segurança"""
         return {
@@ -254,12 +347,20 @@ class AgentIntegrator:
         return code_samples
     
             
+    @property
+    def agent_pool(self):
+        """Pool de instâncias de agentes, compartilhado com o analisador"""
+        return self.agent_analyzer.agent_pool
+
+    def warm_up(self) -> None:
+        """Pré-constrói no pool os agentes das tarefas, para o LLM configurado"""
+        self.agent_pool.warm_up(TASK_AGENTS, llm=self.llm)
+
     def _create_agents(self) -> Dict:
-        """Cria instâncias dos agentes especializados"""
-        return {
-            'wpf': WpfAgent(self.llm),
-            'api': ApiAgent(self.llm),
-            'database': DatabaseAgent(self.llm),
-            'security': SecurityAgent(self.llm),
-            'uiux': UiUxAgent(self.llm)
-        }
\ No newline at end of file
+        """Obtém do pool as instâncias dos agentes especializados"""
+        return {agent_type: self.agent_pool.acquire(agent_type, self.llm) for agent_type in TASK_AGENTS}
+
+    def _release_agents(self, agents: Dict) -> None:
+        """Devolve ao pool os agentes de uma geração"""
+        for agent_type, agent in agents.items():
+            self.agent_pool.release(agent_type, agent, self.llm)
\ No newline at end of file
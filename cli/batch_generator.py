@@ -0,0 +1,143 @@
+# cli/batch_generator.py
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import json
+import logging
+import os
+import time
+
+from .generation_status import generation_failure
+from .spec_converter import SpecificationConverter
+
+class BatchGenerator:
+    """Geração não interativa de projetos a partir de um arquivo JSONL.
+
+    Cada linha do arquivo contém as especificações de um projeto (o mesmo
+    formato coletado por `ProjectCLI.collect_specs`). As linhas são lidas sob
+    demanda e processadas por um pool limitado de workers que compartilham o
+    mesmo `AgentIntegrator` (caches, pool de agentes e cliente LLM).
+    """
+
+    def __init__(self, config: Dict = None, integrator: Any = None):
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.config.setdefault('max_workers', os.cpu_count() or 1)
+        self.config.setdefault('llm_concurrency', self.config['max_workers'])
+        self.config.setdefault('report_path', 'output/batch_report.json')
+
+        self.spec_converter = SpecificationConverter()
+        self._integrator = integrator
+
+        # Threads para as execuções bloqueantes do CrewAI; o tamanho limita
+        # quantas chamadas ao LLM ocorrem simultaneamente
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.config['llm_concurrency'],
+            thread_name_prefix='kallista-batch'
+        )
+
+    @property
+    def integrator(self):
+        if self._integrator is None:
+            from .agent_integration import AgentIntegrator
+            self._integrator = AgentIntegrator(executor=self.executor)
+        return self._integrator
+
+    async def run(self, spec_file: str) -> Dict[str, Any]:
+        """Gera todos os projetos do arquivo e grava o relatório de tempos"""
+        start = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config['max_workers'] * 2)
+        results: List[Dict] = []
+
+        workers = [
+            asyncio.ensure_future(self._worker(queue, results))
+            for _ in range(self.config['max_workers'])
+        ]
+        try:
+            for job in self._read_specs(spec_file):
+                await queue.put(job)
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            self.executor.shutdown(wait=False)
+
+        results.sort(key=lambda result: result['line'])
+        report = {
+            'summary': self._summarize(results, time.perf_counter() - start),
+            'projects': results
+        }
+        self._save_report(report)
+        return report
+
+    def _read_specs(self, spec_file: str) -> Iterator[Tuple[int, Any]]:
+        """Lê as especificações linha a linha (sem carregar o arquivo inteiro)"""
+        with open(spec_file, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as e:
+                    yield line_number, e
+
+    async def _worker(self, queue: asyncio.Queue, results: List[Dict]) -> None:
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            results.append(await self._generate(*job))
+
+    async def _generate(self, line_number: int, specs: Any) -> Dict[str, Any]:
+        """Gera um projeto e mede o tempo de cada etapa"""
+        result = {
+            'line': line_number,
+            'name': specs.get('name') if isinstance(specs, dict) else None,
+            'status': 'error',
+            'started_at': datetime.now().isoformat()
+        }
+        start = time.perf_counter()
+
+        try:
+            if isinstance(specs, Exception):
+                raise ValueError(f"JSON inválido: {str(specs)}")
+
+            project_structure = self.spec_converter.convert_to_project_structure(specs)
+            result['convert_time'] = time.perf_counter() - start
+
+            generation = await self.integrator.generate_project(project_structure)
+            failure = generation_failure(generation)
+            if failure:
+                raise RuntimeError(failure)
+            result['status'] = 'success'
+
+        except Exception as e:
+            result['error'] = str(e)
+            self.logger.error(f"Batch line {line_number} failed: {str(e)}")
+
+        result['elapsed'] = time.perf_counter() - start
+        return result
+
+    def _summarize(self, results: List[Dict], wall_time: float) -> Dict[str, Any]:
+        elapsed = [result['elapsed'] for result in results]
+        succeeded = sum(1 for result in results if result['status'] == 'success')
+        return {
+            'total': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'wall_time': wall_time,
+            'projects_per_minute': len(results) / wall_time * 60 if wall_time else 0.0,
+            'mean_time': sum(elapsed) / len(elapsed) if elapsed else 0.0,
+            'max_time': max(elapsed) if elapsed else 0.0,
+            'max_workers': self.config['max_workers'],
+            'llm_concurrency': self.config['llm_concurrency']
+        }
+
+    def _save_report(self, report: Dict) -> None:
+        report_path = Path(self.config['report_path'])
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4, default=str)
@@ -1,10 +1,9 @@
 # cli/command_handler.py
 import json
 import asyncio
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import WordCompleter
 from .spec_converter import SpecificationConverter
-from .agent_integration import AgentIntegrator
+from .daemon_client import DaemonClient, DaemonUnavailable
+from .generation_status import generation_failure
 
 class ProjectCLI:
     def __init__(self):
@@ -25,18 +24,39 @@ class ProjectCLI:
             'custom'
         ]
         
-        # Configurar autocompletion
-        self.completer = WordCompleter(
-            list(self.commands.keys()) + self.project_types
-        ) 
-        
-        # Inicializar PromptSession        
-        self.session = PromptSession(completer=self.completer)
+        # Sessão interativa e integrador (CrewAI, LangChain, agentes) são
+        # carregados apenas no primeiro uso, mantendo a inicialização rápida
+        self.session = None
         self.spec_converter = SpecificationConverter()
-        self.agent_integrator = AgentIntegrator()
+        self._agent_integrator = None
+
+        # Um único event loop por sessão; gerações são encaminhadas ao daemon
+        # quando ele estiver em execução
+        self.loop = None
+        self.daemon_client = DaemonClient()
+
+    @property
+    def agent_integrator(self):
+        """Integrador de agentes, importado e criado sob demanda"""
+        if self._agent_integrator is None:
+            from .agent_integration import AgentIntegrator
+            self._agent_integrator = AgentIntegrator()
+        return self._agent_integrator
+
+    def _create_session(self):
+        """Cria a PromptSession com autocompletion"""
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.completion import WordCompleter
+
+        completer = WordCompleter(
+            list(self.commands.keys()) + self.project_types
+        )
+        return PromptSession(completer=completer)
 
     def start(self):
         """Inicia o CLI interativo"""
+        if self.session is None:
+            self.session = self._create_session()
         while True:
             try:
                 command = self.session.prompt('Kallista> ').strip()
@@ -49,6 +69,9 @@ class ProjectCLI:
             except Exception as e:
                 print(f"Erro: {str(e)}")
 
+        if self.loop is not None:
+            self.loop.close()
+
     def process_command(self, command):
         """Processa o comando inserido"""
         cmd = command.split()[0].lower()
@@ -56,7 +79,7 @@ class ProjectCLI:
         
         if cmd in self.commands:
             if cmd == 'new':
-                asyncio.run(self.new_project(args))
+                self._run(self.new_project(args))
             else:
                 self.commands[cmd](args)
         else:
@@ -78,6 +101,33 @@ class ProjectCLI:
         specs = self.collect_specs(project_type)
         await self.generate_structure(specs)
 
+    def _run(self, coroutine):
+        """Executa a corrotina no event loop da sessão"""
+        if self.loop is None or self.loop.is_closed():
+            self.loop = asyncio.new_event_loop()
+        return self.loop.run_until_complete(coroutine)
+
+    async def _generate(self, project_structure):
+        """Gera o projeto no daemon, se disponível, ou localmente.
+
+        A requisição ao daemon é bloqueante e roda em uma thread; se o daemon
+        não responder dentro do timeout do cliente, a geração é feita localmente.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.daemon_client.generate, structure=project_structure
+            )
+            if response.get('status') != 'ok':
+                raise RuntimeError(response.get('error'))
+            return response.get('result')
+        except DaemonUnavailable:
+            result = await self.agent_integrator.generate_project(project_structure)
+
+        failure = generation_failure(result)
+        if failure:
+            raise RuntimeError(failure)
+        return result
+
     def collect_specs(self, project_type):
         """Coleta as especificações do projeto"""
         specs = {
@@ -140,7 +190,7 @@ class ProjectCLI:
             proceed = input("\nDeseja prosseguir com esta estrutura? (s/n): ")
             if proceed.lower() == 's':
                 print("\nGerando projeto...")
-                result = await self.agent_integrator.generate_project(project_structure)
+                result = await self._generate(project_structure)
                 print("\nResultado da geração:")
                 print(result)
             else:
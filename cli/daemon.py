@@ -0,0 +1,159 @@
+# cli/daemon.py
+from typing import Dict, Any, Optional
+from pathlib import Path
+import asyncio
+import json
+import logging
+import os
+import time
+
+from .daemon_client import DEFAULT_SOCKET_PATH
+from .generation_status import generation_failure
+from .spec_converter import SpecificationConverter
+
+class KallistaDaemon:
+    """Daemon local que mantém agentes, LLM e geradores aquecidos.
+
+    Atende comandos JSON (um por linha) em um socket Unix, reaproveitando o
+    mesmo event loop e o mesmo `AgentIntegrator` entre gerações.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, integrator: Any = None):
+        self.socket_path = Path(socket_path or DEFAULT_SOCKET_PATH)
+        self.logger = logging.getLogger(__name__)
+        self.spec_converter = SpecificationConverter()
+        self._integrator = integrator
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self.started_at: Optional[float] = None
+        self.stats = {
+            'requests': 0,
+            'generations': 0,
+            'errors': 0
+        }
+
+        self.handlers = {
+            'ping': self._handle_ping,
+            'stats': self._handle_stats,
+            'convert': self._handle_convert,
+            'generate': self._handle_generate,
+            'shutdown': self._handle_shutdown
+        }
+
+    @property
+    def integrator(self):
+        if self._integrator is None:
+            from .agent_integration import AgentIntegrator
+            self._integrator = AgentIntegrator()
+        return self._integrator
+
+    def warm_up(self) -> None:
+        """Carrega LLM, analisador, gerador de projetos e os agentes das tarefas"""
+        start = time.perf_counter()
+        integrator = self.integrator
+        for component in ('llm', 'agent_analyzer', 'project_generator'):
+            getattr(integrator, component, None)
+        integrator.warm_up()
+        self.logger.info(f"Daemon warm-up finished in {time.perf_counter() - start:.2f}s")
+
+    async def start(self) -> None:
+        """Abre o socket Unix e passa a aceitar comandos"""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection,
+            path=str(self.socket_path),
+            limit=16 * 1024 * 1024
+        )
+        os.chmod(self.socket_path, 0o600)
+        self.started_at = time.time()
+
+    async def serve_forever(self) -> None:
+        """Inicia o daemon e aguarda até receber `shutdown`"""
+        await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            response = await self.dispatch(json.loads(line))
+        except Exception as e:
+            response = {'status': 'error', 'error': str(e)}
+
+        writer.write((json.dumps(response, default=str) + '\n').encode('utf-8'))
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Dict) -> Dict[str, Any]:
+        """Executa um comando e retorna a resposta serializável"""
+        self.stats['requests'] += 1
+        handler = self.handlers.get(request.get('command'))
+        if handler is None:
+            self.stats['errors'] += 1
+            return {'status': 'error', 'error': f"Comando desconhecido: {request.get('command')}"}
+
+        try:
+            return {'status': 'ok', **await handler(request)}
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"Daemon command {request.get('command')} failed: {str(e)}")
+            return {'status': 'error', 'error': str(e)}
+
+    async def _handle_ping(self, request: Dict) -> Dict:
+        return {'pid': os.getpid()}
+
+    async def _handle_stats(self, request: Dict) -> Dict:
+        return {
+            'uptime': time.time() - self.started_at if self.started_at else 0,
+            'stats': dict(self.stats)
+        }
+
+    async def _handle_convert(self, request: Dict) -> Dict:
+        return {'structure': self.spec_converter.convert_to_project_structure(request['specs'])}
+
+    async def _handle_generate(self, request: Dict) -> Dict:
+        structure = request.get('structure') or \
+            self.spec_converter.convert_to_project_structure(request['specs'])
+
+        # Caminhos relativos seriam resolvidos no diretório do daemon, não no do cliente
+        output_root = request.get('output_root')
+        if output_root is not None and not Path(output_root).is_absolute():
+            raise ValueError(f"output_root deve ser absoluto: {output_root}")
+
+        start = time.perf_counter()
+        result = await self.integrator.generate_project(structure, output_root=output_root)
+        self.stats['generations'] += 1
+        failure = generation_failure(result)
+        if failure:
+            raise RuntimeError(failure)
+        return {'result': result, 'elapsed': time.perf_counter() - start}
+
+    async def _handle_shutdown(self, request: Dict) -> Dict:
+        self._stopped.set()
+        return {}
+
+def run_daemon(socket_path: Optional[str] = None) -> None:
+    """Executa o daemon em primeiro plano até receber `shutdown`"""
+    daemon = KallistaDaemon(socket_path)
+    daemon.warm_up()
+    print(f"Kallista daemon ouvindo em {daemon.socket_path}")
+    asyncio.run(daemon.serve_forever())
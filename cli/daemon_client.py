@@ -0,0 +1,69 @@
+# cli/daemon_client.py
+# Cliente leve do daemon: usa apenas a biblioteca padrão para que cada
+# invocação do CLI não pague o custo de importação dos agentes.
+from typing import Dict, Any, Optional
+from pathlib import Path
+import json
+import os
+import socket
+
+DEFAULT_SOCKET_PATH = os.getenv(
+    'KALLISTA_SOCKET',
+    str(Path.home() / '.kallista' / 'kallista.sock')
+)
+
+# Tempo máximo (segundos) de espera pela resposta do daemon
+DEFAULT_TIMEOUT = float(os.getenv('KALLISTA_DAEMON_TIMEOUT', '600'))
+
+class DaemonUnavailable(ConnectionError):
+    """Daemon não está em execução ou não aceitou a conexão"""
+
+class DaemonTimeout(DaemonUnavailable):
+    """Daemon não respondeu dentro do timeout (ex.: travado)"""
+
+class DaemonClient:
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.socket_path = socket_path or DEFAULT_SOCKET_PATH
+        self.timeout = timeout
+
+    def is_running(self) -> bool:
+        """Verifica se o daemon responde"""
+        try:
+            return self.request('ping').get('status') == 'ok'
+        except DaemonUnavailable:
+            return False
+
+    def generate(self, output_root: str = 'output', **payload: Any) -> Dict[str, Any]:
+        """Gera um projeto no daemon, gravando em `output_root` (relativo ao chamador)"""
+        return self.request('generate', output_root=str(Path(output_root).resolve()), **payload)
+
+    def request(self, command: str, **payload: Any) -> Dict[str, Any]:
+        """Envia um comando ao daemon e aguarda a resposta"""
+        message = json.dumps({'command': command, **payload}) + '\n'
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.settimeout(self.timeout)
+                conn.connect(self.socket_path)
+                conn.sendall(message.encode('utf-8'))
+                response = self._read_line(conn)
+        except socket.timeout:
+            raise DaemonTimeout(f"Daemon em {self.socket_path} não respondeu em {self.timeout}s")
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailable(f"Daemon indisponível em {self.socket_path}: {str(e)}")
+
+        if not response:
+            raise DaemonUnavailable("Daemon encerrou a conexão sem resposta")
+        return json.loads(response)
+
+    @staticmethod
+    def _read_line(conn: socket.socket) -> str:
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b'\n'):
+                break
+        return b''.join(chunks).decode('utf-8').strip()
@@ -0,0 +1,15 @@
+# cli/generation_status.py
+from typing import Dict, Optional
+
+def generation_failure(generation: Optional[Dict]) -> Optional[str]:
+    """Mensagem de erro de `AgentIntegrator.generate_project`, ou None se teve sucesso.
+
+    Além do status do integrador (None quando a geração lançou exceção),
+    verifica o do `WPFProjectGenerator`, aninhado em `generation['generation']`.
+    """
+    if not generation:
+        return 'Geração falhou'
+    for result in (generation, generation.get('generation') or {}):
+        if result.get('status') == 'error':
+            return result.get('message') or result.get('error') or 'Geração falhou'
+    return None
@@ -1,11 +1,82 @@
 # cli_main.py
-from cli.command_handler import ProjectCLI
+import argparse
+import json
+import sys
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Kallista Project Generator")
+    parser.add_argument('--socket', help="Caminho do socket Unix do daemon")
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('daemon', help="Inicia o daemon com agentes aquecidos")
+    subparsers.add_parser('stop', help="Encerra o daemon")
+    subparsers.add_parser('status', help="Mostra o estado do daemon")
+    generate = subparsers.add_parser('generate', help="Gera um projeto via daemon")
+    generate.add_argument('spec', help="Arquivo JSON com as especificações do projeto")
+    generate.add_argument('--output', default='output', help="Diretório de saída dos projetos")
+    batch = subparsers.add_parser('batch', help="Gera projetos a partir de um arquivo JSONL")
+    batch.add_argument('specs', help="Arquivo JSONL, uma especificação de projeto por linha")
+    batch.add_argument('--workers', type=int, help="Projetos gerados simultaneamente")
+    batch.add_argument('--llm-concurrency', type=int, help="Chamadas simultâneas ao LLM")
+    batch.add_argument('--report', default='output/batch_report.json',
+                       help="Arquivo do relatório de tempos")
+
+    return parser.parse_args(argv)
+
+def run_client(args) -> int:
+    """Encaminha o comando ao daemon (sem importar agentes ou LLM)"""
+    from cli.daemon_client import DaemonClient, DaemonUnavailable
+
+    client = DaemonClient(args.socket)
+    try:
+        if args.command == 'generate':
+            with open(args.spec, encoding='utf-8') as f:
+                response = client.generate(args.output, specs=json.load(f))
+        elif args.command == 'stop':
+            response = client.request('shutdown')
+        else:
+            response = client.request('stats')
+    except DaemonUnavailable as e:
+        print(f"Erro: {str(e)}")
+        return 1
+
+    print(json.dumps(response, indent=2, default=str))
+    return 0 if response.get('status') == 'ok' else 1
+
+def run_batch(args) -> int:
+    """Gera projetos em lote e imprime o resumo do relatório"""
+    import asyncio
+    from cli.batch_generator import BatchGenerator
+
+    config = {'report_path': args.report}
+    if args.workers:
+        config['max_workers'] = args.workers
+    if args.llm_concurrency:
+        config['llm_concurrency'] = args.llm_concurrency
+
+    report = asyncio.run(BatchGenerator(config).run(args.specs))
+    print(json.dumps(report['summary'], indent=2))
+    print(f"Relatório salvo em {args.report}")
+    return 0 if report['summary']['failed'] == 0 else 1
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'daemon':
+        from cli.daemon import run_daemon
+        run_daemon(args.socket)
+        return 0
+    if args.command == 'batch':
+        return run_batch(args)
+    if args.command:
+        return run_client(args)
+
+    from cli.command_handler import ProjectCLI
     print("=== Kallista Project Generator ===")
     print("Digite 'help' para ver os comandos disponíveis")
     cli = ProjectCLI()
     cli.start()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
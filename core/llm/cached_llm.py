@@ -0,0 +1,163 @@
+# core/llm/cached_llm.py
+from typing import Dict, List, Any, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatResult, ChatGeneration
+
+from .response_cache import ResponseCache, ReplayCacheMiss
+
+class CachedChatModel(BaseChatModel):
+    """Envolve um chat model do LangChain com o cache de respostas em disco.
+
+    Requisições idênticas (modelo, mensagens, ferramentas, temperatura e
+    demais parâmetros) são servidas do `ResponseCache`. Com `replay=True`
+    nenhuma chamada é feita ao modelo: faltas no cache geram `ReplayCacheMiss`.
+    Com `single_flight`, requisições idênticas simultâneas compartilham uma
+    única chamada ao modelo. Respostas que não vieram de uma chamada feita
+    por esta requisição (cache ou coalescência) têm `llm_output['cached']`,
+    para que as métricas não contem de novo os tokens gravados.
+    """
+
+    llm: Any
+    response_cache: Any = None
+    single_flight: Any = None
+    replay: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cached-{self.llm._llm_type}"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return dict(self.llm._identifying_params)
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.llm, 'model_name', None) or self._llm_type
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+        """Formata as ferramentas como o modelo interno e mantém o cache no fluxo"""
+        bound = self.llm.bind_tools(tools, **kwargs)
+        return self.bind(**bound.kwargs)
+
+    def cache_key(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  **kwargs: Any) -> str:
+        """Chave de conteúdo da requisição"""
+        params = self._identifying_params
+        options = {
+            key: value for key, value in kwargs.items()
+            if key not in ('tools', 'functions', 'temperature')
+        }
+        return ResponseCache.make_key(
+            model=params.get('model_name') or params.get('model') or self.llm._llm_type,
+            prompt=[message_to_dict(message) for message in messages],
+            tools=kwargs.get('tools') or kwargs.get('functions'),
+            temperature=kwargs.get('temperature', params.get('temperature')),
+            stop=stop,
+            params=params,
+            options=options
+        )
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        key = self.cache_key(messages, stop, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return self._mark_cached(cached)
+
+        called = False
+
+        def fetch() -> ChatResult:
+            nonlocal called
+            # Outra chamada pode ter preenchido o cache enquanto esta aguardava
+            cached = self._lookup(key, count_miss=False)
+            if cached is not None:
+                return self._mark_cached(cached)
+            called = True
+            result = self.llm._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            self._store(key, result)
+            return result
+
+        if self.single_flight is None:
+            return fetch()
+        result = self.single_flight.do(key, fetch)
+        return result if called else self._mark_cached(result)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        key = self.cache_key(messages, stop, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return self._mark_cached(cached)
+
+        called = False
+
+        async def fetch() -> ChatResult:
+            nonlocal called
+            cached = self._lookup(key, count_miss=False)
+            if cached is not None:
+                return self._mark_cached(cached)
+            called = True
+            result = await self.llm._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            self._store(key, result)
+            return result
+
+        if self.single_flight is None:
+            return await fetch()
+        result = await self.single_flight.ado(key, fetch)
+        return result if called else self._mark_cached(result)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Contadores do cache e da coalescência de requisições"""
+        return {
+            'cache': dict(self.response_cache.stats) if self.response_cache is not None else {},
+            'single_flight': dict(self.single_flight.stats) if self.single_flight is not None else {}
+        }
+
+    def _lookup(self, key: str, count_miss: bool = True) -> Optional[ChatResult]:
+        if self.response_cache is not None:
+            if count_miss or self.response_cache.contains(key):
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    return self._deserialize(cached)
+        if self.replay:
+            raise ReplayCacheMiss(f"Resposta não encontrada em cache (replay): {key}")
+        return None
+
+    def _store(self, key: str, result: ChatResult) -> None:
+        if self.response_cache is not None:
+            self.response_cache.put(key, self._serialize(result))
+
+    @staticmethod
+    def _mark_cached(result: ChatResult) -> ChatResult:
+        """Cópia do resultado marcada como não gerada por esta requisição"""
+        if (result.llm_output or {}).get('cached'):
+            return result
+        return ChatResult(
+            generations=result.generations,
+            llm_output={**(result.llm_output or {}), 'cached': True}
+        )
+
+    @staticmethod
+    def _serialize(result: ChatResult) -> Dict:
+        return {
+            'generations': [
+                {
+                    'message': message_to_dict(generation.message),
+                    'generation_info': generation.generation_info
+                }
+                for generation in result.generations
+            ],
+            'llm_output': result.llm_output
+        }
+
+    @staticmethod
+    def _deserialize(data: Dict) -> ChatResult:
+        generations = [
+            ChatGeneration(
+                message=messages_from_dict([generation['message']])[0],
+                generation_info=generation.get('generation_info')
+            )
+            for generation in data.get('generations', [])
+        ]
+        return ChatResult(generations=generations, llm_output=data.get('llm_output'))
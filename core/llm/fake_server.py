@@ -0,0 +1,289 @@
+# core/llm/fake_server.py
+"""Servidor local que imita a API de chat completions da OpenAI.
+
+Responde com textos roteirizados ou gravados, simulando a latência do
+modelo (tempo até o primeiro token + taxa de tokens por segundo), para
+benchmarks ponta a ponta sem rede nem chave de API.
+
+Uso: python -m core.llm.fake_server [--port 8765] [--first-token 0.3] [--tokens-per-second 50]
+"""
+from typing import Dict, List, Any, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+
+DISTRIBUTIONS = ('uniform', 'normal')
+
+class LatencyModel:
+    """Distribuições do tempo até o primeiro token e da taxa de geração"""
+
+    def __init__(self, first_token: float = 0.3, first_token_jitter: float = 0.0,
+                 tokens_per_second: float = 50.0, tokens_per_second_jitter: float = 0.0,
+                 distribution: str = 'uniform', seed: Optional[int] = None):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Distribuição inválida: {distribution} (use {', '.join(DISTRIBUTIONS)})")
+        self.first_token = first_token
+        self.first_token_jitter = first_token_jitter
+        self.tokens_per_second = tokens_per_second
+        self.tokens_per_second_jitter = tokens_per_second_jitter
+        self.distribution = distribution
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def sample(self) -> Tuple[float, float]:
+        """Sorteia (tempo até o primeiro token, tokens por segundo)"""
+        with self.lock:
+            first_token = max(0.0, self._draw(self.first_token, self.first_token_jitter))
+            rate = max(1e-3, self._draw(self.tokens_per_second, self.tokens_per_second_jitter))
+        return first_token, rate
+
+    def _draw(self, mean: float, jitter: float) -> float:
+        if not jitter:
+            return mean
+        if self.distribution == 'normal':
+            return self.random.gauss(mean, jitter)
+        return self.random.uniform(mean - jitter, mean + jitter)
+
+def load_recordings(path: str) -> Dict[str, str]:
+    """Lê respostas gravadas (JSONL com 'match' e 'response')"""
+    recordings = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                recordings[entry['match']] = entry['response']
+    return recordings
+
+class FakeChatCompletionsServer:
+    """Endpoint `/v1/chat/completions` local com latência configurável.
+
+    A resposta é a primeira de `responses` cujo gatilho aparece no prompt;
+    sem correspondência, é um texto determinístico derivado do prompt. O
+    tempo simulado de cada requisição é registrado para separar o tempo do
+    modelo do overhead do pipeline (`busy_time`).
+    """
+
+    def __init__(self, responses: Optional[Dict[str, str]] = None,
+                 latency: Optional[LatencyModel] = None,
+                 default_response: Optional[str] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.responses = dict(responses or {})
+        self.latency = latency or LatencyModel()
+        self.default_response = default_response
+        self.lock = threading.Lock()
+        self.intervals: List[Tuple[float, float]] = []
+        self.stats = {
+            'requests': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'model_time': 0.0
+        }
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """URL base compatível com o cliente da OpenAI"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'FakeChatCompletionsServer':
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name='fake-llm-server', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Atende requisições em primeiro plano (até Ctrl+C)"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeChatCompletionsServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.intervals.clear()
+            for key in self.stats:
+                self.stats[key] = 0 if key != 'model_time' else 0.0
+
+    def busy_time(self) -> float:
+        """Tempo de parede com ao menos uma requisição em andamento"""
+        with self.lock:
+            intervals = sorted(self.intervals)
+        busy, current_start, current_end = 0.0, None, None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            busy += current_end - current_start
+        return busy
+
+    def respond(self, prompt: str) -> str:
+        """Texto de resposta para o prompt"""
+        for trigger, response in self.responses.items():
+            if trigger in prompt:
+                return response
+        if self.default_response is not None:
+            return self.default_response
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+        return f"Final Answer: fake response {digest}"
+
+    def _record(self, start: float, prompt_tokens: int, completion_tokens: int) -> None:
+        end = time.perf_counter()
+        with self.lock:
+            self.intervals.append((start, end))
+            self.stats['requests'] += 1
+            self.stats['prompt_tokens'] += prompt_tokens
+            self.stats['completion_tokens'] += completion_tokens
+            self.stats['model_time'] += end - start
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path.rstrip('/').endswith('/models'):
+                    self._send_json({'object': 'list', 'data': [{'id': 'fake', 'object': 'model'}]})
+                else:
+                    self._send_json({'error': {'message': 'Not found'}}, status=404)
+
+            def do_POST(self) -> None:
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send_json({'error': {'message': 'Not found'}}, status=404)
+                    return
+
+                start = time.perf_counter()
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                prompt = '\n'.join(
+                    str(message.get('content') or '') for message in request.get('messages', [])
+                )
+                text = server.respond(prompt)
+                tokens = text.split(' ')
+                prompt_tokens = len(prompt.split())
+                first_token, rate = server.latency.sample()
+                model = request.get('model', 'fake')
+
+                if request.get('stream'):
+                    self._stream(model, tokens, first_token, rate)
+                    server._record(start, prompt_tokens, len(tokens))
+                else:
+                    time.sleep(first_token + len(tokens) / rate)
+                    server._record(start, prompt_tokens, len(tokens))
+                    self._send_json(self._completion(model, text, prompt_tokens, len(tokens)))
+
+            def _completion(self, model: str, text: str,
+                            prompt_tokens: int, completion_tokens: int) -> Dict:
+                return {
+                    'id': f"chatcmpl-{uuid.uuid4().hex}",
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': model,
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': text},
+                        'finish_reason': 'stop'
+                    }],
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens
+                    }
+                }
+
+            def _stream(self, model: str, tokens: List[str], first_token: float, rate: float) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+
+                completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+                time.sleep(first_token)
+                for index, token in enumerate(tokens):
+                    if index:
+                        time.sleep(1 / rate)
+                    self._send_event(completion_id, model, {
+                        'content': token if index == 0 else ' ' + token
+                    }, None)
+                self._send_event(completion_id, model, {}, 'stop')
+                self.wfile.write(b'data: [DONE]\n\n')
+                self.wfile.flush()
+
+            def _send_event(self, completion_id: str, model: str, delta: Dict,
+                            finish_reason: Optional[str]) -> None:
+                chunk = {
+                    'id': completion_id,
+                    'object': 'chat.completion.chunk',
+                    'created': int(time.time()),
+                    'model': model,
+                    'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}]
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+                self.wfile.flush()
+
+            def _send_json(self, payload: Dict, status: int = 200) -> None:
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--first-token', type=float, default=0.3, help='segundos até o primeiro token')
+    parser.add_argument('--first-token-jitter', type=float, default=0.0)
+    parser.add_argument('--tokens-per-second', type=float, default=50.0)
+    parser.add_argument('--tokens-per-second-jitter', type=float, default=0.0)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--recordings', help='JSONL com {"match": ..., "response": ...} por linha')
+    args = parser.parse_args()
+
+    server = FakeChatCompletionsServer(
+        responses=load_recordings(args.recordings) if args.recordings else None,
+        latency=LatencyModel(
+            args.first_token, args.first_token_jitter,
+            args.tokens_per_second, args.tokens_per_second_jitter,
+            args.distribution
+        ),
+        host=args.host,
+        port=args.port
+    )
+    print(f"Fake LLM server em {server.url} (KALLISTA_LLM_BASE_URL={server.url})")
+    server.serve_forever()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# core/llm/llm_factory.py
+from typing import Dict, Any
+import os
+
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
+
+# Modos do cache de respostas:
+#   'on'     - consulta o cache e grava respostas novas (padrão)
+#   'off'    - sempre chama o modelo
+#   'replay' - serve apenas do cache, sem acesso à rede
+CACHE_MODES = ('on', 'off', 'replay')
+
+# Provedores: 'openai' (padrão) ou 'local' (LocalChatModel, sem rede)
+PROVIDERS = ('openai', 'local')
+
+# Coalescência compartilhada por todos os LLMs do processo, para que crews
+# diferentes com o mesmo prompt simultâneo façam uma única chamada
+_shared_single_flight = SingleFlight()
+
+def load_llm_config(config: Dict = None) -> Dict[str, Any]:
+    """Combina configuração explícita com variáveis de ambiente"""
+    config = dict(config or {})
+    config.setdefault('provider', os.getenv('KALLISTA_LLM_PROVIDER', 'openai').lower())
+    config.setdefault('model', os.getenv('KALLISTA_LLM_MODEL', 'gpt-4'))
+    # Endpoint compatível com a OpenAI (ex.: core.llm.fake_server para benchmarks)
+    config.setdefault('base_url', os.getenv('KALLISTA_LLM_BASE_URL') or None)
+    config.setdefault('cache_mode', os.getenv('KALLISTA_LLM_CACHE', 'on').lower())
+    config.setdefault('cache_dir', os.getenv('KALLISTA_LLM_CACHE_DIR', 'cache/llm'))
+    config.setdefault(
+        'cache_max_size',
+        int(os.getenv('KALLISTA_LLM_CACHE_MAX_SIZE', 200 * 1024 * 1024))
+    )
+    config.setdefault('coalesce', os.getenv('KALLISTA_LLM_COALESCE', '1') != '0')
+    # Streaming de tokens: arquivos emitidos são gravados durante a geração
+    config.setdefault('streaming', os.getenv('KALLISTA_LLM_STREAMING', '1') != '0')
+    config.setdefault('local_latency', float(os.getenv('KALLISTA_LOCAL_LLM_LATENCY', 0.5)))
+
+    if config['provider'] not in PROVIDERS:
+        raise ValueError(
+            f"Provedor de LLM inválido: {config['provider']} (use {', '.join(PROVIDERS)})"
+        )
+
+    if config['cache_mode'] not in CACHE_MODES:
+        raise ValueError(
+            f"Modo de cache inválido: {config['cache_mode']} (use {', '.join(CACHE_MODES)})"
+        )
+    return config
+
+def create_llm(config: Dict = None) -> Any:
+    """Cria o LLM usado pelos agentes, envolvido pelo cache de respostas"""
+    # LangChain é importado apenas quando um LLM é efetivamente criado
+    from .cached_llm import CachedChatModel
+    from .metrics_callback import LLMMetricsCallback
+    from .stream_callback import TokenStreamCallback
+
+    config = load_llm_config(config)
+    replay = config['cache_mode'] == 'replay'
+
+    if config['provider'] == 'local':
+        from .local_llm import LocalChatModel
+        llm = LocalChatModel(model_name=config['model'], latency=config['local_latency'])
+    else:
+        from langchain_openai import ChatOpenAI
+        llm_kwargs = {
+            'model': config['model'],
+            # No modo replay nenhuma requisição é enviada; a chave é apenas um marcador
+            'openai_api_key': os.getenv("OPENAI_API_KEY") or ('replay' if replay else None)
+        }
+        if config['base_url']:
+            llm_kwargs['base_url'] = config['base_url']
+            llm_kwargs['openai_api_key'] = llm_kwargs['openai_api_key'] or 'local'
+        if 'temperature' in config:
+            llm_kwargs['temperature'] = config['temperature']
+        if config['streaming']:
+            llm_kwargs['streaming'] = True
+        llm = ChatOpenAI(**llm_kwargs)
+
+    if config['cache_mode'] != 'off' or config['coalesce']:
+        cache = None
+        if config['cache_mode'] != 'off':
+            cache = ResponseCache({
+                'cache_dir': config['cache_dir'],
+                'max_size': config['cache_max_size']
+            })
+        llm = CachedChatModel(
+            llm=llm,
+            response_cache=cache,
+            single_flight=config.get('single_flight') or (
+                _shared_single_flight if config['coalesce'] else None
+            ),
+            replay=replay
+        )
+
+    # Métricas no modelo externo: acertos de cache também são registrados.
+    # Os tokens do modelo interno chegam pelo run manager do externo.
+    llm.callbacks = [*(llm.callbacks or []), LLMMetricsCallback(), TokenStreamCallback()]
+    return llm
+
+def get_llm_metrics() -> dict:
+    """Métricas de todas as chamadas ao LLM do processo"""
+    from .llm_metrics import process_metrics
+    return process_metrics.snapshot()
+
+def get_coalescing_stats() -> dict:
+    """Contadores da coalescência compartilhada (executadas/coalescidas)"""
+    return dict(_shared_single_flight.stats)
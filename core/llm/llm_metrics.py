@@ -0,0 +1,176 @@
+# core/llm/llm_metrics.py
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+
+# Limites superiores (segundos) dos buckets dos histogramas de latência
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Limites superiores (tokens) dos buckets dos histogramas de tokens
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+_current_scope: ContextVar[Optional[Tuple['LLMMetrics', Dict[str, str]]]] = \
+    ContextVar('llm_metrics_scope', default=None)
+
+class Histogram:
+    """Histograma cumulativo por buckets fixos"""
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self.bounds) if value <= bound), len(self.bounds))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}" for bound in self.bounds] + ['+inf']
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min,
+            'max': self.max,
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+class _CallStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        # Respostas do cache: tokens registrados na gravação, não gastos agora
+        self.cached_calls = 0
+        self.cached_prompt_tokens = 0
+        self.cached_completion_tokens = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.time_to_first_token = Histogram(LATENCY_BUCKETS)
+        self.prompt_token_histogram = Histogram(TOKEN_BUCKETS)
+        self.completion_token_histogram = Histogram(TOKEN_BUCKETS)
+
+    def add(self, prompt_tokens: int, completion_tokens: int,
+            time_to_first_token: float, latency: float, error: bool,
+            cached: bool = False) -> None:
+        self.calls += 1
+        self.latency.observe(latency)
+        if error:
+            self.errors += 1
+            return
+        if cached:
+            self.cached_calls += 1
+            self.cached_prompt_tokens += prompt_tokens
+            self.cached_completion_tokens += completion_tokens
+            return
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.time_to_first_token.observe(time_to_first_token)
+        self.prompt_token_histogram.observe(prompt_tokens)
+        self.completion_token_histogram.observe(completion_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'cached_calls': self.cached_calls,
+            'cached_prompt_tokens': self.cached_prompt_tokens,
+            'cached_completion_tokens': self.cached_completion_tokens,
+            'latency': self.latency.to_dict(),
+            'time_to_first_token': self.time_to_first_token.to_dict(),
+            'prompt_token_histogram': self.prompt_token_histogram.to_dict(),
+            'completion_token_histogram': self.completion_token_histogram.to_dict()
+        }
+
+class LLMMetrics:
+    """Métricas das chamadas ao LLM agregadas por agente e por tarefa.
+
+    As chamadas feitas dentro de `scope(agent=..., task=...)` são
+    registradas neste coletor com esses rótulos (ver `LLMMetricsCallback`).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _CallStats] = {}
+
+    @contextmanager
+    def scope(self, **labels: str) -> Iterator['LLMMetrics']:
+        """Atribui as chamadas ao LLM do contexto atual a este coletor"""
+        token = _current_scope.set((self, labels))
+        try:
+            yield self
+        finally:
+            _current_scope.reset(token)
+
+    def record(self, labels: Dict[str, str], prompt_tokens: int = 0, completion_tokens: int = 0,
+               time_to_first_token: Optional[float] = None, latency: float = 0.0,
+               error: bool = False, cached: bool = False) -> None:
+        key = (labels.get('agent', 'unknown'), labels.get('task', 'unknown'))
+        with self.lock:
+            stats = self._stats.setdefault(key, _CallStats())
+            stats.add(
+                prompt_tokens, completion_tokens,
+                latency if time_to_first_token is None else time_to_first_token,
+                latency, error, cached
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Totais e histogramas por agente e por tarefa"""
+        with self.lock:
+            entries = list(self._stats.items())
+
+        by_agent: Dict[str, List[_CallStats]] = {}
+        by_task: Dict[str, List[_CallStats]] = {}
+        for (agent, task), stats in entries:
+            by_agent.setdefault(agent, []).append(stats)
+            by_task.setdefault(task, []).append(stats)
+
+        return {
+            'total': self._merge([stats for _, stats in entries]),
+            'by_agent': {agent: self._merge(stats) for agent, stats in by_agent.items()},
+            'by_task': {task: self._merge(stats) for task, stats in by_task.items()}
+        }
+
+    def reset(self) -> None:
+        with self.lock:
+            self._stats.clear()
+
+    @staticmethod
+    def _merge(group: List[_CallStats]) -> Dict[str, Any]:
+        merged = _CallStats()
+        for stats in group:
+            merged.calls += stats.calls
+            merged.errors += stats.errors
+            merged.prompt_tokens += stats.prompt_tokens
+            merged.completion_tokens += stats.completion_tokens
+            merged.cached_calls += stats.cached_calls
+            merged.cached_prompt_tokens += stats.cached_prompt_tokens
+            merged.cached_completion_tokens += stats.cached_completion_tokens
+            for name in ('latency', 'time_to_first_token',
+                         'prompt_token_histogram', 'completion_token_histogram'):
+                target, source = getattr(merged, name), getattr(stats, name)
+                target.counts = [a + b for a, b in zip(target.counts, source.counts)]
+                target.count += source.count
+                target.total += source.total
+                for attr, pick in (('min', min), ('max', max)):
+                    values = [v for v in (getattr(target, attr), getattr(source, attr)) if v is not None]
+                    setattr(target, attr, pick(values) if values else None)
+        return merged.to_dict()
+
+# Coletor do processo inteiro (todas as chamadas, com ou sem escopo)
+process_metrics = LLMMetrics()
+
+def current_scope() -> Tuple[Optional[LLMMetrics], Dict[str, str]]:
+    """Coletor e rótulos do escopo ativo"""
+    scope = _current_scope.get()
+    return scope if scope is not None else (None, {})
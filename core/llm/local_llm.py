@@ -0,0 +1,99 @@
+# core/llm/local_llm.py
+from typing import Dict, List, Any, Optional
+import asyncio
+import hashlib
+import random
+import re
+import threading
+import time
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatResult, ChatGeneration
+
+_calls_lock = threading.Lock()
+
+class LocalChatModel(BaseChatModel):
+    """LLM local para testes e benchmarks offline.
+
+    Responde com texto roteirizado (`responses`, por substring do prompt) ou
+    com uma resposta determinística derivada do prompt, após uma latência
+    configurável (`latency` ± `jitter`, em segundos). A resposta é
+    repassada token a token aos callbacks (`on_llm_new_token`), com
+    `token_delay` segundos entre tokens, como um modelo em streaming.
+    """
+
+    model_name: str = 'local-stand-in'
+    latency: float = 0.5
+    jitter: float = 0.0
+    token_delay: float = 0.0
+    responses: Dict[str, str] = {}
+    default_response: Optional[str] = None
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return 'local-stand-in'
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {'model_name': self.model_name}
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self._next_latency())
+        result = self._respond(messages)
+        if run_manager is not None:
+            for token in self._tokens(result):
+                run_manager.on_llm_new_token(token)
+                if self.token_delay:
+                    time.sleep(self.token_delay)
+        return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self._next_latency())
+        result = self._respond(messages)
+        if run_manager is not None:
+            for token in self._tokens(result):
+                await run_manager.on_llm_new_token(token)
+                if self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+        return result
+
+    @staticmethod
+    def _tokens(result: ChatResult) -> List[str]:
+        """Resposta dividida em tokens (palavras com o espaço seguinte)"""
+        return re.findall(r'\S+\s*|\s+', result.generations[0].message.content)
+
+    def _next_latency(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(0.0, random.uniform(self.latency - self.jitter, self.latency + self.jitter))
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        with _calls_lock:
+            self.calls += 1
+
+        prompt = '\n'.join(str(message.content) for message in messages)
+        text = self._scripted_response(prompt)
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=text))],
+            llm_output={
+                'model_name': self.model_name,
+                'token_usage': {
+                    'prompt_tokens': len(prompt.split()),
+                    'completion_tokens': len(text.split()),
+                    'total_tokens': len(prompt.split()) + len(text.split())
+                }
+            }
+        )
+
+    def _scripted_response(self, prompt: str) -> str:
+        for trigger, response in self.responses.items():
+            if trigger in prompt:
+                return response
+        if self.default_response is not None:
+            return self.default_response
+
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+        return f"Final Answer: local response {digest}"
@@ -0,0 +1,90 @@
+# core/llm/metrics_callback.py
+from typing import Dict, List, Any, Optional, Tuple
+from uuid import UUID
+import threading
+import time
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from .llm_metrics import current_scope, process_metrics
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """Registra latência, tempo até o primeiro token e tokens de cada chamada.
+
+    As chamadas são atribuídas ao escopo ativo (`LLMMetrics.scope`) no
+    momento em que começam, e sempre também a `process_metrics`. Respostas
+    servidas do cache (`llm_output['cached']`) têm seus tokens contados à
+    parte, como não gastos.
+    """
+
+    # Executa na thread/contexto da chamada para enxergar o escopo ativo
+    run_inline = True
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *,
+                            run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *,
+                     run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self.lock:
+            run = self._runs.get(run_id)
+            if run is not None and run['first_token'] is None:
+                run['first_token'] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._finish(run_id)
+        if run is not None:
+            prompt_tokens, completion_tokens = self._token_usage(response)
+            self._record(run, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                         cached=bool((response.llm_output or {}).get('cached')))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._finish(run_id)
+        if run is not None:
+            self._record(run, error=True)
+
+    def _start(self, run_id: UUID) -> None:
+        collector, labels = current_scope()
+        with self.lock:
+            self._runs[run_id] = {
+                'start': time.perf_counter(),
+                'first_token': None,
+                'collector': collector,
+                'labels': dict(labels)
+            }
+
+    def _finish(self, run_id: UUID) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            run = self._runs.pop(run_id, None)
+        if run is not None:
+            run['end'] = time.perf_counter()
+        return run
+
+    def _record(self, run: Dict[str, Any], **values: Any) -> None:
+        values['latency'] = run['end'] - run['start']
+        if run['first_token'] is not None:
+            values['time_to_first_token'] = run['first_token'] - run['start']
+        for collector in (run['collector'], process_metrics):
+            if collector is not None:
+                collector.record(run['labels'], **values)
+
+    @staticmethod
+    def _token_usage(response: LLMResult) -> Tuple[int, int]:
+        usage = (response.llm_output or {}).get('token_usage') or {}
+        if usage:
+            return usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0)
+
+        prompt_tokens = completion_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                metadata = getattr(getattr(generation, 'message', None), 'usage_metadata', None) or {}
+                prompt_tokens += metadata.get('input_tokens', 0)
+                completion_tokens += metadata.get('output_tokens', 0)
+        return prompt_tokens, completion_tokens
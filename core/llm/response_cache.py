@@ -0,0 +1,161 @@
+# core/llm/response_cache.py
+from typing import Dict, Any, Optional
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+class ReplayCacheMiss(KeyError):
+    """Requisição sem resposta em cache durante o modo replay"""
+
+class ResponseCache:
+    """Cache em disco, endereçado por conteúdo, de respostas de LLM.
+
+    Cada resposta é gravada em `<cache_dir>/<hh>/<hash>.json`, onde o hash é
+    calculado sobre modelo, prompt, ferramentas e temperatura. O tamanho total
+    é limitado por `max_size` (bytes); ao exceder, as entradas acessadas há
+    mais tempo são descartadas (LRU pelo mtime do arquivo).
+    """
+
+    def __init__(self, config: Dict = None):
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.config.setdefault('cache_dir', 'cache/llm')
+        self.config.setdefault('max_size', 200 * 1024 * 1024)  # 200MB
+        self.config.setdefault('max_entries', 10000)
+
+        self.cache_dir = Path(self.config['cache_dir'])
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0
+        }
+
+        # Índice em memória: chave -> (tamanho, último acesso)
+        self._index: Dict[str, list] = {}
+        self._total_size = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(model: str, prompt: Any, tools: Any = None,
+                 temperature: Optional[float] = None, **extra: Any) -> str:
+        """Gera chave de conteúdo para uma requisição ao LLM"""
+        payload = json.dumps(
+            {
+                'model': model,
+                'prompt': prompt,
+                'tools': tools,
+                'temperature': temperature,
+                'extra': extra
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Obtém resposta em cache"""
+        path = self._entry_path(key)
+        with self.lock:
+            if key not in self._index:
+                self.stats['misses'] += 1
+                return None
+
+            try:
+                with open(path, encoding='utf-8') as f:
+                    value = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Discarding unreadable cache entry {key}: {str(e)}")
+                self._remove(key)
+                self.stats['misses'] += 1
+                return None
+
+            now = time.time()
+            self._index[key][1] = now
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self.stats['hits'] += 1
+            return value
+
+    def put(self, key: str, value: Dict) -> None:
+        """Armazena resposta e aplica a política de descarte"""
+        path = self._entry_path(key)
+        data = json.dumps(value, default=str).encode('utf-8')
+
+        with self.lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            if key in self._index:
+                self._total_size -= self._index[key][0]
+            self._index[key] = [len(data), time.time()]
+            self._total_size += len(data)
+            self.stats['writes'] += 1
+            self._evict()
+
+    def contains(self, key: str) -> bool:
+        """Verifica se há resposta em cache para a chave"""
+        with self.lock:
+            return key in self._index
+
+    def clear(self) -> None:
+        """Remove todas as respostas em cache"""
+        with self.lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    @property
+    def size(self) -> int:
+        """Tamanho total (bytes) das respostas em cache"""
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Reconstrói o índice a partir dos arquivos em disco"""
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            self._index[path.stem] = [stat.st_size, stat.st_mtime]
+            self._total_size += stat.st_size
+
+        with self.lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Descarta entradas menos usadas até respeitar os limites"""
+        if (self._total_size <= self.config['max_size']
+                and len(self._index) <= self.config['max_entries']):
+            return
+
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if (self._total_size <= self.config['max_size']
+                    and len(self._index) <= self.config['max_entries']):
+                break
+            self._remove(key)
+            self.stats['evictions'] += 1
+
+    def _remove(self, key: str) -> None:
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_size -= size
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
@@ -0,0 +1,149 @@
+# core/llm/single_flight.py
+from typing import Dict, Any, Callable, Awaitable, Optional, Tuple
+import asyncio
+import threading
+
+class _Call:
+    """Chamada em andamento compartilhada pelos requisitantes da mesma chave"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+class _AsyncCall:
+    """Chamada assíncrona em andamento e quantos seguidores a aguardam"""
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+        self.task: Optional[asyncio.Task] = None
+
+class SingleFlight:
+    """Coalesce requisições concorrentes idênticas em uma única execução.
+
+    Enquanto a chamada de uma chave está em andamento, novos requisitantes da
+    mesma chave aguardam e recebem o mesmo resultado (ou a mesma exceção).
+    Suporta chamadas síncronas (threads) e assíncronas (por event loop).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[Tuple[int, str], _AsyncCall] = {}
+        self.stats = {
+            'executed': 0,
+            'coalesced': 0
+        }
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Executa `fn` uma única vez por chave entre chamadas concorrentes"""
+        with self.lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.stats['coalesced'] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.stats['executed'] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Versão assíncrona de `do`, coalescendo chamadas no mesmo event loop.
+
+        Se o requisitante que executa a chamada for cancelado (ex.: o
+        cliente desconectou) e houver seguidores aguardando, `fn` é
+        reexecutada em uma task para eles, em vez de cancelar todos.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        with self.lock:
+            call = self._async_calls.get(flight_key)
+            if call is not None:
+                self.stats['coalesced'] += 1
+                call.waiters += 1
+                leader = False
+            else:
+                call = _AsyncCall(loop.create_future())
+                self._async_calls[flight_key] = call
+                self.stats['executed'] += 1
+                leader = True
+
+        if not leader:
+            try:
+                return await asyncio.shield(call.future)
+            finally:
+                with self.lock:
+                    call.waiters -= 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            with self.lock:
+                handed_over = call.waiters > 0
+                if handed_over:
+                    self.stats['executed'] += 1
+            if handed_over:
+                call.task = loop.create_task(self._complete(flight_key, call, fn))
+            else:
+                self._release(flight_key)
+                call.future.cancel()
+            raise
+        except BaseException as e:
+            self._release(flight_key)
+            self._set_exception(call.future, e)
+            raise
+        else:
+            self._release(flight_key)
+            call.future.set_result(result)
+            return result
+
+    async def _complete(self, flight_key: Tuple[int, str], call: _AsyncCall,
+                        fn: Callable[[], Awaitable[Any]]) -> None:
+        """Executa `fn` para os seguidores de um requisitante cancelado"""
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._set_exception(call.future, e)
+        else:
+            call.future.set_result(result)
+        finally:
+            self._release(flight_key)
+
+    def _release(self, flight_key: Tuple[int, str]) -> None:
+        with self.lock:
+            self._async_calls.pop(flight_key, None)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, error: BaseException) -> None:
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+            return
+        future.set_exception(error)
+        # Evita aviso de exceção não recuperada quando não há seguidores
+        future.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Quantidade de chamadas em andamento"""
+        with self.lock:
+            return len(self._calls) + len(self._async_calls)
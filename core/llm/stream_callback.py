@@ -0,0 +1,79 @@
+# core/llm/stream_callback.py
+from typing import Dict, List, Any, Iterator, Optional, Protocol, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import UUID
+import threading
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+class TokenSink(Protocol):
+    """Destino dos tokens (ex.: `StreamingProjectWriter`)"""
+
+    def feed(self, source: str, chunk: str) -> Any: ...
+
+    def finish(self, source: str) -> Any: ...
+
+# Destino e origem dos tokens das chamadas feitas no contexto atual
+_current_stream: ContextVar[Optional[Tuple[TokenSink, str]]] = \
+    ContextVar('llm_token_stream', default=None)
+
+@contextmanager
+def stream_tokens(sink: TokenSink, source: str) -> Iterator[None]:
+    """Envia a `sink` os tokens das chamadas ao LLM feitas neste contexto"""
+    token = _current_stream.set((sink, source))
+    try:
+        yield
+    finally:
+        _current_stream.reset(token)
+
+class TokenStreamCallback(BaseCallbackHandler):
+    """Repassa os tokens gerados ao destino ativo (`stream_tokens`).
+
+    O destino é capturado quando a chamada começa, como o escopo das
+    métricas; tokens de chamadas fora de um `stream_tokens` são ignorados.
+    Ao final de cada chamada o destino é encerrado para a origem, de modo
+    que um bloco truncado não se misture à resposta seguinte.
+    """
+
+    # Executa na thread/contexto da chamada para enxergar o destino ativo
+    run_inline = True
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._runs: Dict[UUID, Tuple[TokenSink, str]] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *,
+                            run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *,
+                     run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self.lock:
+            stream = self._runs.get(run_id)
+        if stream is not None and token:
+            sink, source = stream
+            sink.feed(source, token)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def _start(self, run_id: UUID) -> None:
+        stream = _current_stream.get()
+        if stream is not None:
+            with self.lock:
+                self._runs[run_id] = stream
+
+    def _finish(self, run_id: UUID) -> None:
+        with self.lock:
+            stream = self._runs.pop(run_id, None)
+        if stream is not None:
+            sink, source = stream
+            sink.feed(source, '\n')
+            sink.finish(source)
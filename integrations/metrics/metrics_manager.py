@@ -1,14 +1,17 @@
 # integrations/metrics/metrics_manager.py
-from typing import Dict, List, Optional, Union, Any
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
 from enum import Enum
 import asyncio
 import logging
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
-import pandas as pd
-import numpy as np
-from sklearn import metrics
+
+# numpy/pandas são carregados apenas quando a análise de métricas é executada
+if TYPE_CHECKING:
+    import pandas as pd
 
 class MetricType(Enum):
     PERFORMANCE = "performance"
@@ -171,6 +174,8 @@ class MetricsManager:
 
     def _process_performance_metrics(self, data: Dict) -> Dict:
         """Processa métricas de performance"""
+        import numpy as np
+
         return {
             'response_time': np.mean(data.get('response_times', [])),
             'error_rate': len(data.get('errors', [])) / len(data.get('requests', [])),
@@ -200,6 +205,8 @@ class MetricsManager:
 
     def _process_productivity_metrics(self, data: Dict) -> Dict:
         """Processa métricas de produtividade"""
+        import numpy as np
+
         return {
             'commits': len(data.get('commits', [])),
             'pull_requests': len(data.get('pull_requests', [])),
@@ -213,6 +220,8 @@ class MetricsManager:
 
     def _process_deployment_metrics(self, data: Dict) -> Dict:
         """Processa métricas de deployment"""
+        import numpy as np
+
         return {
             'frequency': len(data.get('deployments', [])),
             'success_rate': (
@@ -248,6 +257,8 @@ class MetricsManager:
         params: Optional[Dict] = None
     ) -> Dict:
         """Analisa tendências nas métricas"""
+        import numpy as np
+
         try:
             trends = {}
             
@@ -299,6 +310,8 @@ class MetricsManager:
         params: Optional[Dict] = None
     ) -> Dict:
         """Analisa anomalias nas métricas"""
+        import numpy as np
+
         try:
             anomalies = {}
             
@@ -372,6 +385,8 @@ class MetricsManager:
 
     def _calculate_trend_metrics(self, series: pd.Series) -> Dict:
         """Calcula métricas de tendência"""
+        import numpy as np
+
         try:
             # Calcula inclinação
             x = np.arange(len(series))
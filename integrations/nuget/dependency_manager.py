@@ -7,7 +7,6 @@ from datetime import datetime
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import semver
-import networkx as nx
 
 class DependencyType(Enum):
     DIRECT = "direct"  # Dependência direta
@@ -18,7 +17,15 @@ class DependencyManager:
     def __init__(self, package_manager):
         self.package_manager = package_manager
         self.logger = logging.getLogger(__name__)
-        self.dependency_graph = nx.DiGraph()
+        self._dependency_graph = None
+
+    @property
+    def dependency_graph(self):
+        """Grafo de dependências (networkx é carregado no primeiro uso)"""
+        if self._dependency_graph is None:
+            import networkx as nx
+            self._dependency_graph = nx.DiGraph()
+        return self._dependency_graph
 
     async def resolve_dependencies(
         self,
@@ -241,6 +248,8 @@ class DependencyManager:
 
     def _generate_installation_plan(self) -> List[Dict]:
         """Gera plano de instalação baseado em dependências"""
+        import networkx as nx
+
         # Ordena nós topologicamente
         try:
             ordered_nodes = list(nx.topological_sort(self.dependency_graph))
@@ -3,9 +3,10 @@ from typing import Dict, List, Optional, Union, Any
 from enum import Enum
 import logging
 from pathlib import Path
-import jinja2
 import json
 
+from tools.code.template_registry import get_environment
+
 class CodeTemplateType(Enum):
     VIEW = "view"
     VIEW_MODEL = "viewmodel"
@@ -21,8 +22,9 @@ class CodeGenerator:
         self.templates_path = Path(config.get('templates_path', 'templates/code'))
         self.templates_path.mkdir(parents=True, exist_ok=True)
         
-        self.jinja_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(self.templates_path)),
+        # Environment compartilhado (bytecode em disco e LRU de templates compilados)
+        self.jinja_env = get_environment(
+            str(self.templates_path),
             trim_blocks=True,
             lstrip_blocks=True
         )
@@ -2,13 +2,16 @@
 from typing import Dict, List
 from pathlib import Path
 import json
+from tools.wpf.virtual_fs import LocalFileSystem
 
 class VSCodeGenerator:
-    def __init__(self):
+    def __init__(self, fs=None):
+        # Destino dos arquivos: disco (padrão) ou um VirtualFileSystem
+        self.fs = fs if fs is not None else LocalFileSystem()
         self.snippets_path = Path("Snippets")
-        self.snippets_path.mkdir(exist_ok=True)
+        self.fs.mkdir(self.snippets_path)
         self.item_templates_path = Path("ItemTemplates")
-        self.item_templates_path.mkdir(exist_ok=True)
+        self.fs.mkdir(self.item_templates_path)
 
     def generate_code_snippet(self, config: Dict) -> str:
         """Gera snippet de código"""
@@ -78,13 +81,12 @@ class VSCodeGenerator:
     def save_snippet(self, name: str, content: str):
         """Salva snippet em arquivo"""
         snippet_file = self.snippets_path / f"{name}.snippet"
-        snippet_file.write_text(content)
+        self.fs.write_text(snippet_file, content)
 
     def save_item_template(self, name: str, templates: Dict[str, str]):
         """Salva template de item em arquivos"""
         template_dir = self.item_templates_path / name
-        template_dir.mkdir(exist_ok=True)
+        self.fs.mkdir(template_dir)
         
         for filename, content in templates.items():
-            file_path = template_dir / filename
-            file_path.write_text(content)
\ No newline at end of file
+            self.fs.write_text(template_dir / filename, content)
\ No newline at end of file
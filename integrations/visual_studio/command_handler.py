@@ -1,11 +1,14 @@
 # integrations/visual_studio/command_handler.py
 from typing import Dict, List, Any
 from pathlib import Path
+from tools.wpf.virtual_fs import LocalFileSystem
 
 class VSCommandHandler:
-    def __init__(self):
+    def __init__(self, fs=None):
+        # Destino dos arquivos: disco (padrão) ou um VirtualFileSystem
+        self.fs = fs if fs is not None else LocalFileSystem()
         self.commands_path = Path("Commands")
-        self.commands_path.mkdir(exist_ok=True)
+        self.fs.mkdir(self.commands_path)
 
     def generate_command(self, config: Dict) -> str:
         """Gera código para um comando do Visual Studio"""
@@ -142,4 +145,4 @@ namespace Kallista.Commands
     def save_command(self, name: str, content: str):
         """Salva o comando em arquivo"""
         command_file = self.commands_path / f"{name}Command.cs"
-        command_file.write_text(content)
\ No newline at end of file
+        self.fs.write_text(command_file, content)
\ No newline at end of file
@@ -1,11 +1,14 @@
 # integrations/visual_studio/debugging_support.py
-from typing import Dict
+from typing import Dict, List
 from pathlib import Path
+from tools.wpf.virtual_fs import LocalFileSystem
 
 class VSDebuggingSupport:
-    def __init__(self):
+    def __init__(self, fs=None):
+        # Destino dos arquivos: disco (padrão) ou um VirtualFileSystem
+        self.fs = fs if fs is not None else LocalFileSystem()
         self.visualizers_path = Path("Visualizers")
-        self.visualizers_path.mkdir(exist_ok=True)
+        self.fs.mkdir(self.visualizers_path)
 
     def generate_debugger_visualizer(self, config: Dict) -> str:
         """Gera visualizador de debug personalizado"""
@@ -110,4 +113,4 @@ namespace {config['namespace']}
     def save_visualizer(self, name: str, content: str):
         """Salva visualizador em arquivo"""
         visualizer_file = self.visualizers_path / f"{name}Visualizer.cs"
-        visualizer_file.write_text(content)
\ No newline at end of file
+        self.fs.write_text(visualizer_file, content)
\ No newline at end of file
@@ -2,11 +2,14 @@
 from typing import Dict, List
 from pathlib import Path
 import json
+from tools.wpf.virtual_fs import LocalFileSystem
 
 class VSProjectSystem:
-    def __init__(self):
+    def __init__(self, fs=None):
+        # Destino dos arquivos: disco (padrão) ou um VirtualFileSystem
+        self.fs = fs if fs is not None else LocalFileSystem()
         self.templates_path = Path("ProjectTemplates")
-        self.templates_path.mkdir(exist_ok=True)
+        self.fs.mkdir(self.templates_path)
 
     def generate_project_template(self, config: Dict) -> Dict[str, str]:
         """Gera template de projeto WPF"""
@@ -189,9 +192,7 @@ namespace $safeprojectname$.ViewModels
     def save_templates(self, templates: Dict[str, str], name: str):
         """Salva templates em arquivos"""
         template_dir = self.templates_path / name
-        template_dir.mkdir(exist_ok=True)
+        self.fs.mkdir(template_dir)
         
         for filename, content in templates.items():
-            file_path = template_dir / filename
-            file_path.parent.mkdir(exist_ok=True)
-            file_path.write_text(content)
\ No newline at end of file
+            self.fs.write_text(template_dir / filename, content)
\ No newline at end of file
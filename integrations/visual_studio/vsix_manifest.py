@@ -2,9 +2,12 @@
 from typing import Dict
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from tools.wpf.virtual_fs import LocalFileSystem
 
 class VSIXManifestGenerator:
-    def __init__(self):
+    def __init__(self, fs=None):
+        # Destino dos arquivos: disco (padrão) ou um VirtualFileSystem
+        self.fs = fs if fs is not None else LocalFileSystem()
         self.manifest_path = Path("source.extension.vsixmanifest")
 
     def generate_manifest(self, config: Dict) -> str:
@@ -60,4 +63,4 @@ class VSIXManifestGenerator:
 
     def save_manifest(self, content: str):
         """Salva o manifesto em arquivo"""
-        self.manifest_path.write_text(content)
\ No newline at end of file
+        self.fs.write_text(self.manifest_path, content)
\ No newline at end of file
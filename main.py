@@ -1,11 +1,12 @@
-from crewai import Agent, Task, Crew
+from crewai import Agent, Task
 from dotenv import load_dotenv
 import os
 from typing import Dict, List
 import asyncio
 
 
-from langchain_openai import ChatOpenAI
+from core.llm.llm_factory import create_llm
+from tasks.task_graph import TaskGraph
 
 # Importa os agentes
 from agents.core.architect_agent  import ArchitectAgent
@@ -28,45 +29,34 @@ def create_agents(llm):
         'api': ApiAgent(llm)
     }
 
-def create_tasks(agents: Dict[str, Agent]) -> List[Task]:
-    """Cria as tarefas para os agentes"""
-    return [
-        Task(
-            description="Setup Project Architecture",
-            agent=agents['architect'],
-            expected_output="Project structure and patterns definition"
-        ),
-        Task(
-            description="Design WPF Interface",
-            agent=agents['wpf'],
-            expected_output="WPF interface implementation"
-        )
-        # Adicionar mais tarefas conforme necessário
-    ]
+def create_tasks(agents: Dict[str, Agent]) -> TaskGraph:
+    """Cria as tarefas para os agentes e suas dependências"""
+    graph = TaskGraph()
+    graph.add('architecture', Task(
+        description="Setup Project Architecture",
+        agent=agents['architect'],
+        expected_output="Project structure and patterns definition"
+    ))
+    graph.add('wpf', Task(
+        description="Design WPF Interface",
+        agent=agents['wpf'],
+        expected_output="WPF interface implementation"
+    ), depends_on=['architecture'])
+    # Adicionar mais tarefas conforme necessário
+    return graph
 
 def main():
-    # Configurar LLM
-    llm = ChatOpenAI(
-        model="gpt-4",
-        openai_api_key=os.getenv("OPENAI_API_KEY")
-    )
+    # Configurar LLM (com cache de respostas; KALLISTA_LLM_CACHE=replay para rodar offline)
+    llm = create_llm()
 
     # Criar agentes
     agents = create_agents(llm)
 
     # Criar tarefas
-    tasks = create_tasks(agents)
+    task_graph = create_tasks(agents)
 
-    # Criar crew
-    crew = Crew(
-        agents=list(agents.values()),
-        tasks=tasks
-    )
-    
-  
-
-    # Executar
-    result = crew.kickoff()
+    # Executar (tarefas independentes em paralelo, até 4 por vez)
+    result = asyncio.run(task_graph.run(max_concurrency=4))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,124 @@
+# tasks/task_graph.py
+from typing import Dict, List, Any, Optional, Callable, ContextManager
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+import asyncio
+import time
+
+def kickoff_task(task: Any) -> Any:
+    """Executa uma única tarefa do CrewAI em um crew próprio"""
+    from crewai import Crew
+    return Crew(agents=[task.agent], tasks=[task]).kickoff()
+
+class TaskGraphError(RuntimeError):
+    """Uma ou mais tarefas do grafo falharam"""
+
+    def __init__(self, errors: Dict[str, BaseException]):
+        self.errors = errors
+        details = '; '.join(f"{name}: {str(error)}" for name, error in errors.items())
+        super().__init__(f"Falha nas tarefas: {details}")
+
+@dataclass
+class TaskGraphResult:
+    """Saídas e tempos de uma execução do grafo"""
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+    critical_path_time: float = 0.0
+
+    def __str__(self) -> str:
+        return '\n\n'.join(str(output) for output in self.outputs.values())
+
+class TaskGraph:
+    """Tarefas com dependências declaradas.
+
+    Tarefas independentes executam em paralelo (limitadas por
+    `max_concurrency`); uma tarefa só inicia após todas as suas dependências,
+    cujas saídas recebe como contexto (`task.context` no CrewAI). O tempo total
+    tende ao caminho crítico em vez da soma das latências.
+    """
+
+    def __init__(self, runner: Callable[[Any], Any] = kickoff_task):
+        self.runner = runner
+        self.tasks: Dict[str, Any] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+
+    def add(self, name: str, task: Any, depends_on: Optional[List[str]] = None) -> Any:
+        """Adiciona uma tarefa; as dependências devem ter sido adicionadas antes"""
+        if name in self.tasks:
+            raise ValueError(f"Tarefa duplicada: {name}")
+        depends_on = list(depends_on or [])
+        missing = [dependency for dependency in depends_on if dependency not in self.tasks]
+        if missing:
+            raise ValueError(f"Dependências desconhecidas para {name}: {missing}")
+
+        if depends_on and hasattr(task, 'context'):
+            task.context = [self.tasks[dependency] for dependency in depends_on]
+        self.tasks[name] = task
+        self.dependencies[name] = depends_on
+        return task
+
+    def task_list(self) -> List[Any]:
+        """Tarefas em ordem topológica (ordem de inserção)"""
+        return list(self.tasks.values())
+
+    def levels(self) -> List[List[str]]:
+        """Agrupa as tarefas em níveis que podem executar em paralelo"""
+        depth: Dict[str, int] = {}
+        for name, dependencies in self.dependencies.items():
+            depth[name] = max((depth[dependency] + 1 for dependency in dependencies), default=0)
+
+        levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name, level in depth.items():
+            levels[level].append(name)
+        return levels
+
+    async def run(self, executor: Optional[Executor] = None,
+                  max_concurrency: Optional[int] = None,
+                  task_scope: Optional[Callable[[str, Any], ContextManager]] = None) -> TaskGraphResult:
+        """Executa o grafo; as chamadas bloqueantes rodam no `executor`.
+
+        `task_scope(name, task)`, se informado, envolve a execução de cada
+        tarefa na thread do executor (ex.: escopo de métricas).
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(self.tasks), 1))
+        result = TaskGraphResult()
+        finished_at: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        async def run_task(name: str) -> Any:
+            if self.dependencies[name]:
+                await asyncio.gather(*(futures[dependency] for dependency in self.dependencies[name]))
+            async with semaphore:
+                task_start = time.perf_counter()
+                output = await loop.run_in_executor(executor, self._run_task, name, task_scope)
+                result.timings[name] = time.perf_counter() - task_start
+            finished_at[name] = result.timings[name] + max(
+                (finished_at[dependency] for dependency in self.dependencies[name]), default=0.0
+            )
+            return output
+
+        futures: Dict[str, asyncio.Future] = {}
+        for name in self.tasks:
+            futures[name] = asyncio.ensure_future(run_task(name))
+        outputs = await asyncio.gather(*futures.values(), return_exceptions=True)
+
+        errors = {}
+        for name, output in zip(futures, outputs):
+            if isinstance(output, BaseException):
+                errors[name] = output
+            else:
+                result.outputs[name] = output
+        if errors:
+            raise TaskGraphError(errors)
+
+        result.wall_time = time.perf_counter() - start
+        result.critical_path_time = max(finished_at.values(), default=0.0)
+        return result
+
+    def _run_task(self, name: str, task_scope: Optional[Callable[[str, Any], ContextManager]]) -> Any:
+        if task_scope is None:
+            return self.runner(self.tasks[name])
+        with task_scope(name, self.tasks[name]):
+            return self.runner(self.tasks[name])
@@ -2,10 +2,14 @@
 from typing import Dict, Any
 from pathlib import Path
 
+from templates.template_store import TemplateStore
+
 class ApiTemplates:
     def __init__(self):
         self.templates_path = Path("templates/api")
         self.templates_path.mkdir(parents=True, exist_ok=True)
+        # load_template servido da memória, revalidado pelo mtime do arquivo
+        self.store = TemplateStore(self.templates_path, '.cs')
 
     def get_controller_template(self, config: Dict[str, Any]) -> str:
         """Gera template para Controller"""
@@ -306,12 +310,8 @@ namespace {config['namespace']}.Validators
 
     def save_template(self, name: str, content: str):
         """Salva um template em arquivo"""
-        template_file = self.templates_path / f"{name}.cs"
-        template_file.write_text(content)
+        self.store.save(name, content)
 
     def load_template(self, name: str) -> str:
         """Carrega um template de arquivo"""
-        template_file = self.templates_path / f"{name}.cs"
-        if template_file.exists():
-            return template_file.read_text()
-        return ""
\ No newline at end of file
+        return self.store.load(name, default="")
\ No newline at end of file
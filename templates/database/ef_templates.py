@@ -2,10 +2,14 @@
 from typing import Dict, Any
 from pathlib import Path
 
+from templates.template_store import TemplateStore
+
 class EntityFrameworkTemplates:
     def __init__(self):
         self.templates_path = Path("templates/database")
         self.templates_path.mkdir(parents=True, exist_ok=True)
+        # load_template servido da memória, revalidado pelo mtime do arquivo
+        self.store = TemplateStore(self.templates_path, '.cs')
 
     def get_db_context_template(self, config: Dict[str, Any]) -> str:
         """Gera template para DbContext"""
@@ -286,12 +290,8 @@ namespace {config['namespace']}.Migrations
 
     def save_template(self, name: str, content: str):
         """Salva um template em arquivo"""
-        template_file = self.templates_path / f"{name}.cs"
-        template_file.write_text(content)
+        self.store.save(name, content)
 
     def load_template(self, name: str) -> str:
         """Carrega um template de arquivo"""
-        template_file = self.templates_path / f"{name}.cs"
-        if template_file.exists():
-            return template_file.read_text()
-        return ""
\ No newline at end of file
+        return self.store.load(name, default="")
\ No newline at end of file
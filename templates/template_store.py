@@ -0,0 +1,62 @@
+# templates/template_store.py
+from typing import Dict, Optional, Tuple
+from pathlib import Path
+import os
+import threading
+
+class TemplateStore:
+    """Templates salvos em disco, servidos de um cache em memória.
+
+    `load` só relê o arquivo quando o mtime ou o tamanho mudam (um `stat`
+    por chamada em vez de abrir e ler o arquivo); `save` grava e já
+    atualiza o cache.
+    """
+
+    def __init__(self, root: Path, suffix: str):
+        self.root = Path(root)
+        self._root = str(self.root)
+        self.suffix = suffix
+        self.lock = threading.Lock()
+        self._cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self.reads = 0
+
+    def path(self, name: str) -> str:
+        return os.path.join(self._root, f"{name}{self.suffix}")
+
+    def load(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Conteúdo do template (`default` se o arquivo não existir)"""
+        template_file = self.path(name)
+        try:
+            stat = os.stat(template_file)
+        except OSError:
+            with self.lock:
+                self._cache.pop(name, None)
+            return default
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            cached = self._cache.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(template_file) as f:
+            content = f.read()
+        with self.lock:
+            self._cache[name] = (signature, content)
+            self.reads += 1
+        return content
+
+    def save(self, name: str, content: str) -> None:
+        template_file = self.path(name)
+        with open(template_file, 'w') as f:
+            f.write(content)
+        stat = os.stat(template_file)
+        with self.lock:
+            self._cache[name] = ((stat.st_mtime_ns, stat.st_size), content)
+
+    def invalidate(self, name: str = None) -> None:
+        with self.lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
@@ -3,10 +3,14 @@ from typing import Dict, Any, List
 from pathlib import Path
 from datetime import datetime
 
+from templates.template_store import TemplateStore
+
 class WpfTemplates:
     def __init__(self):
         self.templates_path = Path("templates/wpf")
         self.templates_path.mkdir(parents=True, exist_ok=True)
+        # load_template servido da memória, revalidado pelo mtime do arquivo
+        self.store = TemplateStore(self.templates_path, '.xaml')
 
     def get_solution_template(self, config: Dict[str, Any]) -> str:
         """Gera template para arquivo .sln"""
@@ -250,12 +254,8 @@ class WpfTemplates:
 
     def save_template(self, name: str, content: str):
         """Salva um template em arquivo"""
-        template_file = self.templates_path / f"{name}.xaml"
-        template_file.write_text(content)
+        self.store.save(name, content)
 
     def load_template(self, name: str) -> str:
         """Carrega um template de arquivo"""
-        template_file = self.templates_path / f"{name}.xaml"
-        if template_file.exists():
-            return template_file.read_text()
-        return ""
\ No newline at end of file
+        return self.store.load(name, default="")
\ No newline at end of file
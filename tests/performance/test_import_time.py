@@ -0,0 +1,60 @@
+# tests/performance/test_import_time.py
+import unittest
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Dependências pesadas que não devem ser carregadas na inicialização do CLI
+HEAVY_MODULES = [
+    'crewai', 'langchain', 'langchain_core', 'langchain_openai', 'openai',
+    'pandas', 'numpy', 'sklearn', 'networkx', 'prompt_toolkit'
+]
+
+# Orçamento (em microssegundos) para `import cli.command_handler`
+IMPORT_BUDGET_US = 300_000
+
+class TestImportTime(unittest.TestCase):
+    def _run_importtime(self, code: str):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        imports = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(cumulative)
+        return imports, result.stdout
+
+    def test_cli_import_skips_heavy_dependencies(self):
+        """Testa que o CLI não importa dependências pesadas na inicialização"""
+        imports, _ = self._run_importtime('import cli.command_handler')
+        loaded = sorted(
+            name for name in imports
+            if name.split('.')[0] in HEAVY_MODULES
+        )
+        self.assertEqual(loaded, [])
+
+    def test_cli_import_budget(self):
+        """Testa o orçamento de tempo de importação do CLI"""
+        imports, _ = self._run_importtime('import cli.command_handler')
+        self.assertLess(imports['cli.command_handler'], IMPORT_BUDGET_US)
+
+    def test_help_without_heavy_dependencies(self):
+        """Testa que `help` é atendido sem carregar agentes ou LLM"""
+        imports, output = self._run_importtime(
+            'from cli.command_handler import ProjectCLI; ProjectCLI().show_help([])'
+        )
+        self.assertIn('Comandos disponíveis', output)
+        self.assertFalse(any(name.split('.')[0] in HEAVY_MODULES for name in imports))
+
+if __name__ == '__main__':
+    unittest.main()
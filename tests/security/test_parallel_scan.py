@@ -0,0 +1,134 @@
+# tests/security/test_parallel_scan.py
+import unittest
+import asyncio
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.security.compliance_checker import ComplianceChecker
+from tools.security.parallel_scan import ParallelScanner
+from tools.security.vulnerability_scanner import VulnerabilityScanner
+
+def rule_results(project_path, rule):
+    """Verificação original: uma varredura e uma leitura por regra"""
+    results = []
+    for file_path in project_path.rglob('*'):
+        if 'file_types' in rule and file_path.suffix not in rule['file_types']:
+            continue
+        try:
+            content = file_path.read_text()
+        except Exception:
+            continue
+        lines = content.splitlines()
+        violations = []
+        for pattern in rule['patterns']:
+            for match in re.finditer(pattern, content):
+                line = content.count('\n', 0, match.start())
+                violations.append({
+                    'pattern': pattern,
+                    'line': line + 1,
+                    'match': match.group(0),
+                    'context': '\n'.join(lines[max(0, line - 2):min(len(lines), line + 3)])
+                })
+        results.append((str(file_path), violations))
+    return results
+
+class TestParallelScanner(unittest.TestCase):
+    def test_stream_covers_every_item(self):
+        """Testa que os lotes cobrem todos os itens, com seus índices"""
+        scanner = ParallelScanner(max_workers=2, min_parallel_items=0)
+        items = [f'item-{i}' * (i % 5) for i in range(50)]
+
+        async def collect():
+            return [batch async for batch in scanner.stream(len, items)]
+
+        batches = asyncio.run(collect())
+
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(
+            sorted(result for batch in batches for result in batch),
+            [(i, len(item)) for i, item in enumerate(items)]
+        )
+        self.assertEqual(asyncio.run(scanner.run(len, items)), [len(item) for item in items])
+
+    def test_small_inputs_stay_in_process(self):
+        """Testa que listas pequenas não sobem processos"""
+        scanner = ParallelScanner(max_workers=8, min_parallel_items=100)
+
+        self.assertEqual(scanner.workers_for(10), 0)
+        self.assertEqual(scanner.workers_for(1000), 8)
+        self.assertEqual(ParallelScanner(max_workers=1).workers_for(1000), 0)
+        self.assertEqual(asyncio.run(scanner.run(len, ['a', 'bb'])), [1, 2])
+        self.assertEqual(asyncio.run(scanner.run(len, [])), [])
+
+class TestParallelProjectScans(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for i in range(40):
+            folder = self.temp_dir / f'Module{i % 4}'
+            folder.mkdir(exist_ok=True)
+            (folder / f'Service{i}.cs').write_text(
+                f'public class Service{i} {{\n'
+                f'    var password = "p{i}";\n' * (i % 3) +
+                '    var hash = MD5.Create();\n' * (i % 2) +
+                '    db.ExecuteQuery(sql);\n}\n'
+            )
+            (folder / f'app{i}.config').write_text(
+                '<compilation debug="true" />\n' if i % 5 == 0 else '<configuration />\n'
+            )
+        self.inline = ParallelScanner(max_workers=1)
+        self.pool = ParallelScanner(max_workers=2, min_parallel_items=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_vulnerability_scan_matches_inline_scan(self):
+        """Testa que o scan em processos é idêntico ao scan no processo"""
+        inline = asyncio.run(VulnerabilityScanner(self.inline).scan_project(self.temp_dir))
+        parallel = asyncio.run(VulnerabilityScanner(self.pool).scan_project(self.temp_dir))
+
+        for key in ('code_vulnerabilities', 'config_vulnerabilities'):
+            self.assertTrue(inline[key])
+            self.assertEqual(parallel[key], inline[key])
+
+    def test_compliance_check_matches_per_rule_check(self):
+        """Testa que as regras, verificadas juntas em processos, mantêm os resultados"""
+        checker = ComplianceChecker(self.pool)
+        results = asyncio.run(checker.check_compliance(self.temp_dir))
+        inline = asyncio.run(ComplianceChecker(self.inline).check_compliance(self.temp_dir))
+
+        expected = [
+            (file, violations)
+            for rule in checker.rules['owasp']
+            for file, violations in rule_results(self.temp_dir, rule)
+        ]
+        self.assertEqual(
+            [(r['file'], r.get('violations', [])) for r in results['owasp_compliance']],
+            expected
+        )
+        self.assertTrue(any(violations for _, violations in expected))
+        for key in ('owasp_compliance', 'gdpr_compliance', 'best_practices',
+                    'total_issues', 'compliance_score'):
+            self.assertEqual(results[key], inline[key])
+
+    def test_invalid_rule_patterns_are_reported_per_rule(self):
+        """Testa que uma regra inválida não afeta as demais"""
+        rules = [
+            {'id': 'BAD', 'category': 'Test', 'severity': 'low', 'description': 'x',
+             'patterns': [r'('], 'file_types': ['.cs']},
+            {'id': 'OK', 'category': 'Test', 'severity': 'low', 'description': 'y',
+             'patterns': [r'MD5'], 'file_types': ['.cs']}
+        ]
+        checker = ComplianceChecker(self.pool)
+
+        with self.assertLogs('tools.security.compliance_checker', level='ERROR'):
+            bad, ok = asyncio.run(checker._check_rules(self.temp_dir, rules))
+
+        self.assertEqual(bad, [])
+        self.assertEqual(len(ok), 40)
+        self.assertEqual(sum(not r['compliant'] for r in ok), 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# tests/security/test_pattern_scanning.py
+import unittest
+import asyncio
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.security.pattern_set import PatternSet
+from tools.security.vulnerability_scanner import VulnerabilityScanner
+
+def glob_matches(project_path, pattern, file_types):
+    """Busca original: um glob e uma leitura por padrão e tipo de arquivo"""
+    matches = []
+    for file_type in file_types:
+        for file_path in project_path.glob(f'**/{file_type}'):
+            try:
+                content = file_path.read_text()
+            except Exception:
+                continue
+            for i, line in enumerate(content.splitlines(), 1):
+                if re.search(pattern, line):
+                    matches.append({'file': file_path, 'line': i, 'snippet': line.strip()})
+    return matches
+
+class TestPatternSet(unittest.TestCase):
+    def test_reports_every_pattern_on_the_line(self):
+        """Testa que uma linha com vários padrões reporta todos, em ordem"""
+        patterns = [re.compile(p) for p in (r'SHA1', r'password\s*=', r'MD5|SHA1', r'Response')]
+        content = 'password = MD5(SHA1(x))\nnada aqui\nMD5'
+
+        self.assertEqual(
+            PatternSet(patterns).scan(content),
+            [(1, 'password = MD5(SHA1(x))', [0, 1, 2]), (3, 'MD5', [2])]
+        )
+        self.assertEqual(PatternSet(patterns).scan('nada aqui'), [])
+
+    def test_line_dependent_patterns(self):
+        """Testa âncoras e lookarounds, que não casam no arquivo inteiro"""
+        patterns = [re.compile(p) for p in (r'^using', r'debug$', r'key(?!\s)', r'[^a]b\b')]
+        content = 'x\nusing System;\nset debug\nkey\ncb'
+
+        self.assertEqual(
+            PatternSet(patterns).scan(content),
+            [(2, 'using System;', [0]), (3, 'set debug', [1]), (4, 'key', [2]), (5, 'cb', [3])]
+        )
+
+class TestSinglePassScanning(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        files = {
+            'App.cs': 'var password = "x"; // MD5\nResponse.Write(input);\nok',
+            'src/Data/Repo.cs': 'string.Format("SELECT " + id) + SHA1\npassword = \'y\'',
+            'src/Views/Main.xaml': '<Grid Tag="MD5" />',
+            'Web.config': '<compilation debug="true" />\n'
+                          '<add connectionString="Server=a;password=secret" />',
+            'src/appsettings.json': '{"password": "1", "debug": "true"}',
+            'src/Properties/Settings.settings': 'password="z" SHA1',
+            'notes.txt': 'password = "ignored"'
+        }
+        for name, content in files.items():
+            path = self.temp_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        self.scanner = VulnerabilityScanner()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_matches_identical_to_per_pattern_glob(self):
+        """Testa que a varredura única produz os mesmos matches, na mesma ordem"""
+        specs = [
+            (r'password\s*=\s*["\'].*["\']', ['*.cs', '*.xaml', '*.config']),
+            (r'MD5|SHA1', ['*.cs', '*.settings', '*.cs']),
+            (r'debug\s*=\s*"true"', ['*.config', '*.json', '*.xml', '*.settings']),
+            (r'(?i)PASSWORD', ['*.json', 'Properties/*.settings']),
+            (r'(', ['*.cs'])
+        ]
+
+        matches = asyncio.run(self.scanner._find_all_pattern_matches(self.temp_dir, specs))
+
+        self.assertEqual(
+            matches,
+            [glob_matches(self.temp_dir, pattern, types) if pattern != r'(' else []
+             for pattern, types in specs]
+        )
+
+    def test_scan_project_reads_each_file_once(self):
+        """Testa que código e configurações compartilham uma única leitura"""
+        reads = []
+        original = Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            reads.append(path)
+            return original(path, *args, **kwargs)
+
+        Path.read_text = counting_read_text
+        try:
+            results = asyncio.run(self.scanner.scan_project(self.temp_dir))
+        finally:
+            Path.read_text = original
+
+        self.assertEqual(len(reads), len(set(reads)))
+        self.assertNotIn(self.temp_dir / 'notes.txt', reads)
+
+        code = [
+            {'type': p['type'], 'file': str(m['file']), 'line': m['line'], 'snippet': m['snippet']}
+            for p in self.scanner.patterns['code_patterns']
+            for m in glob_matches(self.temp_dir, p['pattern'], ['*.cs', '*.xaml', '*.config'])
+        ]
+        self.assertEqual(
+            [{key: v[key] for key in ('type', 'file', 'line', 'snippet')}
+             for v in results['code_vulnerabilities']],
+            code
+        )
+        self.assertEqual(
+            [(v['file'], v['line']) for v in results['config_vulnerabilities']],
+            [(str(m['file']), m['line'])
+             for p in self.scanner.patterns['config_patterns']
+             for m in glob_matches(self.temp_dir, p['pattern'],
+                                   ['*.config', '*.json', '*.xml', '*.settings'])]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# tests/templates/test_template_store.py
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from templates.template_store import TemplateStore
+
+class TestTemplateStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = TemplateStore(self.temp_dir, '.xaml')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_load_is_served_from_memory(self):
+        """Testa que o arquivo só é lido quando muda"""
+        (self.temp_dir / "Main.xaml").write_text("<Grid/>")
+
+        self.assertEqual(self.store.load("Main"), "<Grid/>")
+        self.assertEqual(self.store.load("Main"), "<Grid/>")
+        self.assertEqual(self.store.reads, 1)
+
+    def test_load_detects_changes_on_disk(self):
+        """Testa a revalidação pelo mtime"""
+        template_file = self.temp_dir / "Main.xaml"
+        template_file.write_text("<Grid/>")
+        self.store.load("Main")
+
+        template_file.write_text("<StackPanel/>")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.store.load("Main"), "<StackPanel/>")
+        self.assertEqual(self.store.reads, 2)
+
+    def test_save_updates_cache(self):
+        """Testa que salvar dispensa a releitura"""
+        self.store.save("Main", "<Grid/>")
+
+        self.assertTrue((self.temp_dir / "Main.xaml").exists())
+        self.assertEqual(self.store.load("Main"), "<Grid/>")
+        self.assertEqual(self.store.reads, 0)
+
+    def test_missing_template(self):
+        """Testa template inexistente ou removido"""
+        self.store.save("Main", "<Grid/>")
+        (self.temp_dir / "Main.xaml").unlink()
+
+        self.assertEqual(self.store.load("Main", default=""), "")
+        self.assertIsNone(self.store.load("Other"))
+
+if __name__ == '__main__':
+    unittest.main()
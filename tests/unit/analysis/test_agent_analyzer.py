@@ -0,0 +1,88 @@
+# tests/unit/analysis/test_agent_analyzer.py
+import unittest
+import asyncio
+import time
+
+from analysis.agent_pool import AgentPool
+
+try:
+    from analysis.agent_analyzer import AGENT_ANALYSES, AgentAnalyzer
+except ImportError:  # crewai não instalado
+    AgentAnalyzer = None
+
+class SlowAgent:
+    """Agente com métodos async sem await, como os especializados"""
+
+    delays = {}
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def _analyze(self, name):
+        time.sleep(self.delays.get(name, 0.5))
+        return {'agent': name}
+
+    async def analyze_requirements(self, structure):
+        return self._analyze('uiux')
+
+    async def design_interface(self, structure):
+        return self._analyze('wpf')
+
+    async def design_database_schema(self, structure):
+        return self._analyze('database')
+
+    async def design_service_layer(self, structure):
+        return self._analyze('api')
+
+    async def analyze_security(self, structure):
+        return self._analyze('security')
+
+@unittest.skipIf(AgentAnalyzer is None, "crewai não instalado")
+class TestAgentAnalyzerConcurrency(unittest.TestCase):
+    def setUp(self):
+        SlowAgent.delays = {}
+        self.pool = AgentPool({agent_type: SlowAgent for agent_type in AGENT_ANALYSES})
+
+    def analyzer(self, **config):
+        return AgentAnalyzer({'agent_pool': self.pool, 'incremental': False, **config})
+
+    def collect(self, analyzer):
+        """Análises, erros e tempo decorrido dentro do event loop"""
+        async def timed():
+            start = time.perf_counter()
+            analyses, errors = await analyzer._collect_agent_analyses({})
+            return analyses, errors, time.perf_counter() - start
+        return asyncio.run(timed())
+
+    def test_agents_overlap(self):
+        """Testa que as análises rodam simultaneamente"""
+        analyses, errors, elapsed = self.collect(self.analyzer())
+
+        self.assertEqual(errors, {})
+        self.assertEqual(analyses['database'], {'agent': 'database'})
+        self.assertLess(elapsed, 1.5)
+
+    def test_slow_agent_times_out(self):
+        """Testa o timeout de um agente lento sem perder os demais"""
+        SlowAgent.delays = {agent_type: 0.05 for agent_type in AGENT_ANALYSES}
+        SlowAgent.delays['security'] = 1.0
+        analyzer = self.analyzer(agent_timeout=0.3)
+
+        analyses, errors, elapsed = self.collect(analyzer)
+
+        self.assertEqual(list(errors), ['security'])
+        self.assertIn('Timeout', errors['security'])
+        self.assertEqual(analyses['security'], {})
+        self.assertEqual(analyses['wpf'], {'agent': 'wpf'})
+        self.assertLess(elapsed, 0.8)
+
+    def test_run_agent_analysis_raises_timeout(self):
+        """Testa que wait_for dispara TimeoutError para o agente lento"""
+        SlowAgent.delays = {'wpf': 1.0}
+        analyzer = self.analyzer(agent_timeout=0.1)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(analyzer._run_agent_analysis('wpf', {}))
+
+if __name__ == '__main__':
+    unittest.main()
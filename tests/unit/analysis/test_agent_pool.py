@@ -0,0 +1,81 @@
+# tests/unit/analysis/test_agent_pool.py
+import unittest
+import threading
+from types import SimpleNamespace
+
+from analysis.agent_pool import AgentPool, llm_config_key
+
+class FakeAgent:
+    def __init__(self, llm):
+        self.llm = llm
+
+class TestAgentPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = AgentPool({'wpf': FakeAgent, 'api': FakeAgent}, max_idle=2)
+
+    def test_reuse_instances(self):
+        """Testa reutilização de instâncias devolvidas ao pool"""
+        first = self.pool.acquire('wpf')
+        self.pool.release('wpf', first)
+        second = self.pool.acquire('wpf')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.pool.stats['constructions'], 1)
+        self.assertEqual(self.pool.stats['reuses'], 1)
+
+    def test_keyed_by_llm_config(self):
+        """Testa separação de instâncias por configuração de LLM"""
+        gpt4 = SimpleNamespace(model_name='gpt-4', temperature=0.7)
+        gpt35 = SimpleNamespace(model_name='gpt-3.5', temperature=0.7)
+
+        with self.pool.agent('wpf', gpt4) as agent:
+            pass
+        with self.pool.agent('wpf', gpt35) as other:
+            self.assertIsNot(agent, other)
+            self.assertIs(other.llm, gpt35)
+
+        self.assertNotEqual(llm_config_key(gpt4), llm_config_key(gpt35))
+        self.assertEqual(llm_config_key(None), 'none')
+
+    def test_warm_up(self):
+        """Testa pré-construção de instâncias"""
+        self.pool.warm_up(count=2)
+        self.assertEqual(self.pool.idle_count(), 4)
+        self.assertEqual(self.pool.idle_count('api'), 2)
+
+        self.pool.acquire('api')
+        self.assertEqual(self.pool.stats['constructions'], 4)
+        self.assertEqual(self.pool.stats['reuses'], 1)
+
+    def test_max_idle(self):
+        """Testa limite de instâncias ociosas"""
+        agents = [self.pool.acquire('wpf') for _ in range(4)]
+        for agent in agents:
+            self.pool.release('wpf', agent)
+        self.assertEqual(self.pool.idle_count('wpf'), 2)
+
+    def test_unknown_agent_type(self):
+        """Testa erro para tipo de agente desconhecido"""
+        with self.assertRaises(KeyError):
+            self.pool.acquire('unknown')
+
+    def test_concurrent_access(self):
+        """Testa acesso concorrente ao pool"""
+        acquired = []
+
+        def worker():
+            for _ in range(50):
+                with self.pool.agent('wpf') as agent:
+                    acquired.append(agent)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(acquired), 400)
+        self.assertLessEqual(self.pool.stats['constructions'], 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/unit/analysis/test_analysis_cache.py
+import unittest
+
+from analysis.analysis_cache import SectionCache, section_hash, resolve_section
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.dependencies = {
+            'database': ['entities', 'metadata.database'],
+            'uiux': ['features']
+        }
+        self.cache = SectionCache(self.dependencies, max_entries=2)
+        self.structure = {
+            'metadata': {'name': 'Test', 'database': True},
+            'features': {'board': {'columns': ['Todo']}},
+            'entities': [{'name': 'User'}]
+        }
+
+    def test_resolve_section(self):
+        """Testa resolução de caminhos pontuados"""
+        self.assertTrue(resolve_section(self.structure, 'metadata.database'))
+        self.assertEqual(resolve_section(self.structure, 'entities'), [{'name': 'User'}])
+
+    def test_hash_depends_only_on_sections(self):
+        """Testa que o hash muda apenas com as seções declaradas"""
+        before = section_hash(self.structure, self.dependencies['database'])
+        self.structure['features']['filters'] = True
+        self.assertEqual(before, section_hash(self.structure, self.dependencies['database']))
+
+        self.structure['entities'].append({'name': 'Order'})
+        self.assertNotEqual(before, section_hash(self.structure, self.dependencies['database']))
+
+    def test_hash_is_order_independent(self):
+        """Testa estabilidade do hash em relação à ordem das chaves"""
+        reordered = {
+            'entities': [{'name': 'User'}],
+            'metadata': {'database': True, 'name': 'Other'}
+        }
+        self.assertEqual(
+            section_hash(self.structure, self.dependencies['database']),
+            section_hash(reordered, self.dependencies['database'])
+        )
+
+    def test_only_changed_analyses_miss(self):
+        """Testa reaproveitamento das análises cujas entradas não mudaram"""
+        for name in self.dependencies:
+            self.cache.put(self.cache.key_for(name, self.structure), {'agent': name})
+
+        self.structure['entities'].append({'name': 'Order'})
+        self.assertIsNone(self.cache.get(self.cache.key_for('database', self.structure)))
+        self.assertEqual(
+            self.cache.get(self.cache.key_for('uiux', self.structure)),
+            {'agent': 'uiux'}
+        )
+        self.assertEqual(self.cache.stats, {'hits': 1, 'misses': 1})
+
+    def test_cached_results_are_copies(self):
+        """Testa isolamento entre resultado em cache e resultado retornado"""
+        key = self.cache.key_for('uiux', self.structure)
+        self.cache.put(key, {'flows': []})
+        self.cache.get(key)['flows'].append('changed')
+        self.assertEqual(self.cache.get(key), {'flows': []})
+
+    def test_lru_eviction(self):
+        """Testa descarte do resultado menos usado"""
+        self.cache.put(('a', '1'), 1)
+        self.cache.put(('b', '1'), 2)
+        self.cache.get(('a', '1'))
+        self.cache.put(('c', '1'), 3)
+
+        self.assertIsNone(self.cache.get(('b', '1')))
+        self.assertEqual(self.cache.get(('a', '1')), 1)
+
+if __name__ == '__main__':
+    unittest.main()
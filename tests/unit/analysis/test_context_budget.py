@@ -0,0 +1,57 @@
+# tests/unit/analysis/test_context_budget.py
+import unittest
+import json
+
+from analysis.context_budget import ContextBudget, compact, estimate_tokens, to_prompt_text
+
+class TestContextBudget(unittest.TestCase):
+    def setUp(self):
+        self.analysis = {
+            'project_info': {'name': 'Inventory', 'type': 'wpf', 'description': ''},
+            'domain_analysis': {'primary_domain': 'business'},
+            'patterns': {'architectural': ['MVVM']},
+            'agent_analyses': {
+                'database': {'tables': [{'name': f'Table{i}', 'columns': ['Id', 'Name']} for i in range(50)]},
+                'uiux': {'guidelines': ['x' * 2000]},
+                'security': {'vulnerabilities': ['sql injection'] * 30}
+            },
+            'recommendations': {'database': ['Use indexes'], 'ui': ['Keep it simple']}
+        }
+
+    def test_selects_only_relevant_sections(self):
+        """Testa a seleção das seções do agente"""
+        text, report = ContextBudget(max_tokens=10000).build('database', self.analysis)
+        context = json.loads(text)
+
+        self.assertEqual(
+            sorted(context),
+            ['agent_analyses.database', 'domain_analysis', 'project_info', 'recommendations.database']
+        )
+        self.assertNotIn('security', text)
+        self.assertEqual(report['compaction_level'], 0)
+        self.assertGreater(report['saved_tokens'], 0)
+
+    def test_compacts_to_fit_budget(self):
+        """Testa a compactação determinística dentro do limite"""
+        budget = ContextBudget(max_tokens=120)
+        text, report = budget.build('database', self.analysis)
+
+        self.assertLessEqual(report['context_tokens'], 120)
+        self.assertGreater(report['compaction_level'], 0)
+        self.assertIn('omitidos', text)
+        self.assertEqual(text, budget.build('database', self.analysis)[0])
+
+    def test_drops_lowest_priority_sections(self):
+        """Testa o descarte de seções quando a compactação não basta"""
+        text, report = ContextBudget(max_tokens=20).build('database', self.analysis)
+        self.assertIn('project_info', report['sections'])
+        self.assertEqual(report['dropped_sections'][0], 'domain_analysis')
+
+    def test_compact(self):
+        """Testa o resumo de listas, dicionários e textos"""
+        self.assertEqual(compact([1, 2, 3, 4], max_items=2), [1, 2, '... +2 omitidos'])
+        self.assertEqual(compact({'a': '', 'b': None, 'c': 'abcdef'}, max_chars=3), {'c': 'abc...'})
+        self.assertEqual(estimate_tokens(to_prompt_text({'a': 1})), 2)
+
+if __name__ == '__main__':
+    unittest.main()
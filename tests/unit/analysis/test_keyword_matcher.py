@@ -0,0 +1,59 @@
+# tests/unit/analysis/test_keyword_matcher.py
+import unittest
+
+from analysis.keyword_matcher import KeywordMatcher
+
+class TestKeywordMatcher(unittest.TestCase):
+    def setUp(self):
+        self.keywords = {
+            'business': ['crud', 'document', 'report'],
+            'data_analysis': ['dashboard', 'chart', 'analysis'],
+            'workflow': ['task', 'workflow', 'status']
+        }
+        self.matcher = KeywordMatcher(self.keywords)
+
+    def _naive_score(self, features):
+        scores = {group: 0 for group in self.keywords}
+        for feature in features:
+            for group, keywords in self.keywords.items():
+                if any(kw in str(feature).lower() for kw in keywords):
+                    scores[group] += 1
+        return scores
+
+    def test_find_groups(self):
+        """Testa identificação de grupos em uma passagem"""
+        self.assertEqual(
+            self.matcher.find_groups('Task Dashboard with CRUD'),
+            {'business', 'data_analysis', 'workflow'}
+        )
+        self.assertEqual(self.matcher.find_groups('login screen'), set())
+
+    def test_overlapping_keywords(self):
+        """Testa palavras-chave sobrepostas e sufixos (links de falha)"""
+        matcher = KeywordMatcher({'a': ['he', 'she'], 'b': ['hers'], 'c': ['his']})
+        counts = matcher.count_matches('ushers; he')
+        self.assertEqual(counts, {'a': 2, 'b': 1})
+
+    def test_score_matches_naive_scan(self):
+        """Testa equivalência com a varredura por substring"""
+        features = [
+            'user_crud', 'sales_dashboard', 'TaskBoard', 'status_report',
+            'login', {'name': 'chart'}, 'workflow_analysis', 'documents'
+        ]
+        self.assertEqual(self.matcher.score(features), self._naive_score(features))
+
+    def test_add_keywords_after_compile(self):
+        """Testa inclusão de domínios e palavras-chave após o uso"""
+        self.assertEqual(self.matcher.find_groups('invoice'), set())
+        self.matcher.add_keywords('finance', ['invoice', 'payment'])
+        self.assertEqual(self.matcher.find_groups('Invoice list'), {'finance'})
+        self.assertIn('finance', self.matcher.groups)
+
+    def test_remove_group(self):
+        """Testa remoção de grupo"""
+        self.matcher.remove_group('workflow')
+        self.assertEqual(self.matcher.find_groups('task status'), set())
+        self.assertEqual(self.matcher.find_groups('report'), {'business'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# tests/unit/cli/test_agent_integration.py
+import unittest
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+from analysis.agent_pool import AgentPool
+
+try:
+    from cli.agent_integration import TASK_AGENTS, AgentIntegrator
+except ImportError:  # python-dotenv não instalado
+    AgentIntegrator = None
+
+class FakeAgent:
+    def __init__(self, llm):
+        self.llm = llm
+
+@unittest.skipIf(AgentIntegrator is None, "python-dotenv não instalado")
+class TestAgentIntegratorPool(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.llm = SimpleNamespace(model_name='fake', temperature=0)
+        self.pool = AgentPool({agent_type: FakeAgent for agent_type in TASK_AGENTS})
+        self.integrator = AgentIntegrator(llm=self.llm)
+        self.integrator._agent_analyzer = SimpleNamespace(agent_pool=self.pool)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_task_agents_are_reused_between_generations(self):
+        """Testa que as gerações reutilizam os agentes aquecidos do pool"""
+        self.integrator.warm_up()
+        self.assertEqual(self.pool.stats['constructions'], len(TASK_AGENTS))
+
+        first = self.integrator._create_agents()
+        self.integrator._release_agents(first)
+        second = self.integrator._create_agents()
+
+        self.assertEqual(set(second), set(TASK_AGENTS))
+        self.assertTrue(all(second[t] is first[t] for t in TASK_AGENTS))
+        self.assertIs(second['wpf'].llm, self.llm)
+        self.assertEqual(self.pool.stats['constructions'], len(TASK_AGENTS))
+
+    def test_concurrent_generations_get_distinct_agents(self):
+        """Testa que gerações simultâneas não compartilham instâncias"""
+        first = self.integrator._create_agents()
+        second = self.integrator._create_agents()
+
+        self.assertTrue(all(second[t] is not first[t] for t in TASK_AGENTS))
+        self.integrator._release_agents(first)
+        self.integrator._release_agents(second)
+        self.assertEqual(self.pool.idle_count(), 2 * len(TASK_AGENTS))
+
+if __name__ == '__main__':
+    unittest.main()
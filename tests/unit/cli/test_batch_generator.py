@@ -0,0 +1,107 @@
+# tests/unit/cli/test_batch_generator.py
+import unittest
+import asyncio
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+from cli.batch_generator import BatchGenerator
+
+class FakeIntegrator:
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_project(self, structure):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        if structure['metadata']['name'] == 'Broken':
+            return {'status': 'error', 'message': 'generation failed'}
+        if structure['metadata']['name'] == 'ReadOnly':
+            # Falha do WPFProjectGenerator, aninhada no resultado do integrador
+            return {
+                'project': {'name': 'ReadOnly'},
+                'generation': {'status': 'error', 'error': 'permission denied'}
+            }
+        return {'project': {'name': structure['metadata']['name']}}
+
+class TestBatchGenerator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.spec_file = self.temp_dir / 'specs.jsonl'
+        self.report_path = self.temp_dir / 'report.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_specs(self, lines):
+        self.spec_file.write_text('\n'.join(lines), encoding='utf-8')
+
+    def _run(self, integrator, max_workers=4):
+        generator = BatchGenerator(
+            {'max_workers': max_workers, 'report_path': str(self.report_path)},
+            integrator=integrator
+        )
+        return asyncio.run(generator.run(str(self.spec_file)))
+
+    def test_generates_all_projects_concurrently(self):
+        """Testa geração concorrente limitada pelo número de workers"""
+        self._write_specs([
+            json.dumps({'type': 'kanban', 'name': f"Project{i}"}) for i in range(10)
+        ])
+        integrator = FakeIntegrator()
+        report = self._run(integrator, max_workers=4)
+
+        self.assertEqual(report['summary']['total'], 10)
+        self.assertEqual(report['summary']['succeeded'], 10)
+        self.assertEqual(integrator.max_active, 4)
+        self.assertLess(report['summary']['wall_time'], 10 * integrator.latency)
+        self.assertEqual(
+            [project['name'] for project in report['projects']],
+            [f"Project{i}" for i in range(10)]
+        )
+
+    def test_failures_are_reported_per_project(self):
+        """Testa falhas isoladas por projeto no relatório"""
+        self._write_specs([
+            json.dumps({'type': 'kanban', 'name': 'Good'}),
+            '{invalid json',
+            json.dumps({'type': 'unknown', 'name': 'BadType'}),
+            json.dumps({'type': 'dashboard', 'name': 'Broken'}),
+            ''
+        ])
+        report = self._run(FakeIntegrator(latency=0))
+
+        statuses = {project['line']: project['status'] for project in report['projects']}
+        self.assertEqual(statuses, {1: 'success', 2: 'error', 3: 'error', 4: 'error'})
+        self.assertEqual(report['summary']['failed'], 3)
+
+    def test_project_generator_failure_is_reported(self):
+        """Testa que a falha do gerador de projeto marca o projeto como erro"""
+        self._write_specs([
+            json.dumps({'type': 'kanban', 'name': 'ReadOnly'}),
+            json.dumps({'type': 'kanban', 'name': 'Good'})
+        ])
+        report = self._run(FakeIntegrator(latency=0))
+
+        failed, succeeded = report['projects']
+        self.assertEqual(failed['status'], 'error')
+        self.assertEqual(failed['error'], 'permission denied')
+        self.assertEqual(succeeded['status'], 'success')
+        self.assertEqual(report['summary']['failed'], 1)
+
+    def test_report_is_saved(self):
+        """Testa gravação do relatório de tempos"""
+        self._write_specs([json.dumps({'type': 'crud', 'name': 'Inventory'})])
+        self._run(FakeIntegrator(latency=0))
+
+        saved = json.loads(self.report_path.read_text(encoding='utf-8'))
+        self.assertEqual(saved['summary']['total'], 1)
+        self.assertIn('elapsed', saved['projects'][0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+# tests/unit/cli/test_daemon.py
+import unittest
+import asyncio
+import socket
+import tempfile
+import shutil
+from pathlib import Path
+
+from cli.command_handler import ProjectCLI
+from cli.daemon import KallistaDaemon
+from cli.daemon_client import DaemonClient, DaemonTimeout, DaemonUnavailable
+
+class FakeIntegrator:
+    def __init__(self):
+        self.generated = []
+        self.output_roots = []
+
+    async def generate_project(self, structure, output_root=None):
+        name = structure['metadata']['name']
+        self.generated.append(name)
+        self.output_roots.append(output_root)
+        if name == 'Crashed':
+            return None  # exceção dentro do integrador
+        if name == 'ReadOnly':
+            return {'project': name, 'generation': {'status': 'error', 'error': 'permission denied'}}
+        return {'project': name}
+
+class TestKallistaDaemon(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.socket_path = str(Path(self.temp_dir) / 'kallista.sock')
+        self.integrator = FakeIntegrator()
+        self.daemon = KallistaDaemon(self.socket_path, integrator=self.integrator)
+        self.client = DaemonClient(self.socket_path, timeout=5)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _with_daemon(self, client_calls):
+        """Executa chamadas do cliente (em thread) com o daemon ativo"""
+        async def run():
+            serve = asyncio.ensure_future(self.daemon.serve_forever())
+            while not Path(self.socket_path).exists():
+                await asyncio.sleep(0.01)
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(None, client_calls)
+            finally:
+                await loop.run_in_executor(None, lambda: self.client.request('shutdown'))
+                await serve
+
+        return asyncio.run(run())
+
+    def test_ping_and_stats(self):
+        """Testa comandos básicos do daemon"""
+        ping, stats = self._with_daemon(
+            lambda: (self.client.request('ping'), self.client.request('stats'))
+        )
+        self.assertEqual(ping['status'], 'ok')
+        self.assertEqual(stats['stats']['requests'], 2)
+        self.assertFalse(Path(self.socket_path).exists())
+
+    def test_generate_reuses_integrator(self):
+        """Testa gerações consecutivas no mesmo integrador aquecido"""
+        specs = [
+            {'type': 'kanban', 'name': f"Project{i}", 'description': ''}
+            for i in range(3)
+        ]
+        responses = self._with_daemon(
+            lambda: [self.client.request('generate', specs=spec) for spec in specs]
+        )
+
+        self.assertEqual([r['result'] for r in responses], [
+            {'project': 'Project0'}, {'project': 'Project1'}, {'project': 'Project2'}
+        ])
+        self.assertEqual(self.integrator.generated, ['Project0', 'Project1', 'Project2'])
+        self.assertEqual(self.daemon.stats['generations'], 3)
+
+    def test_generate_writes_to_client_output_root(self):
+        """Testa que a saída é o diretório do cliente, não o do daemon"""
+        output_root = Path(self.temp_dir) / 'client' / 'output'
+        response, relative = self._with_daemon(lambda: (
+            self.client.generate(str(output_root), specs={'type': 'kanban', 'name': 'Remote'}),
+            self.client.request('generate', specs={'type': 'kanban', 'name': 'Relative'},
+                                output_root='output')
+        ))
+
+        self.assertEqual(response['status'], 'ok')
+        self.assertEqual(self.integrator.output_roots, [str(output_root)])
+        self.assertEqual(relative['status'], 'error')
+
+    def test_failed_generation_is_an_error(self):
+        """Testa que falhas do integrador e do gerador não são respondidas como ok"""
+        crashed, read_only = self._with_daemon(lambda: [
+            self.client.request('generate', specs={'type': 'kanban', 'name': name})
+            for name in ('Crashed', 'ReadOnly')
+        ])
+
+        self.assertEqual(crashed, {'status': 'error', 'error': 'Geração falhou'})
+        self.assertEqual(read_only, {'status': 'error', 'error': 'permission denied'})
+        self.assertEqual(self.daemon.stats['errors'], 2)
+
+    def test_unknown_command(self):
+        """Testa resposta de erro para comando desconhecido"""
+        response = self._with_daemon(lambda: self.client.request('unknown'))
+        self.assertEqual(response['status'], 'error')
+
+    def _hung_daemon(self) -> socket.socket:
+        """Socket que aceita a conexão, mas nunca responde"""
+        hung = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        hung.bind(self.socket_path)
+        hung.listen(1)
+        return hung
+
+    def test_client_times_out_on_hung_daemon(self):
+        """Testa que um daemon que não responde não bloqueia o cliente"""
+        with self._hung_daemon():
+            client = DaemonClient(self.socket_path, timeout=0.2)
+
+            with self.assertRaises(DaemonTimeout):
+                client.request('ping')
+            self.assertFalse(client.is_running())
+
+    def test_cli_generates_locally_when_daemon_hangs(self):
+        """Testa o fallback para a geração local após o timeout"""
+        cli = ProjectCLI()
+        cli.daemon_client = DaemonClient(self.socket_path, timeout=0.2)
+        cli._agent_integrator = self.integrator
+        structure = cli.spec_converter.convert_to_project_structure({'type': 'kanban', 'name': 'Local'})
+
+        with self._hung_daemon():
+            result = asyncio.run(cli._generate(structure))
+
+        self.assertEqual(result, {'project': 'Local'})
+        self.assertEqual(self.integrator.generated, ['Local'])
+
+    def test_client_without_daemon(self):
+        """Testa cliente quando o daemon não está em execução"""
+        self.assertFalse(self.client.is_running())
+        with self.assertRaises(DaemonUnavailable):
+            self.client.request('ping')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/unit/core/test_cached_llm.py
+import unittest
+import asyncio
+import shutil
+import tempfile
+import time
+
+try:
+    from langchain_core.messages import HumanMessage
+    from core.llm.cached_llm import CachedChatModel
+    from core.llm.llm_metrics import LLMMetrics
+    from core.llm.local_llm import LocalChatModel
+    from core.llm.metrics_callback import LLMMetricsCallback
+    from core.llm.response_cache import ResponseCache
+    from core.llm.single_flight import SingleFlight
+except ImportError:  # langchain_core não instalado
+    CachedChatModel = None
+
+@unittest.skipIf(CachedChatModel is None, "langchain_core não instalado")
+class TestCachedChatModelCoalescing(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.local = LocalChatModel(latency=0.2)
+        self.model = CachedChatModel(
+            llm=self.local,
+            response_cache=ResponseCache({'cache_dir': self.cache_dir}),
+            single_flight=SingleFlight()
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_concurrent_identical_prompts_share_one_call(self):
+        """Testa N prompts idênticos simultâneos com uma única chamada ao modelo"""
+        prompts = 8
+
+        async def run():
+            return await asyncio.gather(*(
+                self.model.ainvoke([HumanMessage(content='Gere a entidade Cliente')])
+                for _ in range(prompts)
+            ))
+
+        start = time.perf_counter()
+        responses = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(self.local.calls, 1)
+        self.assertEqual(len({response.content for response in responses}), 1)
+        self.assertTrue(responses[0].content.startswith('Final Answer: local response'))
+        self.assertEqual(
+            self.model.get_stats()['single_flight'],
+            {'executed': 1, 'coalesced': prompts - 1}
+        )
+        self.assertLess(elapsed, 0.2 * prompts / 2)
+
+    def test_cached_response_skips_the_model(self):
+        """Testa que a repetição posterior é servida do cache"""
+        message = [HumanMessage(content='Gere o serviço de Pedidos')]
+        first = self.model.invoke(message)
+        second = self.model.invoke(message)
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(self.local.calls, 1)
+
+    def test_cached_tokens_are_not_counted_as_spent(self):
+        """Testa que respostas do cache e coalescidas não somam tokens gastos"""
+        metrics = LLMMetrics()
+        config = {'callbacks': [LLMMetricsCallback()]}
+        message = [HumanMessage(content='Gere o repositório de Clientes')]
+
+        async def run():
+            with metrics.scope(agent='DatabaseAgent', task='database'):
+                await asyncio.gather(*(self.model.ainvoke(message, config=config) for _ in range(3)))
+                await self.model.ainvoke(message, config=config)
+
+        asyncio.run(run())
+
+        # Tokens de uma única chamada ao modelo, como referência
+        usage = LocalChatModel(latency=0).invoke(message).response_metadata['token_usage']
+        total = metrics.snapshot()['total']
+        self.assertEqual(self.local.calls, 1)
+        self.assertEqual(total['calls'], 4)
+        self.assertEqual(total['cached_calls'], 3)
+        self.assertGreater(usage['prompt_tokens'], 0)
+        self.assertEqual(total['prompt_tokens'], usage['prompt_tokens'])
+        self.assertEqual(total['completion_tokens'], usage['completion_tokens'])
+        self.assertEqual(total['cached_prompt_tokens'], 3 * usage['prompt_tokens'])
+
+    def test_scripted_responses(self):
+        """Testa respostas roteirizadas do LLM local"""
+        local = LocalChatModel(latency=0, responses={'Cliente': 'Final Answer: ok'})
+
+        self.assertEqual(local.invoke([HumanMessage(content='Entidade Cliente')]).content, 'Final Answer: ok')
+        self.assertNotEqual(local.invoke([HumanMessage(content='outro')]).content, 'Final Answer: ok')
+        self.assertEqual(local.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# tests/unit/core/test_fake_server.py
+import unittest
+import json
+import threading
+import time
+import urllib.request
+
+from core.llm.fake_server import FakeChatCompletionsServer, LatencyModel
+
+class TestFakeServer(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.server = FakeChatCompletionsServer(
+            responses={'database': 'Final Answer: use SQL Server'},
+            latency=LatencyModel(first_token=0.1, tokens_per_second=100.0)
+        ).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _post(self, **payload):
+        request = urllib.request.Request(
+            f"{self.server.url}/chat/completions",
+            data=json.dumps({'model': 'fake', **payload}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        with urllib.request.urlopen(request) as response:
+            return response.read().decode('utf-8')
+
+    def test_chat_completion(self):
+        """Testa resposta roteirizada no formato da API"""
+        start = time.perf_counter()
+        body = json.loads(self._post(messages=[{'role': 'user', 'content': 'Design the database'}]))
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+        self.assertEqual(body['object'], 'chat.completion')
+        self.assertEqual(body['choices'][0]['message']['content'], 'Final Answer: use SQL Server')
+        self.assertEqual(body['usage']['completion_tokens'], 5)
+        self.assertEqual(self.server.stats['requests'], 1)
+
+    def test_streaming_completion(self):
+        """Testa o envio incremental em eventos SSE"""
+        events = [
+            line[len('data: '):]
+            for line in self._post(messages=[{'role': 'user', 'content': 'database'}], stream=True).splitlines()
+            if line.startswith('data: ')
+        ]
+        self.assertEqual(events[-1], '[DONE]')
+        chunks = [json.loads(event) for event in events[:-1]]
+        text = ''.join(chunk['choices'][0]['delta'].get('content', '') for chunk in chunks)
+        self.assertEqual(text, 'Final Answer: use SQL Server')
+        self.assertEqual(chunks[-1]['choices'][0]['finish_reason'], 'stop')
+
+    def test_busy_time_merges_concurrent_requests(self):
+        """Testa que requisições simultâneas contam uma vez no tempo do modelo"""
+        threads = [
+            threading.Thread(target=self._post, kwargs={'messages': [{'role': 'user', 'content': str(i)}]})
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.server.stats['requests'], 4)
+        self.assertGreater(self.server.stats['model_time'], 3 * self.server.busy_time())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# tests/unit/core/test_llm_metrics.py
+import unittest
+import threading
+
+from core.llm.llm_metrics import LLMMetrics, Histogram, current_scope
+
+class TestLLMMetrics(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.metrics = LLMMetrics()
+
+    def test_histogram_buckets(self):
+        """Testa a contagem por bucket e os agregados"""
+        histogram = Histogram((1.0, 5.0))
+        for value in (0.5, 1.0, 3.0, 10.0):
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+        self.assertEqual(data['buckets'], {'<=1': 2, '<=5': 1, '+inf': 1})
+        self.assertEqual(data['count'], 4)
+        self.assertEqual(data['mean'], 3.625)
+        self.assertEqual((data['min'], data['max']), (0.5, 10.0))
+
+    def test_scope_is_per_thread(self):
+        """Testa que cada thread enxerga apenas o próprio escopo"""
+        seen = {}
+
+        def worker(task):
+            with self.metrics.scope(agent='WpfAgent', task=task):
+                seen[task] = current_scope()[1]['task']
+
+        threads = [threading.Thread(target=worker, args=(task,)) for task in ('uiux', 'wpf')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(seen, {'uiux': 'uiux', 'wpf': 'wpf'})
+        self.assertEqual(current_scope(), (None, {}))
+
+    def test_snapshot_by_agent_and_task(self):
+        """Testa a agregação por agente e por tarefa"""
+        self.metrics.record({'agent': 'WpfAgent', 'task': 'wpf'}, 100, 50, 0.2, 1.5)
+        self.metrics.record({'agent': 'WpfAgent', 'task': 'wpf'}, 300, 150, None, 0.7)
+        self.metrics.record({'agent': 'ApiAgent', 'task': 'api'}, 10, 5, 0.1, 0.4)
+        self.metrics.record({'agent': 'ApiAgent', 'task': 'api'}, latency=30.0, error=True)
+
+        snapshot = self.metrics.snapshot()
+        wpf = snapshot['by_task']['wpf']
+        self.assertEqual(wpf['calls'], 2)
+        self.assertEqual(wpf['prompt_tokens'], 400)
+        self.assertEqual(wpf['time_to_first_token']['max'], 0.7)
+        self.assertEqual(snapshot['by_agent']['ApiAgent']['errors'], 1)
+        self.assertEqual(snapshot['total']['calls'], 4)
+        self.assertEqual(snapshot['total']['latency']['max'], 30.0)
+        self.assertEqual(snapshot['total']['completion_tokens'], 205)
+
+if __name__ == '__main__':
+    unittest.main()
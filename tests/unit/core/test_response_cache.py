@@ -0,0 +1,75 @@
+# tests/unit/core/test_response_cache.py
+import unittest
+import tempfile
+import shutil
+
+from core.llm.response_cache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache({'cache_dir': self.cache_dir})
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key_is_content_addressed(self):
+        """Testa que a chave depende de modelo, prompt, ferramentas e temperatura"""
+        base = ResponseCache.make_key('gpt-4', [{'content': 'hi'}], None, 0.7)
+        self.assertEqual(base, ResponseCache.make_key('gpt-4', [{'content': 'hi'}], None, 0.7))
+        self.assertNotEqual(base, ResponseCache.make_key('gpt-3.5', [{'content': 'hi'}], None, 0.7))
+        self.assertNotEqual(base, ResponseCache.make_key('gpt-4', [{'content': 'oi'}], None, 0.7))
+        self.assertNotEqual(base, ResponseCache.make_key('gpt-4', [{'content': 'hi'}], ['tool'], 0.7))
+        self.assertNotEqual(base, ResponseCache.make_key('gpt-4', [{'content': 'hi'}], None, 0.0))
+
+    def test_get_put(self):
+        """Testa operações básicas de get/put"""
+        key = ResponseCache.make_key('gpt-4', 'prompt')
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, {'text': 'response'})
+        self.assertEqual(self.cache.get(key), {'text': 'response'})
+        self.assertEqual(self.cache.stats['hits'], 1)
+        self.assertEqual(self.cache.stats['misses'], 1)
+
+    def test_persistence(self):
+        """Testa reabertura do cache a partir do disco"""
+        key = ResponseCache.make_key('gpt-4', 'prompt')
+        self.cache.put(key, {'text': 'response'})
+
+        reopened = ResponseCache({'cache_dir': self.cache_dir})
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.get(key), {'text': 'response'})
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Testa descarte LRU ao exceder o limite de tamanho"""
+        cache = ResponseCache({'cache_dir': self.cache_dir, 'max_entries': 2})
+        keys = [ResponseCache.make_key('gpt-4', f"prompt {i}") for i in range(3)]
+
+        cache.put(keys[0], {'i': 0})
+        cache.put(keys[1], {'i': 1})
+        cache.get(keys[0])
+        cache.put(keys[2], {'i': 2})
+
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[0]), {'i': 0})
+        self.assertEqual(cache.stats['evictions'], 1)
+
+    def test_max_size_bytes(self):
+        """Testa limite de tamanho total em bytes"""
+        cache = ResponseCache({'cache_dir': self.cache_dir, 'max_size': 200})
+        for i in range(10):
+            cache.put(ResponseCache.make_key('gpt-4', i), {'text': 'x' * 50})
+        self.assertLessEqual(cache.size, 200)
+
+    def test_clear(self):
+        """Testa limpeza do cache"""
+        self.cache.put(ResponseCache.make_key('gpt-4', 'prompt'), {'text': 'response'})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# tests/unit/core/test_single_flight.py
+import unittest
+import asyncio
+import threading
+import time
+
+from core.llm.single_flight import SingleFlight
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.flight = SingleFlight()
+        self.executions = 0
+
+    def _slow_call(self):
+        self.executions += 1
+        time.sleep(0.1)
+        return 'response'
+
+    def test_concurrent_threads_share_one_call(self):
+        """Testa coalescência de chamadas síncronas simultâneas"""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.flight.do('prompt', self._slow_call)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['response'] * 8)
+        self.assertEqual(self.executions, 1)
+        self.assertEqual(self.flight.stats, {'executed': 1, 'coalesced': 7})
+        self.assertEqual(self.flight.in_flight, 0)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Testa que chamadas não simultâneas executam normalmente"""
+        self.flight.do('prompt', self._slow_call)
+        self.flight.do('prompt', self._slow_call)
+        self.assertEqual(self.executions, 2)
+        self.assertEqual(self.flight.stats['coalesced'], 0)
+
+    def test_errors_are_shared(self):
+        """Testa propagação da exceção para todos os requisitantes"""
+        errors = []
+
+        def failing():
+            time.sleep(0.1)
+            raise RuntimeError('upstream failure')
+
+        def worker():
+            try:
+                self.flight.do('prompt', failing)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, ['upstream failure'] * 4)
+
+    def test_async_calls_share_one_call(self):
+        """Testa coalescência de chamadas assíncronas simultâneas"""
+        async def slow():
+            self.executions += 1
+            await asyncio.sleep(0.1)
+            return 'response'
+
+        async def run():
+            return await asyncio.gather(
+                *(self.flight.ado('prompt', slow) for _ in range(5)),
+                self.flight.ado('other', slow)
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(results, ['response'] * 6)
+        self.assertEqual(self.executions, 2)
+        self.assertEqual(self.flight.stats, {'executed': 2, 'coalesced': 4})
+
+    def test_cancelled_leader_does_not_fail_followers(self):
+        """Testa que o cancelamento de quem executa não cancela os seguidores"""
+        async def slow():
+            self.executions += 1
+            await asyncio.sleep(0.1)
+            return 'response'
+
+        async def run():
+            leader = asyncio.ensure_future(self.flight.ado('prompt', slow))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(self.flight.ado('prompt', slow)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return results
+
+        self.assertEqual(asyncio.run(run()), ['response'] * 3)
+        self.assertEqual(self.executions, 2)
+        self.assertEqual(self.flight.stats, {'executed': 2, 'coalesced': 3})
+        self.assertEqual(self.flight.in_flight, 0)
+
+    def test_cancelled_leader_without_followers(self):
+        """Testa que sem seguidores a chamada é simplesmente abandonada"""
+        async def slow():
+            self.executions += 1
+            await asyncio.sleep(0.1)
+
+        async def run():
+            leader = asyncio.ensure_future(self.flight.ado('prompt', slow))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+
+        asyncio.run(run())
+        self.assertEqual(self.executions, 1)
+        self.assertEqual(self.flight.in_flight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# tests/unit/core/test_stream_callback.py
+import unittest
+import threading
+
+try:
+    from langchain_core.messages import HumanMessage
+    from core.llm.llm_factory import create_llm
+    from core.llm.stream_callback import stream_tokens
+except ImportError:  # langchain_core não instalado
+    create_llm = None
+
+from tools.wpf.stream_writer import StreamingProjectWriter
+
+RESPONSE = '''Final Answer:
+```csharp Models/Customer.cs
+public class Customer { }
+```
+
+```csharp Services/CustomerService.cs
+public class CustomerService { }
+```
+Done.'''
+
+@unittest.skipIf(create_llm is None, "langchain_core não instalado")
+class TestTokenStreaming(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.llm = create_llm({'provider': 'local', 'local_latency': 0, 'cache_mode': 'off'})
+        self.llm.llm.default_response = RESPONSE
+        self.llm.llm.token_delay = 0.01
+        self.call_finished = threading.Event()
+        self.writes = []
+        self.writer = StreamingProjectWriter(
+            lambda path, content: self.writes.append((path, self.call_finished.is_set()))
+        )
+
+    def test_files_written_before_the_call_completes(self):
+        """Testa a gravação de cada arquivo assim que seu bloco chega"""
+        with stream_tokens(self.writer, 'database'):
+            self.llm.invoke([HumanMessage(content='Gere as entidades')])
+        self.call_finished.set()
+
+        self.assertEqual(
+            self.writes,
+            [('Models/Customer.cs', False), ('Services/CustomerService.cs', False)]
+        )
+        self.assertEqual(self.writer.written['Models/Customer.cs'], 'database')
+        self.assertEqual(self.writer.parsers, {})
+
+        # Saída final da tarefa: nada é regravado
+        self.writer.task_callback('database')(RESPONSE)
+        self.assertEqual(len(self.writes), 2)
+
+    def test_calls_outside_a_stream_are_ignored(self):
+        """Testa que sem destino ativo nenhum arquivo é gravado"""
+        self.llm.invoke([HumanMessage(content='Gere os serviços')])
+        self.assertEqual(self.writes, [])
+
+if __name__ == '__main__':
+    unittest.main()
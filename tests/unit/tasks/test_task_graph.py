@@ -0,0 +1,87 @@
+# tests/unit/tasks/test_task_graph.py
+import unittest
+import asyncio
+import threading
+import time
+
+from tasks.task_graph import TaskGraph, TaskGraphError
+
+class FakeTask:
+    """Tarefa mínima com a mesma interface usada pelo grafo"""
+
+    def __init__(self, name: str, latency: float = 0.1, fail: bool = False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.context = None
+
+class TestTaskGraph(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.order = []
+        self.graph = TaskGraph(runner=self._run)
+
+    def _run(self, task: FakeTask) -> str:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(task.latency)
+        with self.lock:
+            self.running -= 1
+            self.order.append(task.name)
+        if task.fail:
+            raise RuntimeError(f"{task.name} failed")
+        return f"{task.name} output"
+
+    def _build(self, **tasks):
+        for name in ('uiux', 'database', 'api'):
+            self.graph.add(name, tasks.get(name) or FakeTask(name))
+        self.graph.add('wpf', FakeTask('wpf'), depends_on=['uiux', 'database', 'api'])
+
+    def test_independent_tasks_run_in_parallel(self):
+        """Testa que o tempo total segue o caminho crítico"""
+        self._build()
+        result = asyncio.run(self.graph.run())
+
+        self.assertEqual(self.max_running, 3)
+        self.assertEqual(self.order[-1], 'wpf')
+        self.assertLess(result.wall_time, 0.35)
+        self.assertAlmostEqual(result.critical_path_time, 0.2, delta=0.1)
+        self.assertEqual(list(result.outputs), ['uiux', 'database', 'api', 'wpf'])
+        self.assertIn('wpf output', str(result))
+
+    def test_concurrency_is_bounded(self):
+        """Testa o limite de tarefas simultâneas"""
+        self._build()
+        asyncio.run(self.graph.run(max_concurrency=2))
+        self.assertEqual(self.max_running, 2)
+
+    def test_dependencies_become_task_context(self):
+        """Testa que as dependências são passadas como contexto"""
+        self._build()
+        self.assertEqual(
+            [task.name for task in self.graph.tasks['wpf'].context],
+            ['uiux', 'database', 'api']
+        )
+        self.assertIsNone(self.graph.tasks['uiux'].context)
+        self.assertEqual(self.graph.levels(), [['uiux', 'database', 'api'], ['wpf']])
+
+    def test_failed_dependency_skips_dependents(self):
+        """Testa que tarefas dependentes não executam após falha"""
+        self._build(database=FakeTask('database', fail=True))
+        with self.assertRaises(TaskGraphError) as context:
+            asyncio.run(self.graph.run())
+
+        self.assertNotIn('wpf', self.order)
+        self.assertIn('database', context.exception.errors)
+
+    def test_unknown_dependency(self):
+        """Testa dependências não declaradas"""
+        with self.assertRaises(ValueError):
+            self.graph.add('wpf', FakeTask('wpf'), depends_on=['uiux'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/unit/tools/test_bulk_generation.py
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.api.service_generator import ServiceGenerator
+from tools.database.schema_generator import SchemaGenerator
+
+class TestBulkGeneration(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.schema = {
+            'namespace': 'Shop.Domain',
+            'entities': [
+                {
+                    'name': f"Entity{i}",
+                    'properties': [
+                        {'name': 'Id', 'type': 'int', 'key': True, 'required': True},
+                        {'name': 'Name', 'type': 'string', 'max_length': 50, 'column_name': 'name'},
+                        {'name': 'Price', 'type': 'decimal', 'nullable': True}
+                    ],
+                    'navigation_properties': [
+                        {'name': 'Items', 'type': 'one_to_many', 'entity': 'Item'},
+                        {'name': 'Owner', 'type': 'many_to_one', 'entity': 'User'}
+                    ]
+                }
+                for i in range(5)
+            ]
+        }
+        self.services = [
+            {
+                'name': f"Entity{i}",
+                'dependencies': [{'type': 'IEntityRepository', 'name': 'Repository'}],
+                'methods': [{
+                    'name': 'GetAsync',
+                    'return_type': 'EntityDto',
+                    'parameters': [{'type': 'int', 'name': 'id'}],
+                    'implementation': ['return null;']
+                }],
+                'dtos': [{
+                    'name': f"Entity{i}Dto",
+                    'properties': [{'name': 'Id', 'type': 'int', 'validations': ['Required']}],
+                    'validation_rules': ['RuleFor(x => x.Id).GreaterThan(0)']
+                }]
+            }
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_entity_schemas_match_single_generation(self):
+        """Testa que o lote gera o mesmo código que entidade a entidade"""
+        generator = SchemaGenerator()
+        entities = generator.generate_entity_schemas(self.schema)
+
+        for entity in self.schema['entities']:
+            expected = generator.generate_entity_schema({**entity, 'namespace': 'Shop.Domain'})
+            self.assertEqual(entities[entity['name']], expected)
+
+    def test_services_match_single_generation(self):
+        """Testa que o lote gera os mesmos serviços que `generate_service`"""
+        generator = ServiceGenerator()
+        services = generator.generate_services(self.services)
+
+        for config in self.services:
+            self.assertEqual(services[config['name']], generator.generate_service(config))
+
+    def test_save_writes_all_files(self):
+        """Testa a gravação em lote de entidades e serviços"""
+        schema_generator, service_generator = SchemaGenerator(), ServiceGenerator()
+        root = Path(self.temp_dir) / "generated"
+
+        entities = schema_generator.save_entity_schemas(
+            schema_generator.generate_entity_schemas(self.schema), root / "Entities", max_workers=2
+        )
+        services = service_generator.save_services(
+            service_generator.generate_services(self.services), root / "Services", max_workers=2
+        )
+
+        self.assertEqual(entities['file_count'], 5)
+        self.assertEqual(services['file_count'], 3 * 4)
+        self.assertTrue((root / "Services" / "Entity0" / "DTOs" / "Entity0Dto.cs").is_file())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# tests/unit/tools/test_file_emitter.py
+import unittest
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.wpf.file_emitter import FileEmitter
+from tools.wpf.project_generator import WPFProjectGenerator
+
+class TestFileEmitter(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.emitter = FileEmitter(max_workers=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_emit_writes_files_and_returns_manifest(self):
+        """Testa gravação em lote e o manifesto"""
+        files = {
+            f"Module{i}/Views/View{j}.xaml": f"<Grid x:Name=\"View{i}{j}\" />"
+            for i in range(5) for j in range(20)
+        }
+        files['App.xaml.cs'] = 'public partial class App { }'
+
+        manifest = asyncio.run(self.emitter.emit_async(self.temp_dir, files, ['Properties']))
+
+        self.assertTrue((self.temp_dir / 'Properties').is_dir())
+        self.assertEqual(manifest['file_count'], 101)
+        entry = manifest['files']['Module3/Views/View7.xaml']
+        content = (self.temp_dir / 'Module3/Views/View7.xaml').read_bytes()
+        self.assertEqual(entry['size'], len(content))
+        self.assertEqual(entry['sha256'], hashlib.sha256(content).hexdigest())
+        self.assertEqual(manifest['total_size'], sum(len(c.encode('utf-8')) for c in files.values()))
+
+    def test_generate_project_merges_streamed_files(self):
+        """Testa que arquivos emitidos pelos agentes prevalecem sobre os templates"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator = WPFProjectGenerator()
+            generator.write_file('Demo', 'Views/MainWindow.xaml', '<Window />')
+            result = asyncio.run(generator.generate_project({
+                'metadata': {'name': 'Demo'},
+                'streamed_files': ['Views/MainWindow.xaml']
+            }))
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(
+            (self.temp_dir / 'output/Demo/Views/MainWindow.xaml').read_text(encoding='utf-8'),
+            '<Window />'
+        )
+        self.assertIn('Demo.csproj', result['manifest']['files'])
+        self.assertEqual(result['manifest']['files']['Views/MainWindow.xaml']['size'], 10)
+        self.assertEqual(sorted(result['manifest']['files']), sorted(result['files_generated']))
+
+    def test_generate_project_uses_output_root(self):
+        """Testa geração e streaming em um diretório de saída informado"""
+        output_root = self.temp_dir / 'client-output'
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator = WPFProjectGenerator()
+            generator.stream_writer('Demo', output_root).write_file('Views/MainWindow.xaml', '<Window />')
+            result = asyncio.run(generator.generate_project({
+                'metadata': {'name': 'Demo'},
+                'streamed_files': ['Views/MainWindow.xaml'],
+                'output_root': str(output_root)
+            }))
+        finally:
+            os.chdir(cwd)
+
+        self.assertFalse((self.temp_dir / 'output/Demo').exists())
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['path'], str(output_root / 'Demo'))
+        self.assertTrue((output_root / 'Demo/Demo.csproj').is_file())
+        self.assertEqual(
+            (output_root / 'Demo/Views/MainWindow.xaml').read_text(encoding='utf-8'),
+            '<Window />'
+        )
+
+    def test_incremental_emit_skips_unchanged_files(self):
+        """Testa que apenas arquivos alterados são regravados"""
+        files = {'A.cs': 'class A { }', 'B.cs': 'class B { }'}
+        first = self.emitter.emit(self.temp_dir, files)
+        self.emitter.save_manifest(self.temp_dir, first)
+        mtime = (self.temp_dir / 'A.cs').stat().st_mtime_ns
+
+        previous = self.emitter.load_manifest(self.temp_dir)
+        second = self.emitter.emit(self.temp_dir, {**files, 'B.cs': 'class B { int x; }'}, previous=previous)
+
+        self.assertEqual(second['written'], ['B.cs'])
+        self.assertEqual(second['unchanged'], ['A.cs'])
+        self.assertEqual((self.temp_dir / 'A.cs').stat().st_mtime_ns, mtime)
+
+        # Alterações manuais no disco forçam a regravação
+        (self.temp_dir / 'A.cs').write_text('class A { /* edited */ }', encoding='utf-8')
+        third = self.emitter.emit(self.temp_dir, files, previous=second)
+        self.assertIn('A.cs', third['written'])
+        self.assertEqual((self.temp_dir / 'A.cs').read_text(encoding='utf-8'), 'class A { }')
+
+    def test_prune_removes_orphans(self):
+        """Testa a remoção de arquivos que deixaram de ser gerados"""
+        previous = self.emitter.emit(self.temp_dir, {'A.cs': 'a', 'Old/B.cs': 'b'})
+        self.assertEqual(self.emitter.prune(self.temp_dir, previous, ['A.cs']), ['Old/B.cs'])
+        self.assertFalse((self.temp_dir / 'Old/B.cs').exists())
+
+    def test_regenerating_unchanged_project_leaves_files_untouched(self):
+        """Testa que regenerar um projeto inalterado não regrava arquivos"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator = WPFProjectGenerator()
+            spec = {'metadata': {'name': 'Demo'}}
+            asyncio.run(generator.generate_project(spec))
+            project = self.temp_dir / 'output/Demo'
+            mtimes = {path: path.stat().st_mtime_ns for path in project.rglob('*') if path.is_file()}
+
+            result = asyncio.run(generator.generate_project(spec))
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(result['manifest']['written'], [])
+        self.assertEqual(len(result['manifest']['unchanged']), len(result['files_generated']))
+        self.assertEqual(
+            {path: path.stat().st_mtime_ns for path in project.rglob('*') if path.is_file()},
+            mtimes
+        )
+
+if __name__ == '__main__':
+    unittest.main()
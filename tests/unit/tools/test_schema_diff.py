@@ -0,0 +1,217 @@
+# tests/unit/tools/test_schema_diff.py
+import unittest
+import asyncio
+import copy
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.database.schema_diff import (
+    MigrationGenerator,
+    SchemaSnapshotStore,
+    diff_schemas
+)
+
+try:
+    from agents.specialized.database_agent import DatabaseAgent
+except ImportError:  # crewai não instalado
+    DatabaseAgent = None
+
+def entity(name, *properties):
+    return {
+        'name': name,
+        'properties': [{'name': 'Id', 'type': 'int', 'nullable': False}, *properties]
+    }
+
+class TestSchemaDiff(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.schema = {
+            'name': 'Shop',
+            'entities': [
+                entity('Customer', {'name': 'Name', 'type': 'string', 'nullable': False, 'max_length': 50}),
+                entity('Order', {'name': 'Total', 'type': 'decimal', 'nullable': False,
+                                 'precision': 18, 'scale': 2})
+            ],
+            'relationships': [
+                {'from_entity': 'Customer', 'to_entity': 'Order', 'type': 'OneToMany'}
+            ]
+        }
+        self.generator = MigrationGenerator()
+
+    def test_initial_schema_creates_everything(self):
+        """Testa o diff sem snapshot anterior"""
+        diff = diff_schemas(None, self.schema)
+
+        self.assertEqual(diff.summary()['created_tables'], 2)
+        self.assertEqual(len(diff.added_relationships), 1)
+        sql = self.generator.sql_script(diff)
+        self.assertIn("CREATE TABLE [Customers]", sql)
+        self.assertIn("FOREIGN KEY ([CustomerId]) REFERENCES [Customers] ([Id])", sql)
+
+    def test_unchanged_schema_has_no_operations(self):
+        """Testa que o mesmo schema não gera migration"""
+        diff = diff_schemas(self.schema, copy.deepcopy(self.schema))
+
+        self.assertTrue(diff.is_empty)
+        self.assertEqual(self.generator.sql_script(diff), "")
+
+    def test_changes_emit_only_required_operations(self):
+        """Testa adição, alteração e remoção de colunas e tabelas"""
+        current = copy.deepcopy(self.schema)
+        customer, order = current['entities']
+        customer['properties'][1]['max_length'] = 100
+        customer['properties'].append({'name': 'Email', 'type': 'string', 'nullable': True})
+        order['properties'].pop()
+        current['entities'].append(entity('Product'))
+
+        diff = diff_schemas(self.schema, current)
+        sql = self.generator.sql_script(diff).splitlines()
+
+        self.assertEqual(sql, [
+            "ALTER TABLE [Orders] DROP COLUMN [Total];",
+            "CREATE TABLE [Products] (",
+            "    [Id] int NOT NULL,",
+            "    CONSTRAINT [PK_Products] PRIMARY KEY ([Id])",
+            ");",
+            "ALTER TABLE [Customers] ADD [Email] nvarchar(max) NULL;",
+            "ALTER TABLE [Customers] ALTER COLUMN [Name] nvarchar(100) NOT NULL;"
+        ])
+
+        migration = self.generator.ef_migration(diff, 'SchemaUpdate', timestamp='20240101000000')
+        self.assertIn("public partial class SchemaUpdate_20240101000000 : Migration", migration)
+        self.assertIn('migrationBuilder.AddColumn<string>(name: "Email", table: "Customers"', migration)
+        self.assertIn("oldMaxLength: 50", migration)
+        self.assertNotIn("CreateTable(\n                name: \"Customers\"", migration)
+
+    def test_dropped_entity_drops_table_and_foreign_keys(self):
+        """Testa a remoção de uma entidade com relacionamento"""
+        current = copy.deepcopy(self.schema)
+        current['entities'] = current['entities'][:1]
+        current['relationships'] = []
+
+        diff = diff_schemas(self.schema, current)
+
+        # A FK está na tabela removida: basta o DROP TABLE
+        self.assertEqual(self.generator.sql_script(diff), "DROP TABLE [Orders];")
+
+    def test_cascade_change_recreates_foreign_key(self):
+        """Testa a mudança de cascade_delete"""
+        current = copy.deepcopy(self.schema)
+        current['relationships'][0]['cascade_delete'] = True
+
+        sql = self.generator.sql_script(diff_schemas(self.schema, current))
+
+        self.assertIn("DROP CONSTRAINT [FK_Orders_Customers_CustomerId]", sql)
+        self.assertIn("ON DELETE CASCADE", sql)
+
+    def test_unmapped_types_are_rejected(self):
+        """Testa que tipos sem mapeamento SQL geram erro, exceto object explícito"""
+        schema = {'entities': [entity('Note', {'name': 'Body', 'type': 'strng', 'nullable': True})]}
+        with self.assertRaisesRegex(ValueError, 'strng'):
+            self.generator.sql_script(diff_schemas(None, schema))
+
+        schema['entities'][0]['properties'][1]['type'] = 'object'
+        self.assertIn("[Body] sql_variant NULL", self.generator.sql_script(diff_schemas(None, schema)))
+
+class TestSchemaSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Testa gravação e leitura do snapshot"""
+        store = SchemaSnapshotStore(self.temp_dir)
+        schema = {'entities': [entity('Customer')], 'relationships': []}
+
+        self.assertIsNone(store.load('Shop'))
+        store.save('Shop', schema)
+        self.assertTrue(diff_schemas(store.load('Shop'), schema).is_empty)
+
+    def test_pending_migration_timestamp_is_stable(self):
+        """Testa que o mesmo diff pendente mantém o timestamp até o save"""
+        store = SchemaSnapshotStore(self.temp_dir)
+        schema = {'entities': [entity('Customer')], 'relationships': []}
+        diff = diff_schemas(None, schema)
+        pending = self.temp_dir / 'pending' / 'Shop.json'
+
+        timestamp = store.migration_timestamp('Shop', diff)
+        pending.write_text(pending.read_text().replace(timestamp, '20240101000000'))
+        self.assertEqual(store.migration_timestamp('Shop', diff), '20240101000000')
+
+        changed = diff_schemas(None, {'entities': [entity('Order')], 'relationships': []})
+        self.assertNotEqual(store.migration_timestamp('Shop', changed), '20240101000000')
+
+        store.save('Shop', schema)
+        self.assertFalse(pending.exists())
+
+    def test_projects_have_separate_snapshots(self):
+        """Testa que cada projeto tem seu snapshot, com nome de arquivo seguro"""
+        store = SchemaSnapshotStore(self.temp_dir)
+        store.save('Shop', {'entities': [entity('Customer')], 'relationships': []})
+
+        self.assertIsNone(store.load('Blog'))
+        self.assertEqual(store.path('../Acme/Shop').parent, self.temp_dir)
+        store.save('../Acme/Shop', {'entities': [], 'relationships': []})
+        self.assertEqual(store.load('../Acme/Shop')['entities'], [])
+        self.assertEqual(len(store.load('Shop')['entities']), 1)
+
+@unittest.skipIf(DatabaseAgent is None, "crewai não instalado")
+class TestDatabaseAgentMigrations(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.agent = DatabaseAgent(llm=None)
+        self.agent._snapshots = SchemaSnapshotStore(self.temp_dir)
+        self.schema = {'entities': [entity('Customer')], 'relationships': []}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def generate(self, schema, project='Shop'):
+        return asyncio.run(self.agent.generate_entity_framework(schema, project))
+
+    def test_retry_keeps_migration_until_committed(self):
+        """Testa que gerar de novo sem commit repete a migração"""
+        first = self.generate(self.schema)
+        pending = self.temp_dir / 'pending' / 'Shop.json'
+        timestamp = json.loads(pending.read_text())['timestamp']
+        pending.write_text(pending.read_text().replace(timestamp, '20240101000000'))
+        first['migrations'] = first['migrations'].replace(timestamp, '20240101000000')
+        retry = self.generate(self.schema)
+
+        self.assertIn('InitialCreate', first['migrations'])
+        self.assertEqual(retry['migrations'], first['migrations'])
+        self.assertEqual(retry['migration_sql'], first['migration_sql'])
+
+        self.agent.commit_migration(self.schema, 'Shop')
+        self.assertEqual(self.generate(self.schema)['migration_sql'], '')
+
+    def test_migrations_are_keyed_by_project(self):
+        """Testa que o snapshot de um projeto não afeta outro"""
+        self.agent.commit_migration(self.schema, 'Shop')
+
+        self.assertIn('InitialCreate', self.generate(self.schema, project='Blog')['migrations'])
+
+    def test_unmapped_requirement_type_warns(self):
+        """Testa o aviso para tipos de requisito sem mapeamento"""
+        with self.assertLogs('agents.specialized.database_agent', level='WARNING') as logs:
+            self.assertEqual(self.agent._map_to_csharp_type('integr'), 'object')
+        self.assertIn('integr', logs.output[0])
+        self.assertEqual(self.agent._map_to_csharp_type('Object'), 'object')
+
+    def test_project_defaults_to_schema_name(self):
+        """Testa a assinatura antiga, sem projeto: a chave é o nome do schema"""
+        schema = {**self.schema, 'name': 'Shop'}
+        self.agent.commit_migration(schema)
+
+        result = asyncio.run(self.agent.generate_entity_framework(schema))
+        self.assertEqual(result['migration_sql'], '')
+        self.assertIsNotNone(self.agent._snapshots.load('Shop'))
+
+if __name__ == '__main__':
+    unittest.main()
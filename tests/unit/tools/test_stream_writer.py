@@ -0,0 +1,155 @@
+# tests/unit/tools/test_stream_writer.py
+import unittest
+import threading
+import time
+
+from tools.wpf.stream_writer import (
+    FileBlockParser, StreamingProjectWriter, normalize_path, validate_file_block
+)
+
+AGENT_OUTPUT = '''Here is the view model.
+
+```csharp ViewModels/CustomerViewModel.cs
+public class CustomerViewModel
+{
+    public string Name { get; set; } = "{";
+}
+```
+
+File: Views/CustomerView.xaml
+```xml
+<UserControl x:Class="Demo.Views.CustomerView"
+             xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml" />
+```
+
+```
+// File: Models/Customer.cs
+public class Customer { }
+```
+
+```csharp
+var ignored = true;
+```
+'''
+
+class TestStreamWriter(unittest.TestCase):
+    def setUp(self):
+        self.files = {}
+        self.writer = StreamingProjectWriter(self.files.__setitem__)
+
+    def test_parser_handles_chunked_input(self):
+        """Testa a extração de blocos recebidos em partes"""
+        parser = FileBlockParser()
+        blocks = []
+        for i in range(0, len(AGENT_OUTPUT), 7):
+            blocks.extend(parser.feed(AGENT_OUTPUT[i:i + 7]))
+        blocks.extend(parser.close())
+
+        self.assertEqual(
+            [path for path, _ in blocks],
+            ['ViewModels/CustomerViewModel.cs', 'Views/CustomerView.xaml', 'Models/Customer.cs']
+        )
+        self.assertEqual(blocks[2][1], 'public class Customer { }\n')
+
+    def test_files_written_as_soon_as_blocks_close(self):
+        """Testa a gravação imediata de cada bloco concluído"""
+        head, tail = AGENT_OUTPUT.split('File: Views')
+        self.assertEqual(self.writer.feed('wpf', head), ['ViewModels/CustomerViewModel.cs'])
+        self.assertIsNotNone(self.writer.first_file_time)
+
+        self.writer.feed('wpf', 'File: Views' + tail)
+        self.writer.finish('wpf')
+        self.assertEqual(len(self.files), 3)
+        self.assertEqual(self.writer.written['Models/Customer.cs'], 'wpf')
+
+    def test_invalid_blocks_are_rejected(self):
+        """Testa a validação antes da gravação"""
+        self.writer.feed('api', '```csharp Services/Broken.cs\npublic class Broken {\n```\n')
+        self.writer.feed('api', '```xml Views/Broken.xaml\n<Grid>\n```\n')
+        self.writer.feed('api', '```csharp ../../etc/evil.cs\nclass A { }\n```\n')
+        self.writer.finish('api')
+
+        self.assertEqual(self.files, {})
+        self.assertEqual(
+            [rejected['path'] for rejected in self.writer.stats()['rejected']],
+            ['Services/Broken.cs', 'Views/Broken.xaml', '../../etc/evil.cs']
+        )
+
+    def test_task_callback_merges_streamed_output(self):
+        """Testa que a saída final só grava o que não chegou por streaming"""
+        writes = []
+        writer = StreamingProjectWriter(lambda path, content: writes.append(path))
+        head = AGENT_OUTPUT.split('File: Views')[0]
+        writer.feed('wpf', head)
+        writer.feed('wpf', '```csharp Services/Broken.cs\npublic class Broken {\n```\n')
+        writer.finish('wpf')
+
+        writer.task_callback('wpf')(type('Output', (), {'raw': AGENT_OUTPUT})())
+
+        self.assertEqual(
+            writes,
+            ['ViewModels/CustomerViewModel.cs', 'Views/CustomerView.xaml', 'Models/Customer.cs']
+        )
+        self.assertEqual(len(writer.stats()['rejected']), 1)
+
+    def test_sources_write_concurrently(self):
+        """Testa que a gravação (lenta) de uma origem não bloqueia as outras"""
+        def slow_write(path, content):
+            time.sleep(0.2)
+            self.files[path] = content
+        writer = StreamingProjectWriter(slow_write)
+        threads = [
+            threading.Thread(target=writer.feed, args=(
+                f"task{i}", f"```csharp Models/Model{i}.cs\npublic class Model{i} {{ }}\n```\n"
+            ))
+            for i in range(4)
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertEqual(sorted(self.files), [f"Models/Model{i}.cs" for i in range(4)])
+
+    def test_latest_content_wins_for_the_same_path(self):
+        """Testa que uma gravação antiga não sobrescreve o conteúdo mais recente"""
+        first_started = threading.Event()
+        release = threading.Event()
+
+        def write(path, content):
+            if 'Old' in content:
+                first_started.set()
+                release.wait(1)
+            self.files[path] = content
+        writer = StreamingProjectWriter(write)
+
+        old = threading.Thread(target=writer.feed, args=(
+            'wpf', "```csharp Models/Shared.cs\npublic class Old { }\n```\n"
+        ))
+        old.start()
+        first_started.wait(1)
+        new = threading.Thread(target=writer.feed, args=(
+            'api', "```csharp Models/Shared.cs\npublic class New { }\n```\n"
+        ))
+        new.start()
+        time.sleep(0.05)
+        release.set()
+        old.join()
+        new.join()
+
+        self.assertEqual(self.files['Models/Shared.cs'], "public class New { }\n")
+        self.assertEqual(writer.written['Models/Shared.cs'], 'api')
+
+    def test_validation_helpers(self):
+        """Testa normalização de caminhos e validação de conteúdo"""
+        self.assertEqual(normalize_path('Views\\Main.xaml'), 'Views/Main.xaml')
+        self.assertIsNone(normalize_path('/etc/passwd'))
+        self.assertIsNone(normalize_path('C:/temp/a.cs'))
+        self.assertIsNone(validate_file_block('A.cs', 'class A { /* } */ }'))
+        self.assertIsNotNone(validate_file_block('script.ps1', 'rm -rf'))
+
+if __name__ == '__main__':
+    unittest.main()
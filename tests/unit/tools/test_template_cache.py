@@ -0,0 +1,81 @@
+# tests/unit/tools/test_template_cache.py
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from tools.wpf.generators.template_cache import ProjectTypeTemplateCache
+from tools.wpf.generators.template_manager import TemplateManager
+
+class TestProjectTypeTemplateCache(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "kanban").mkdir()
+        (self.temp_dir / "kanban" / "Board.xaml").write_text("<Grid />", encoding='utf-8')
+        self.cache = ProjectTypeTemplateCache(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_loads_lazily_and_reuses(self):
+        """Testa que nada é lido na construção e o tipo é lido uma única vez"""
+        self.assertEqual(self.cache.loads, 0)
+
+        self.assertEqual(self.cache.get("kanban"), {"Board": "<Grid />"})
+        self.assertEqual(self.cache.get("kanban"), {"Board": "<Grid />"})
+        self.assertEqual(self.cache.loads, 1)
+
+    def test_reloads_when_templates_change(self):
+        """Testa a invalidação por mtime e por arquivos adicionados"""
+        self.cache.get("kanban")
+        board = self.temp_dir / "kanban" / "Board.xaml"
+        board.write_text("<StackPanel />", encoding='utf-8')
+        stat = board.stat()
+        os.utime(board, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (self.temp_dir / "kanban" / "Card.xaml").write_text("<Border />", encoding='utf-8')
+
+        self.assertEqual(
+            self.cache.get("kanban"),
+            {"Board": "<StackPanel />", "Card": "<Border />"}
+        )
+        self.assertEqual(self.cache.loads, 2)
+
+    def test_unknown_type_returns_empty(self):
+        """Testa tipo sem diretório de templates"""
+        self.assertEqual(self.cache.get("report"), {})
+
+class TestTemplateManager(unittest.TestCase):
+    def test_base_templates_are_memoized_per_project(self):
+        """Testa que o projeto é renderizado uma vez e devolvido como cópia"""
+        manager = TemplateManager()
+        first = manager.get_base_templates("Sample")
+        first["App.xaml"] = "alterado"
+
+        second = manager.get_base_templates("Sample")
+        self.assertEqual(second, manager._render_base_templates("Sample"))
+        self.assertIn("Sample.csproj", second)
+        self.assertIs(
+            manager.get_base_templates("Other")["Styles/Theme.xaml"],
+            second["Styles/Theme.xaml"]
+        )
+
+    def test_memo_is_bounded(self):
+        """Testa que o memo por projeto descarta o menos usado recentemente"""
+        manager = TemplateManager(max_rendered=2)
+        manager.get_base_templates("First")
+        manager.get_base_templates("Second")
+        manager.get_base_templates("First")
+
+        for i in range(10):
+            manager.get_base_templates(f"Project{i}")
+        self.assertEqual(list(manager._rendered), ["Project8", "Project9"])
+
+        manager.get_base_templates("First")
+        manager.get_base_templates("Project9")
+        self.assertEqual(list(manager._rendered), ["First", "Project9"])
+        self.assertIn("First.csproj", manager.get_base_templates("First"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# tests/unit/tools/test_template_registry.py
+import unittest
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from tools.code.template_registry import TemplateRegistry
+except ImportError:  # jinja2 não instalado
+    TemplateRegistry = None
+
+@unittest.skipIf(TemplateRegistry is None, "jinja2 não instalado")
+class TestTemplateRegistry(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.templates_dir = self.temp_dir / 'templates'
+        self.templates_dir.mkdir()
+        (self.templates_dir / 'view.xaml').write_text('<UserControl x:Name="{{ name }}" />', encoding='utf-8')
+        self.cache_dir = self.temp_dir / 'cache'
+        self.registry = TemplateRegistry(str(self.cache_dir), max_templates=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _render(self, registry, name='Main'):
+        return registry.get_template(str(self.templates_dir), 'view.xaml').render(name=name)
+
+    def test_environment_is_shared_per_root_and_options(self):
+        """Testa o compartilhamento do environment"""
+        first = self.registry.environment(str(self.templates_dir))
+        self.assertIs(first, self.registry.environment(str(self.templates_dir) + '/'))
+        self.assertIsNot(first, self.registry.environment(str(self.templates_dir), trim_blocks=True))
+        self.assertEqual(first.cache.capacity, 2)
+
+    def test_warm_rendering_does_not_compile(self):
+        """Testa que renderizações seguintes reutilizam o template compilado"""
+        self.assertEqual(self._render(self.registry), '<UserControl x:Name="Main" />')
+        self._render(self.registry, 'Other')
+        self.assertEqual(self.registry.stats()['compilations'], 1)
+
+    def test_bytecode_cache_survives_new_registry(self):
+        """Testa que um novo processo (registro) carrega o bytecode do disco"""
+        self._render(self.registry)
+        fresh = TemplateRegistry(str(self.cache_dir))
+        self.assertEqual(self._render(fresh), '<UserControl x:Name="Main" />')
+        self.assertEqual(fresh.stats()['compilations'], 0)
+
+    def test_changed_template_is_reloaded(self):
+        """Testa a recarga automática pelo mtime"""
+        self._render(self.registry)
+        template = self.templates_dir / 'view.xaml'
+        template.write_text('<Grid x:Name="{{ name }}" />', encoding='utf-8')
+        mtime = time.time() + 5
+        os.utime(template, (mtime, mtime))
+
+        self.assertEqual(self._render(self.registry), '<Grid x:Name="Main" />')
+        self.assertEqual(self.registry.stats()['compilations'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
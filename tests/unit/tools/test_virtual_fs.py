@@ -0,0 +1,99 @@
+# tests/unit/tools/test_virtual_fs.py
+import unittest
+import asyncio
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+
+from tools.wpf.virtual_fs import VirtualFileSystem
+from tools.wpf.project_generator import WPFProjectGenerator
+from integrations.visual_studio.code_generator import VSCodeGenerator
+
+class TestVirtualFileSystem(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.fs = VirtualFileSystem()
+        self.fs.write("App/Views/MainWindow.xaml", "<Window />")
+        self.fs.write("App/App.xaml.cs", "namespace App {}")
+        self.fs.mkdir("App/Models")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_rejects_paths_outside_tree(self):
+        """Testa caminhos absolutos e com '..'"""
+        for path in ("/etc/passwd", "../fora.cs", "C:/App.cs"):
+            with self.assertRaises(ValueError):
+                self.fs.write(path, "x")
+
+    def test_zip_export_is_reproducible(self):
+        """Testa o zip gerado em memória e a reprodutibilidade"""
+        first, second = io.BytesIO(), io.BytesIO()
+        self.fs.write_zip(first)
+        self.fs.write_zip(second)
+        self.assertEqual(first.getvalue(), second.getvalue())
+
+        with zipfile.ZipFile(first) as archive:
+            self.assertIn("App/Models/", archive.namelist())
+            self.assertEqual(archive.read("App/Views/MainWindow.xaml"), b"<Window />")
+
+    def test_tar_export_streams_to_file(self):
+        """Testa a exportação tar.gz com formato deduzido da extensão"""
+        result = self.fs.export(self.temp_dir / "project.tar.gz")
+
+        self.assertEqual(result['format'], 'tar:gz')
+        self.assertEqual(result['file_count'], 2)
+        with tarfile.open(result['path']) as archive:
+            self.assertEqual(archive.extractfile("App/App.xaml.cs").read(), b"namespace App {}")
+            self.assertTrue(archive.getmember("App/Models").isdir())
+
+    def test_flush_writes_tree_to_disk(self):
+        """Testa a descarga da árvore no disco"""
+        manifest = self.fs.flush(self.temp_dir)
+
+        self.assertEqual(manifest['file_count'], 2)
+        self.assertTrue((self.temp_dir / "App" / "Models").is_dir())
+        self.assertEqual(
+            (self.temp_dir / "App" / "Views" / "MainWindow.xaml").read_text(encoding='utf-8'),
+            "<Window />"
+        )
+
+class TestVirtualTargets(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.previous_dir = os.getcwd()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_project_generator_writes_only_to_memory(self):
+        """Testa a geração do projeto WPF sem I/O de disco"""
+        fs = VirtualFileSystem()
+        generator = WPFProjectGenerator(target=fs)
+        result = asyncio.run(generator.generate_project({'metadata': {'name': 'Sample'}}))
+
+        self.assertEqual(result['status'], 'success')
+        self.assertTrue(result['virtual'])
+        self.assertTrue(fs.exists("Sample/Sample.csproj"))
+        self.assertIn("Sample/Properties", fs.directories())
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_vs_generator_writes_to_virtual_fs(self):
+        """Testa o gerador do Visual Studio com destino virtual"""
+        fs = VirtualFileSystem()
+        generator = VSCodeGenerator(fs=fs)
+        generator.save_snippet("Prop", "<CodeSnippets />")
+
+        self.assertEqual(fs.read_text("Snippets/Prop.snippet"), "<CodeSnippets />")
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
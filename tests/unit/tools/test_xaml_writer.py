@@ -0,0 +1,97 @@
+# tests/unit/tools/test_xaml_writer.py
+import unittest
+import io
+import time
+import xml.dom.minidom as minidom
+import xml.etree.ElementTree as ET
+
+from tools.wpf.xaml_generator import XamlGenerator
+from tools.wpf.xaml_writer import XamlWriter, format_xaml
+
+def minidom_format(element: ET.Element) -> str:
+    """Formatação anterior (referência)"""
+    return minidom.parseString(ET.tostring(element, encoding='unicode')).toprettyxml(indent="    ")
+
+class TestXamlWriter(unittest.TestCase):
+    def setUp(self):
+        """Setup para cada teste"""
+        self.generator = XamlGenerator()
+        self.window_config = {
+            'window_properties': {'Title': 'Main & "Demo"', 'Width': 800, 'Height': 600},
+            'layout': {
+                'type': 'Grid',
+                'rows': [{'height': 1}, {'height': 2}],
+                'columns': [{'width': 1}],
+                'controls': [
+                    {
+                        'type': 'TextBox',
+                        'properties': {'Margin': '5', 'ToolTip': 'a < b\nline two'},
+                        'grid_position': {'row': i % 2, 'column': 0},
+                        'bindings': {'Text': f"Items[{i}].Name, Mode=TwoWay"}
+                    }
+                    for i in range(50)
+                ]
+            }
+        }
+
+    def test_identical_to_minidom_for_window(self):
+        """Testa saída idêntica à formatação anterior"""
+        root = self.generator._build_window(self.window_config)
+        self.assertEqual(self.generator.generate_window(self.window_config), minidom_format(root))
+
+    def test_identical_to_minidom_for_text_tails_and_comments(self):
+        """Testa textos, caudas e comentários"""
+        root = ET.Element('StackPanel', {'Name': 'Panel'})
+        label = ET.SubElement(root, 'TextBlock')
+        label.text = 'Olá <mundo> & "todos"'
+        label.tail = '  '
+        root.append(ET.Comment(' controles '))
+        mixed = ET.SubElement(root, 'Span')
+        mixed.text = 'antes'
+        bold = ET.SubElement(mixed, 'Bold')
+        bold.text = 'meio'
+        bold.tail = 'depois'
+        ET.SubElement(mixed, 'LineBreak')
+        ET.SubElement(root, 'Button', {'Content': 'Tab\there'})
+
+        self.assertEqual(format_xaml(root), minidom_format(root))
+
+    def test_builder_events_match_tree(self):
+        """Testa a escrita por eventos, sem árvore em memória"""
+        buffer = io.StringIO()
+        writer = XamlWriter(buffer)
+        writer.declaration()
+        writer.start('Grid', {'Margin': '5'})
+        writer.element('TextBlock', {'Text': 'a'}, text='conteúdo')
+        writer.element('Button', [('Content', 'OK')])
+        writer.end()
+
+        root = ET.Element('Grid', {'Margin': '5'})
+        ET.SubElement(root, 'TextBlock', {'Text': 'a'}).text = 'conteúdo'
+        ET.SubElement(root, 'Button', {'Content': 'OK'})
+        self.assertEqual(buffer.getvalue(), minidom_format(root))
+
+    def test_write_window_to_stream(self):
+        """Testa a escrita direta em stream"""
+        buffer = io.StringIO()
+        self.generator.write_window(self.window_config, buffer)
+        self.assertEqual(buffer.getvalue(), self.generator.generate_window(self.window_config))
+
+    def test_large_view_is_faster_than_minidom(self):
+        """Testa o ganho em views com milhares de controles"""
+        self.window_config['layout']['controls'] *= 100
+        root = self.generator._build_window(self.window_config)
+
+        start = time.perf_counter()
+        expected = minidom_format(root)
+        minidom_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        output = format_xaml(root)
+        writer_time = time.perf_counter() - start
+
+        self.assertEqual(output, expected)
+        self.assertLess(writer_time * 2, minidom_time)
+
+if __name__ == '__main__':
+    unittest.main()
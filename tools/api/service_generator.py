@@ -1,8 +1,46 @@
 # tools/api/service_generator.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
+import io
 import json
 
+from tools.wpf.file_emitter import FileEmitter
+
+INTERFACE_USINGS = [
+    "using System;",
+    "using System.Collections.Generic;",
+    "using System.Threading.Tasks;",
+    "using YourNamespace.DTOs;",
+    ""
+]
+IMPLEMENTATION_USINGS = [
+    "using System;",
+    "using System.Collections.Generic;",
+    "using System.Threading.Tasks;",
+    "using AutoMapper;",
+    "using Microsoft.Extensions.Logging;",
+    "using YourNamespace.DTOs;",
+    "using YourNamespace.Entities;",
+    "using YourNamespace.Repositories;",
+    ""
+]
+DTO_USINGS = [
+    "using System;",
+    "using System.ComponentModel.DataAnnotations;",
+    ""
+]
+VALIDATOR_USINGS = [
+    "using FluentValidation;",
+    "using YourNamespace.DTOs;",
+    ""
+]
+
+# Fragmentos comuns a todos os serviços, montados uma única vez
+_INTERFACE_HEADER = "\n".join(INTERFACE_USINGS) + "\n"
+_IMPLEMENTATION_HEADER = "\n".join(IMPLEMENTATION_USINGS) + "\n"
+_DTO_HEADER = "\n".join(DTO_USINGS) + "\n"
+_VALIDATOR_HEADER = "\n".join(VALIDATOR_USINGS) + "\n"
+
 class ServiceGenerator:
     def __init__(self):
         self.output_path = Path("output/services")
@@ -17,18 +55,85 @@ class ServiceGenerator:
             'validator': self.generate_validator(service_config)
         }
 
+    def generate_services(self, services: List[Dict]) -> Dict[str, Dict[str, Any]]:
+        """Gera vários serviços de uma vez (nome -> arquivos de `generate_service`).
+
+        Os usings e demais fragmentos comuns são montados uma única vez e
+        cada arquivo é escrito em um único buffer.
+        """
+        return {config['name']: self._build_service(config) for config in services}
+
+    def save_services(self, services_code: Dict[str, Dict[str, Any]], root: Optional[Path] = None,
+                      max_workers: int = None) -> Dict[str, Any]:
+        """Grava os serviços em lote, um diretório por serviço; retorna o manifesto"""
+        root = Path(root) if root is not None else self.output_path
+        files = {}
+        for name, service_code in services_code.items():
+            for file_name, content in service_code.items():
+                if isinstance(content, dict):
+                    # DTOs: um arquivo por classe
+                    for dto_name, dto_code in content.items():
+                        files[f"{name}/DTOs/{dto_name}.cs"] = dto_code
+                else:
+                    files[f"{name}/{file_name}.cs"] = content
+        return FileEmitter(max_workers).emit(root, files)
+
+    def _build_service(self, config: Dict) -> Dict[str, Any]:
+        name = config['name']
+        namespace = config.get('namespace', 'YourNamespace.Services')
+        methods = config.get('methods', [])
+        dtos = config.get('dtos', [])
+
+        out = io.StringIO()
+        out.write(f"{_INTERFACE_HEADER}namespace {namespace}\n{{\n    public interface I{name}Service\n    {{\n")
+        for method in methods:
+            out.write(self._generate_interface_method(method)[0])
+            out.write("\n")
+        out.write("    }\n}")
+        interface = out.getvalue()
+
+        out = io.StringIO()
+        out.write(f"{_IMPLEMENTATION_HEADER}namespace {namespace}\n{{\n")
+        out.write(f"    public class {name}Service : I{name}Service\n    {{\n")
+        for lines in (self._generate_dependencies(config), self._generate_constructor(config),
+                      *(self._generate_implementation_method(method) for method in methods)):
+            out.write("\n".join(lines))
+            out.write("\n")
+        out.write("    }\n}")
+        implementation = out.getvalue()
+
+        dto_namespace = f"{_DTO_HEADER}namespace {config.get('namespace', 'YourNamespace')}.DTOs\n{{\n"
+        dto_code = {}
+        for dto in dtos:
+            out = io.StringIO()
+            out.write(f"{dto_namespace}    public class {dto['name']}\n    {{\n")
+            for prop in dto.get('properties', []):
+                out.write("\n".join(self._generate_dto_property(prop)))
+                out.write("\n")
+            out.write("    }\n}")
+            dto_code[dto['name']] = out.getvalue()
+
+        out = io.StringIO()
+        out.write(f"{_VALIDATOR_HEADER}namespace {config.get('namespace', 'YourNamespace.Validators')}\n{{\n")
+        for dto in dtos:
+            out.write("\n".join(self._generate_dto_validator(dto)))
+            out.write("\n")
+        out.write("}")
+        validator = out.getvalue()
+
+        return {
+            'interface': interface,
+            'implementation': implementation,
+            'dto': dto_code,
+            'validator': validator
+        }
+
     def generate_interface(self, config: Dict) -> str:
         """Gera código para a interface do serviço"""
         code = []
         
         # Imports
-        code.extend([
-            "using System;",
-            "using System.Collections.Generic;",
-            "using System.Threading.Tasks;",
-            "using YourNamespace.DTOs;",
-            ""
-        ])
+        code.extend(INTERFACE_USINGS)
 
         # Interface
         code.append(f"namespace {config.get('namespace', 'YourNamespace.Services')}")
@@ -50,17 +155,7 @@ class ServiceGenerator:
         code = []
         
         # Imports
-        code.extend([
-            "using System;",
-            "using System.Collections.Generic;",
-            "using System.Threading.Tasks;",
-            "using AutoMapper;",
-            "using Microsoft.Extensions.Logging;",
-            "using YourNamespace.DTOs;",
-            "using YourNamespace.Entities;",
-            "using YourNamespace.Repositories;",
-            ""
-        ])
+        code.extend(IMPLEMENTATION_USINGS)
 
         # Classe
         code.append(f"namespace {config.get('namespace', 'YourNamespace.Services')}")
@@ -91,11 +186,7 @@ class ServiceGenerator:
             code = []
             
             # Imports
-            code.extend([
-                "using System;",
-                "using System.ComponentModel.DataAnnotations;",
-                ""
-            ])
+            code.extend(DTO_USINGS)
 
             # Classe DTO
             code.append(f"namespace {config.get('namespace', 'YourNamespace')}.DTOs")
@@ -119,11 +210,7 @@ class ServiceGenerator:
         code = []
         
         # Imports
-        code.extend([
-            "using FluentValidation;",
-            "using YourNamespace.DTOs;",
-            ""
-        ])
+        code.extend(VALIDATOR_USINGS)
 
         # Classe Validator
         code.append(f"namespace {config.get('namespace', 'YourNamespace.Validators')}")
@@ -1,14 +1,14 @@
 # tools/code/generator.py
 from typing import Dict, Optional, List
 from pathlib import Path
-import jinja2
 import os
 
+from .template_registry import get_environment
+
 class CodeGenerator:
     def __init__(self, templates_dir: str = "templates"):
-        self.template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(templates_dir)
-        )
+        # Environment compartilhado: templates compilados uma vez por processo
+        self.template_env = get_environment(templates_dir)
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
 
@@ -0,0 +1,77 @@
+# tools/code/template_registry.py
+from typing import Dict, Any, Tuple
+from pathlib import Path
+import hashlib
+import threading
+import jinja2
+
+class _CountingEnvironment(jinja2.Environment):
+    """Environment que conta as compilações de templates (sem bytecode em cache)"""
+
+    compilations = 0
+
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        if not raw:
+            self.compilations += 1
+        return super().compile(source, name, filename, raw, defer_init)
+
+class TemplateRegistry:
+    """Environments Jinja compartilhados pelo processo, um por raiz de templates.
+
+    Cada environment usa `FileSystemBytecodeCache` (templates não são
+    recompilados entre execuções), `auto_reload` (alterações são detectadas
+    pelo mtime do arquivo) e mantém um LRU limitado de templates compilados.
+    """
+
+    def __init__(self, cache_dir: str = 'cache/jinja', max_templates: int = 256):
+        self.cache_dir = Path(cache_dir)
+        self.max_templates = max_templates
+        self.lock = threading.Lock()
+        self._environments: Dict[Tuple, jinja2.Environment] = {}
+
+    def environment(self, templates_dir: str, **options: Any) -> jinja2.Environment:
+        """Environment compartilhado para a raiz e as opções informadas"""
+        root = str(Path(templates_dir).resolve())
+        key = (root, tuple(sorted(options.items())))
+
+        with self.lock:
+            environment = self._environments.get(key)
+            if environment is None:
+                environment = _CountingEnvironment(
+                    loader=jinja2.FileSystemLoader(root),
+                    bytecode_cache=self._bytecode_cache(root),
+                    auto_reload=True,
+                    cache_size=self.max_templates,
+                    **options
+                )
+                self._environments[key] = environment
+            return environment
+
+    def get_template(self, templates_dir: str, name: str, **options: Any) -> jinja2.Template:
+        return self.environment(templates_dir, **options).get_template(name)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            environments = list(self._environments.values())
+        return {
+            'environments': len(environments),
+            'compilations': sum(environment.compilations for environment in environments),
+            'cached_templates': sum(len(environment.cache or {}) for environment in environments)
+        }
+
+    def clear(self) -> None:
+        """Descarta os environments (o bytecode em disco é mantido)"""
+        with self.lock:
+            self._environments.clear()
+
+    def _bytecode_cache(self, root: str) -> jinja2.FileSystemBytecodeCache:
+        directory = self.cache_dir / hashlib.sha256(root.encode('utf-8')).hexdigest()[:16]
+        directory.mkdir(parents=True, exist_ok=True)
+        return jinja2.FileSystemBytecodeCache(str(directory))
+
+# Registro compartilhado por todos os geradores do processo
+template_registry = TemplateRegistry()
+
+def get_environment(templates_dir: str, **options: Any) -> jinja2.Environment:
+    """Environment compartilhado do registro padrão"""
+    return template_registry.environment(templates_dir, **options)
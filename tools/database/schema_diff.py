@@ -0,0 +1,469 @@
+# tools/database/schema_diff.py
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from datetime import datetime
+import hashlib
+import json
+import re
+
+# Atributos de coluna que, se alterados, geram AlterColumn
+COLUMN_ATTRIBUTES = ('type', 'nullable', 'max_length', 'precision', 'scale', 'default_value')
+
+# Tipos C# -> SQL Server (string e decimal dependem do tamanho/precisão);
+# `object` é o fallback explícito do DatabaseAgent para tipos não mapeados
+SQL_TYPES = {
+    'int': 'int',
+    'long': 'bigint',
+    'short': 'smallint',
+    'byte': 'tinyint',
+    'bool': 'bit',
+    'double': 'float',
+    'float': 'real',
+    'DateTime': 'datetime2',
+    'DateTimeOffset': 'datetimeoffset',
+    'TimeSpan': 'time',
+    'Guid': 'uniqueidentifier',
+    'byte[]': 'varbinary(max)',
+    'object': 'sql_variant'
+}
+
+RelationshipKey = Tuple[str, str, str]
+
+def table_name(entity_name: str) -> str:
+    """Nome da tabela de uma entidade (mesma convenção do DbContext gerado)"""
+    return f"{entity_name}s"
+
+def relationship_key(relationship: Dict) -> RelationshipKey:
+    return (relationship['from_entity'], relationship['to_entity'], relationship['type'])
+
+@dataclass
+class SchemaDiff:
+    """Diferença estrutural entre dois schemas do DatabaseAgent"""
+    created_entities: List[Dict] = field(default_factory=list)
+    dropped_entities: List[Dict] = field(default_factory=list)
+    # tabela -> propriedades
+    added_columns: Dict[str, List[Dict]] = field(default_factory=dict)
+    dropped_columns: Dict[str, List[Dict]] = field(default_factory=dict)
+    # tabela -> [(antes, depois)]
+    altered_columns: Dict[str, List[Tuple[Dict, Dict]]] = field(default_factory=dict)
+    added_relationships: List[Dict] = field(default_factory=list)
+    dropped_relationships: List[Dict] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not any((
+            self.created_entities, self.dropped_entities, self.added_columns,
+            self.dropped_columns, self.altered_columns,
+            self.added_relationships, self.dropped_relationships
+        ))
+
+    def relationships_to_drop(self) -> List[Dict]:
+        """Relacionamentos removidos cuja FK não some junto com a tabela dependente"""
+        dropped_tables = {table_name(entity['name']) for entity in self.dropped_entities}
+        return [
+            rel for rel in self.dropped_relationships
+            if rel['type'] == 'ManyToMany' or _foreign_key(rel)['table'] not in dropped_tables
+        ]
+
+    def fingerprint(self) -> str:
+        """Hash estável das operações do diff"""
+        payload = json.dumps(asdict(self), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'created_tables': len(self.created_entities),
+            'dropped_tables': len(self.dropped_entities),
+            'added_columns': sum(len(columns) for columns in self.added_columns.values()),
+            'dropped_columns': sum(len(columns) for columns in self.dropped_columns.values()),
+            'altered_columns': sum(len(columns) for columns in self.altered_columns.values()),
+            'added_relationships': len(self.added_relationships),
+            'dropped_relationships': len(self.dropped_relationships)
+        }
+
+def diff_schemas(previous: Optional[Dict], current: Dict) -> SchemaDiff:
+    """Compara entidades, colunas e relacionamentos (sem schema anterior: tudo é criado).
+
+    Renomear uma entidade ou propriedade aparece como remoção + adição.
+    """
+    previous = previous or {}
+    old_entities = {entity['name']: entity for entity in previous.get('entities', [])}
+    new_entities = {entity['name']: entity for entity in current.get('entities', [])}
+    diff = SchemaDiff()
+
+    for name, entity in new_entities.items():
+        if name not in old_entities:
+            diff.created_entities.append(entity)
+            continue
+
+        table = table_name(name)
+        old_columns = {prop['name']: prop for prop in old_entities[name].get('properties', [])}
+        new_columns = {prop['name']: prop for prop in entity.get('properties', [])}
+
+        added = [prop for column, prop in new_columns.items() if column not in old_columns]
+        dropped = [prop for column, prop in old_columns.items() if column not in new_columns]
+        altered = [
+            (old_columns[column], prop) for column, prop in new_columns.items()
+            if column in old_columns and _column_changed(old_columns[column], prop)
+        ]
+        if added:
+            diff.added_columns[table] = added
+        if dropped:
+            diff.dropped_columns[table] = dropped
+        if altered:
+            diff.altered_columns[table] = altered
+
+    diff.dropped_entities = [
+        entity for name, entity in old_entities.items() if name not in new_entities
+    ]
+
+    old_relationships = {relationship_key(rel): rel for rel in previous.get('relationships', [])}
+    new_relationships = {relationship_key(rel): rel for rel in current.get('relationships', [])}
+    for key, rel in new_relationships.items():
+        old = old_relationships.get(key)
+        if old is None:
+            diff.added_relationships.append(rel)
+        elif bool(old.get('cascade_delete')) != bool(rel.get('cascade_delete')):
+            # Mudança de cascata: a FK é recriada
+            diff.dropped_relationships.append(old)
+            diff.added_relationships.append(rel)
+    diff.dropped_relationships.extend(
+        rel for key, rel in old_relationships.items() if key not in new_relationships
+    )
+    return diff
+
+def _column_changed(old: Dict, new: Dict) -> bool:
+    return any(old.get(attribute) != new.get(attribute) for attribute in COLUMN_ATTRIBUTES)
+
+def _primary_keys(entity: Dict) -> List[str]:
+    keys = [key if isinstance(key, str) else key.get('name') for key in entity.get('keys') or []]
+    keys = [key for key in keys if key]
+    if not keys and any(prop['name'] == 'Id' for prop in entity.get('properties', [])):
+        keys = ['Id']
+    return keys
+
+def _foreign_key(rel: Dict) -> Dict[str, str]:
+    """Tabela dependente, coluna e tabela principal da FK de um relacionamento"""
+    if rel['type'] == 'OneToMany':
+        dependent, principal = rel['to_entity'], rel['from_entity']
+    else:
+        dependent, principal = rel['from_entity'], rel['to_entity']
+    column = f"{principal}Id"
+    table = table_name(dependent)
+    principal_table = table_name(principal)
+    return {
+        'name': f"FK_{table}_{principal_table}_{column}",
+        'table': table,
+        'column': column,
+        'principal_table': principal_table
+    }
+
+def _join_table(rel: Dict) -> str:
+    return f"{rel['from_entity']}{rel['to_entity']}"
+
+# Caracteres trocados por '_' no nome do arquivo de snapshot
+_UNSAFE_FILENAME = re.compile(r'[^\w.-]')
+
+class SchemaSnapshotStore:
+    """Último schema aplicado de cada projeto, usado como base do próximo diff.
+
+    Guarda também o timestamp da migração ainda não aplicada (`pending/`),
+    para que regenerar o mesmo diff produza a mesma classe de migração.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, project: str) -> Path:
+        """Arquivo do snapshot do projeto (nome sanitizado)"""
+        return self.root / f"{_UNSAFE_FILENAME.sub('_', project)}.json"
+
+    def migration_timestamp(self, project: str, diff: SchemaDiff) -> str:
+        """Timestamp da migração pendente do diff, mantido até o próximo `save`"""
+        path = self.root / 'pending' / self.path(project).name
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                pending = json.load(f)
+        except (OSError, ValueError):
+            pending = {}
+
+        fingerprint = diff.fingerprint()
+        if pending.get('diff') != fingerprint:
+            pending = {'diff': fingerprint, 'timestamp': datetime.now().strftime("%Y%m%d%H%M%S")}
+            path.parent.mkdir(exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(pending, f)
+        return pending['timestamp']
+
+    def load(self, project: str) -> Optional[Dict]:
+        try:
+            with open(self.path(project), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, project: str, schema: Dict) -> None:
+        snapshot = {
+            'entities': schema.get('entities', []),
+            'relationships': schema.get('relationships', [])
+        }
+        with open(self.path(project), 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=4, sort_keys=True, default=str)
+        (self.root / 'pending' / self.path(project).name).unlink(missing_ok=True)
+
+class MigrationGenerator:
+    """Gera o DDL (SQL Server) e a migration do EF Core apenas com as operações do diff"""
+
+    def sql_script(self, diff: SchemaDiff) -> str:
+        statements = []
+        for rel in diff.relationships_to_drop():
+            if rel['type'] == 'ManyToMany':
+                statements.append(f"DROP TABLE [{_join_table(rel)}];")
+            else:
+                fk = _foreign_key(rel)
+                statements.append(f"ALTER TABLE [{fk['table']}] DROP CONSTRAINT [{fk['name']}];")
+                statements.append(f"ALTER TABLE [{fk['table']}] DROP COLUMN [{fk['column']}];")
+        for table, columns in diff.dropped_columns.items():
+            for prop in columns:
+                statements.append(f"ALTER TABLE [{table}] DROP COLUMN [{prop['name']}];")
+        for entity in diff.dropped_entities:
+            statements.append(f"DROP TABLE [{table_name(entity['name'])}];")
+
+        for entity in diff.created_entities:
+            statements.append(self._sql_create_table(entity))
+        for table, columns in diff.added_columns.items():
+            for prop in columns:
+                statements.append(f"ALTER TABLE [{table}] ADD {self._sql_column(prop)};")
+        for table, columns in diff.altered_columns.items():
+            for _, prop in columns:
+                statements.append(
+                    f"ALTER TABLE [{table}] ALTER COLUMN [{prop['name']}] "
+                    f"{self._sql_type(prop)}{self._sql_null(prop)};"
+                )
+        for rel in diff.added_relationships:
+            statements.extend(self._sql_add_relationship(rel))
+        return "\n".join(statements)
+
+    def ef_migration(self, diff: SchemaDiff, name: str,
+                     timestamp: Optional[str] = None, namespace: str = 'YourNamespace.Migrations') -> str:
+        """Classe `Migration` com Up (operações do diff) e Down (inverso)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d%H%M%S")
+        up = self._indent(self._ef_up(diff))
+        down = self._indent(self._ef_down(diff))
+        return f"""using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+namespace {namespace}
+{{
+    public partial class {name}_{timestamp} : Migration
+    {{
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {{
+{up}
+        }}
+
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {{
+{down}
+        }}
+    }}
+}}
+"""
+
+    def _ef_up(self, diff: SchemaDiff) -> List[str]:
+        operations = []
+        for rel in diff.relationships_to_drop():
+            operations.extend(self._ef_drop_relationship(rel))
+        for table, columns in diff.dropped_columns.items():
+            operations.extend(self._ef_drop_column(table, prop['name']) for prop in columns)
+        for entity in diff.dropped_entities:
+            operations.append(self._ef_drop_table(table_name(entity['name'])))
+        for entity in diff.created_entities:
+            operations.append(self._ef_create_table(entity))
+        for table, columns in diff.added_columns.items():
+            operations.extend(self._ef_add_column(table, prop) for prop in columns)
+        for table, columns in diff.altered_columns.items():
+            operations.extend(self._ef_alter_column(table, new, old) for old, new in columns)
+        for rel in diff.added_relationships:
+            operations.extend(self._ef_add_relationship(rel))
+        return operations
+
+    def _ef_down(self, diff: SchemaDiff) -> List[str]:
+        """Operações inversas, em ordem inversa"""
+        operations = []
+        for rel in reversed(diff.added_relationships):
+            operations.extend(self._ef_drop_relationship(rel))
+        for table, columns in diff.altered_columns.items():
+            operations.extend(self._ef_alter_column(table, old, new) for old, new in columns)
+        for table, columns in diff.added_columns.items():
+            operations.extend(self._ef_drop_column(table, prop['name']) for prop in columns)
+        for entity in reversed(diff.created_entities):
+            operations.append(self._ef_drop_table(table_name(entity['name'])))
+        for entity in diff.dropped_entities:
+            operations.append(self._ef_create_table(entity))
+        for table, columns in diff.dropped_columns.items():
+            operations.extend(self._ef_add_column(table, prop) for prop in columns)
+        for rel in diff.dropped_relationships:
+            operations.extend(self._ef_add_relationship(rel))
+        return operations
+
+    def _ef_create_table(self, entity: Dict) -> str:
+        table = table_name(entity['name'])
+        columns = ",\n".join(
+            f"        {prop['name']} = table.Column<{prop['type']}>("
+            f"{self._ef_column_arguments(prop)})"
+            for prop in entity.get('properties', [])
+        )
+        keys = _primary_keys(entity)
+        constraints = ""
+        if keys:
+            key_columns = ", ".join(f"x.{key}" for key in keys)
+            key_selector = f"x => new {{ {key_columns} }}" if len(keys) > 1 else f"x => x.{keys[0]}"
+            constraints = (
+                ",\n    constraints: table =>\n    {\n"
+                f"        table.PrimaryKey(\"PK_{table}\", {key_selector});\n    }}"
+            )
+        return (
+            f"migrationBuilder.CreateTable(\n    name: \"{table}\",\n"
+            f"    columns: table => new\n    {{\n{columns}\n    }}{constraints});"
+        )
+
+    def _ef_drop_table(self, table: str) -> str:
+        return f"migrationBuilder.DropTable(name: \"{table}\");"
+
+    def _ef_add_column(self, table: str, prop: Dict) -> str:
+        return (
+            f"migrationBuilder.AddColumn<{prop['type']}>(name: \"{prop['name']}\", "
+            f"table: \"{table}\", {self._ef_column_arguments(prop)});"
+        )
+
+    def _ef_drop_column(self, table: str, column: str) -> str:
+        return f"migrationBuilder.DropColumn(name: \"{column}\", table: \"{table}\");"
+
+    def _ef_alter_column(self, table: str, prop: Dict, old: Dict) -> str:
+        old_arguments = self._ef_column_arguments(old, prefix='old')
+        return (
+            f"migrationBuilder.AlterColumn<{prop['type']}>(name: \"{prop['name']}\", "
+            f"table: \"{table}\", {self._ef_column_arguments(prop)}, "
+            f"oldClrType: typeof({old['type']}), {old_arguments});"
+        )
+
+    def _ef_add_relationship(self, rel: Dict) -> List[str]:
+        on_delete = "ReferentialAction.Cascade" if rel.get('cascade_delete') else "ReferentialAction.Restrict"
+        if rel['type'] == 'ManyToMany':
+            table = _join_table(rel)
+            left, right = f"{rel['from_entity']}Id", f"{rel['to_entity']}Id"
+            return [(
+                f"migrationBuilder.CreateTable(\n    name: \"{table}\",\n"
+                f"    columns: table => new\n    {{\n"
+                f"        {left} = table.Column<int>(nullable: false),\n"
+                f"        {right} = table.Column<int>(nullable: false)\n    }},\n"
+                f"    constraints: table =>\n    {{\n"
+                f"        table.PrimaryKey(\"PK_{table}\", x => new {{ x.{left}, x.{right} }});\n"
+                f"        table.ForeignKey(\"FK_{table}_{table_name(rel['from_entity'])}_{left}\", "
+                f"x => x.{left}, \"{table_name(rel['from_entity'])}\", \"Id\", onDelete: {on_delete});\n"
+                f"        table.ForeignKey(\"FK_{table}_{table_name(rel['to_entity'])}_{right}\", "
+                f"x => x.{right}, \"{table_name(rel['to_entity'])}\", \"Id\", onDelete: {on_delete});\n"
+                f"    }});"
+            )]
+
+        fk = _foreign_key(rel)
+        return [
+            f"migrationBuilder.AddColumn<int>(name: \"{fk['column']}\", table: \"{fk['table']}\", nullable: true);",
+            f"migrationBuilder.AddForeignKey(name: \"{fk['name']}\", table: \"{fk['table']}\", "
+            f"column: \"{fk['column']}\", principalTable: \"{fk['principal_table']}\", "
+            f"principalColumn: \"Id\", onDelete: {on_delete});"
+        ]
+
+    def _ef_drop_relationship(self, rel: Dict) -> List[str]:
+        if rel['type'] == 'ManyToMany':
+            return [self._ef_drop_table(_join_table(rel))]
+        fk = _foreign_key(rel)
+        return [
+            f"migrationBuilder.DropForeignKey(name: \"{fk['name']}\", table: \"{fk['table']}\");",
+            self._ef_drop_column(fk['table'], fk['column'])
+        ]
+
+    @staticmethod
+    def _ef_column_arguments(prop: Dict, prefix: str = '') -> str:
+        def argument(name: str) -> str:
+            return f"{prefix}{name[0].upper()}{name[1:]}" if prefix else name
+
+        arguments = [f"{argument('nullable')}: {'true' if prop.get('nullable') else 'false'}"]
+        if prop.get('max_length'):
+            arguments.append(f"{argument('maxLength')}: {prop['max_length']}")
+        if prop.get('precision'):
+            arguments.append(f"{argument('precision')}: {prop['precision']}")
+            if prop.get('scale') is not None:
+                arguments.append(f"{argument('scale')}: {prop['scale']}")
+        if prop.get('default_value') is not None:
+            arguments.append(f"{argument('defaultValue')}: {json.dumps(prop['default_value'])}")
+        return ", ".join(arguments)
+
+    def _sql_create_table(self, entity: Dict) -> str:
+        table = table_name(entity['name'])
+        lines = [f"    {self._sql_column(prop)}" for prop in entity.get('properties', [])]
+        keys = _primary_keys(entity)
+        if keys:
+            key_columns = ", ".join(f"[{key}]" for key in keys)
+            lines.append(f"    CONSTRAINT [PK_{table}] PRIMARY KEY ({key_columns})")
+        return f"CREATE TABLE [{table}] (\n" + ",\n".join(lines) + "\n);"
+
+    def _sql_add_relationship(self, rel: Dict) -> List[str]:
+        on_delete = " ON DELETE CASCADE" if rel.get('cascade_delete') else ""
+        if rel['type'] == 'ManyToMany':
+            table = _join_table(rel)
+            left, right = f"{rel['from_entity']}Id", f"{rel['to_entity']}Id"
+            return [
+                f"CREATE TABLE [{table}] (\n"
+                f"    [{left}] int NOT NULL,\n"
+                f"    [{right}] int NOT NULL,\n"
+                f"    CONSTRAINT [PK_{table}] PRIMARY KEY ([{left}], [{right}]),\n"
+                f"    CONSTRAINT [FK_{table}_{table_name(rel['from_entity'])}_{left}] FOREIGN KEY ([{left}]) "
+                f"REFERENCES [{table_name(rel['from_entity'])}] ([Id]){on_delete},\n"
+                f"    CONSTRAINT [FK_{table}_{table_name(rel['to_entity'])}_{right}] FOREIGN KEY ([{right}]) "
+                f"REFERENCES [{table_name(rel['to_entity'])}] ([Id]){on_delete}\n"
+                f");"
+            ]
+
+        fk = _foreign_key(rel)
+        return [
+            f"ALTER TABLE [{fk['table']}] ADD [{fk['column']}] int NULL;",
+            f"ALTER TABLE [{fk['table']}] ADD CONSTRAINT [{fk['name']}] FOREIGN KEY ([{fk['column']}]) "
+            f"REFERENCES [{fk['principal_table']}] ([Id]){on_delete};"
+        ]
+
+    def _sql_column(self, prop: Dict) -> str:
+        column = f"[{prop['name']}] {self._sql_type(prop)}{self._sql_null(prop)}"
+        if prop.get('default_value') is not None:
+            default = prop['default_value']
+            if isinstance(default, bool):
+                default = int(default)
+            column += f" DEFAULT {json.dumps(default).replace(chr(34), chr(39))}"
+        return column
+
+    @staticmethod
+    def _sql_type(prop: Dict) -> str:
+        csharp_type = prop['type']
+        if csharp_type == 'string':
+            return f"nvarchar({prop['max_length']})" if prop.get('max_length') else "nvarchar(max)"
+        if csharp_type == 'decimal':
+            return f"decimal({prop.get('precision') or 18}, {prop.get('scale') or 2})"
+        if csharp_type not in SQL_TYPES:
+            raise ValueError(f"Tipo C# sem mapeamento SQL: {csharp_type!r} (coluna {prop['name']})")
+        return SQL_TYPES[csharp_type]
+
+    @staticmethod
+    def _sql_null(prop: Dict) -> str:
+        return " NULL" if prop.get('nullable') else " NOT NULL"
+
+    @staticmethod
+    def _indent(operations: List[str]) -> str:
+        if not operations:
+            return ""
+        return "\n\n".join(
+            "\n".join(f"            {line}" for line in operation.split("\n"))
+            for operation in operations
+        )
@@ -1,9 +1,25 @@
 # tools/database/schema_generator.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
+import io
 import json
 from datetime import datetime
 
+from tools.wpf.file_emitter import FileEmitter
+
+ENTITY_USINGS = [
+    "using System;",
+    "using System.ComponentModel.DataAnnotations;",
+    "using System.ComponentModel.DataAnnotations.Schema;",
+    ""
+]
+DEFAULT_ENTITY_NAMESPACE = 'YourNamespace.Domain.Entities'
+
+# Fragmentos comuns a todas as entidades, montados uma única vez
+_ENTITY_HEADER = "\n".join(ENTITY_USINGS) + "\n"
+_KEY_ATTRIBUTE = "        [Key]\n"
+_REQUIRED_ATTRIBUTE = "        [Required]\n"
+
 class SchemaGenerator:
     def __init__(self):
         self.output_path = Path("output/database")
@@ -14,15 +30,10 @@ class SchemaGenerator:
         code = []
         
         # Adiciona imports
-        code.extend([
-            "using System;",
-            "using System.ComponentModel.DataAnnotations;",
-            "using System.ComponentModel.DataAnnotations.Schema;",
-            ""
-        ])
+        code.extend(ENTITY_USINGS)
 
         # Adiciona namespace
-        code.append(f"namespace {entity_config.get('namespace', 'YourNamespace.Domain.Entities')}")
+        code.append(f"namespace {entity_config.get('namespace', DEFAULT_ENTITY_NAMESPACE)}")
         code.append("{")
 
         # Adiciona classe
@@ -42,6 +53,58 @@ class SchemaGenerator:
 
         return "\n".join(code)
 
+    def generate_entity_schemas(self, schema: Dict) -> Dict[str, str]:
+        """Gera o código C# de todas as entidades de um schema (nome -> código).
+
+        Mesmo resultado de `generate_entity_schema` para cada entidade, mas
+        com os fragmentos comuns (usings, atributos, abertura do namespace)
+        montados uma vez e cada arquivo escrito em um único buffer.
+        """
+        default_namespace = schema.get('namespace', DEFAULT_ENTITY_NAMESPACE)
+        namespace_headers: Dict[str, str] = {}
+        entities = {}
+
+        for entity_config in schema.get('entities', []):
+            namespace = entity_config.get('namespace', default_namespace)
+            header = namespace_headers.get(namespace)
+            if header is None:
+                header = f"{_ENTITY_HEADER}namespace {namespace}\n{{\n"
+                namespace_headers[namespace] = header
+
+            out = io.StringIO()
+            out.write(header)
+            out.write(f"    public class {entity_config['name']}\n    {{\n")
+            for prop in entity_config.get('properties', []):
+                self._write_property(out, prop)
+            for nav in entity_config.get('navigation_properties', []):
+                out.write(self._generate_navigation_property(nav)[0])
+                out.write("\n")
+            out.write("    }\n}")
+            entities[entity_config['name']] = out.getvalue()
+
+        return entities
+
+    def save_entity_schemas(self, entities: Dict[str, str], root: Optional[Path] = None,
+                            max_workers: int = None) -> Dict[str, Any]:
+        """Grava as entidades em lote (`<root>/<Entidade>.cs`); retorna o manifesto"""
+        root = Path(root) if root is not None else self.output_path / "Entities"
+        files = {f"{name}.cs": code for name, code in entities.items()}
+        return FileEmitter(max_workers).emit(root, files)
+
+    def _write_property(self, out: io.StringIO, prop: Dict) -> None:
+        """Escreve atributos e declaração da propriedade no buffer"""
+        if prop.get('key', False):
+            out.write(_KEY_ATTRIBUTE)
+        if prop.get('required', False):
+            out.write(_REQUIRED_ATTRIBUTE)
+        if max_length := prop.get('max_length'):
+            out.write(f"        [MaxLength({max_length})]\n")
+        if column_name := prop.get('column_name'):
+            out.write(f'        [Column("{column_name}")]\n')
+
+        nullable = "?" if prop.get('nullable', False) else ""
+        out.write(f"        public {prop['type']}{nullable} {prop['name']} {{ get; set; }}\n")
+
     def _generate_property(self, prop: Dict) -> List[str]:
         """Gera código para uma propriedade"""
         code = []
@@ -1,15 +1,108 @@
 # tools/security/compliance_checker.py
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
 import asyncio
 import logging
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 import json
 import re
 
+from .parallel_scan import ParallelScanner
+
+def find_violations(content: str, patterns: Sequence[str],
+                    compiled: Optional[Sequence[Pattern]] = None,
+                    context_lines: int = 2) -> List[Dict]:
+    """Violações (padrão, linha, trecho e contexto) dos padrões no conteúdo"""
+    if compiled is None:
+        compiled = [re.compile(pattern) for pattern in patterns]
+
+    violations = []
+    lines = None
+    newlines = None
+    for pattern, regex in zip(patterns, compiled):
+        for match in regex.finditer(content):
+            if lines is None:
+                # Linhas e quebras calculadas uma vez por conteúdo
+                lines = content.splitlines()
+                newlines = [newline.start() for newline in re.finditer('\n', content)]
+            match_line = bisect_left(newlines, match.start())
+            violations.append({
+                'pattern': pattern,
+                'line': match_line + 1,
+                'match': match.group(0),
+                'context': '\n'.join(lines[
+                    max(0, match_line - context_lines):
+                    min(len(lines), match_line + context_lines + 1)
+                ])
+            })
+
+    return violations
+
+class ComplianceRuleSet:
+    """Regras de compliance com os padrões já compilados.
+
+    É a tarefa enviada aos workers do `ParallelScanner`: recebe um arquivo
+    e os índices das regras relevantes para ele, lê o arquivo uma única
+    vez e devolve, por regra, o resultado ou o erro.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        self.rules = rules
+        self._compiled: List[Optional[List[Pattern]]] = []
+        self._errors: List[Optional[str]] = []
+        for rule in rules:
+            try:
+                self._compiled.append([re.compile(pattern) for pattern in rule['patterns']])
+                self._errors.append(None)
+            except Exception as e:
+                self._compiled.append(None)
+                self._errors.append(str(e))
+
+    def __call__(self, item: Tuple[str, List[int]]) -> List[Tuple[int, Optional[Dict], Optional[str]]]:
+        path, relevant = item
+        try:
+            content = Path(path).read_text()
+        except Exception as e:
+            return [(index, None, str(e)) for index in relevant]
+
+        results = []
+        for index in relevant:
+            if self._errors[index] is not None:
+                results.append((index, None, self._errors[index]))
+                continue
+            try:
+                results.append((index, self._check(index, path, content), None))
+            except Exception as e:
+                results.append((index, None, str(e)))
+        return results
+
+    def _check(self, index: int, path: str, content: str) -> Dict:
+        rule = self.rules[index]
+        violations = find_violations(content, rule['patterns'], self._compiled[index])
+
+        if violations:
+            return {
+                'rule_id': rule['id'],
+                'category': rule['category'],
+                'severity': rule['severity'],
+                'file': path,
+                'violations': violations,
+                'compliant': False,
+                'description': rule['description'],
+                'recommendation': rule.get('recommendation', '')
+            }
+        return {
+            'rule_id': rule['id'],
+            'category': rule['category'],
+            'file': path,
+            'compliant': True
+        }
+
 class ComplianceChecker:
-    def __init__(self):
+    def __init__(self, parallel: Optional[ParallelScanner] = None):
         self.logger = logging.getLogger(__name__)
+        self.parallel = parallel if parallel is not None else ParallelScanner()
         self.rules_file = Path("config/security/compliance_rules.json")
         self.rules = self._load_rules()
 
@@ -40,22 +133,39 @@ class ComplianceChecker:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
+            # Todas as regras em uma única varredura da árvore
+            owasp_rules = self.rules['owasp']
+            gdpr_rules = self.rules['gdpr']
+            bp_rules = self.rules['security_best_practices']
+            rule_results = await self._check_rules(
+                project_path,
+                owasp_rules + gdpr_rules + bp_rules
+            )
+            gdpr_start = len(owasp_rules)
+            bp_start = gdpr_start + len(gdpr_rules)
+
             # Verifica OWASP
-            owasp_results = await self._check_owasp_compliance(project_path)
+            owasp_results = [
+                r for results in rule_results[:gdpr_start] for r in results
+            ]
             results['owasp_compliance'] = owasp_results
             results['total_issues'] += len([
                 r for r in owasp_results if not r['compliant']
             ])
 
             # Verifica GDPR
-            gdpr_results = await self._check_gdpr_compliance(project_path)
+            gdpr_results = [
+                r for results in rule_results[gdpr_start:bp_start] for r in results
+            ]
             results['gdpr_compliance'] = gdpr_results
             results['total_issues'] += len([
                 r for r in gdpr_results if not r['compliant']
             ])
 
             # Verifica melhores práticas
-            bp_results = await self._check_security_best_practices(project_path)
+            bp_results = [
+                r for results in rule_results[bp_start:] for r in results
+            ]
             results['best_practices'] = bp_results
             results['total_issues'] += len([
                 r for r in bp_results if not r['compliant']
@@ -72,100 +182,71 @@ class ComplianceChecker:
 
     async def _check_owasp_compliance(self, project_path: Path) -> List[Dict]:
         """Verifica compliance com OWASP"""
-        results = []
-        
-        for rule in self.rules['owasp']:
-            try:
-                rule_results = await self._check_rule(
-                    project_path,
-                    rule
-                )
-                results.extend(rule_results)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to check OWASP rule {rule['id']}: {str(e)}"
-                )
-                
-        return results
+        rule_results = await self._check_rules(project_path, self.rules['owasp'])
+        return [r for results in rule_results for r in results]
 
     async def _check_gdpr_compliance(self, project_path: Path) -> List[Dict]:
         """Verifica compliance com GDPR"""
-        results = []
-        
-        for rule in self.rules['gdpr']:
-            try:
-                rule_results = await self._check_rule(
-                    project_path,
-                    rule
-                )
-                results.extend(rule_results)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to check GDPR rule {rule['id']}: {str(e)}"
-                )
-                
-        return results
+        rule_results = await self._check_rules(project_path, self.rules['gdpr'])
+        return [r for results in rule_results for r in results]
 
     async def _check_security_best_practices(self, project_path: Path) -> List[Dict]:
         """Verifica compliance com melhores práticas de segurança"""
-        results = []
-        
-        for rule in self.rules['security_best_practices']:
-            try:
-                rule_results = await self._check_rule(
-                    project_path,
-                    rule
-                )
-                results.extend(rule_results)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to check security best practice {rule['id']}: {str(e)}"
-                )
-                
-        return results
+        rule_results = await self._check_rules(project_path, self.rules['security_best_practices'])
+        return [r for results in rule_results for r in results]
 
     async def _check_rule(self, project_path: Path, rule: Dict) -> List[Dict]:
         """Verifica uma regra específica"""
-        results = []
-        
-        # Verifica arquivos relevantes
+        return (await self._check_rules(project_path, [rule]))[0]
+
+    async def _check_rules(self, project_path: Path, rules: List[Dict]) -> List[List[Dict]]:
+        """Verifica várias regras com uma única varredura da árvore.
+
+        A relevância dos arquivos é decidida aqui; leitura e busca dos
+        padrões ficam com o `ParallelScanner`, que lê cada arquivo uma vez
+        para todas as regras relevantes. Os resultados de cada regra seguem
+        a ordem dos arquivos na árvore.
+        """
+        failed = {}
+        files = []
         for file_path in project_path.rglob('*'):
-            if not self._is_relevant_file(file_path, rule):
-                continue
+            relevant = []
+            for index, rule in enumerate(rules):
+                if index in failed:
+                    continue
+                try:
+                    if self._is_relevant_file(file_path, rule):
+                        relevant.append(index)
+                except Exception as e:
+                    failed[index] = e
+            if relevant:
+                files.append((file_path, relevant))
 
-            try:
-                content = file_path.read_text()
-                
-                # Verifica padrões da regra
-                violations = self._check_patterns(
-                    content,
-                    rule['patterns']
-                )
-                
-                if violations:
-                    results.append({
-                        'rule_id': rule['id'],
-                        'category': rule['category'],
-                        'severity': rule['severity'],
-                        'file': str(file_path),
-                        'violations': violations,
-                        'compliant': False,
-                        'description': rule['description'],
-                        'recommendation': rule.get('recommendation', '')
-                    })
+        # Regra com erro na seleção de arquivos não produz resultados
+        for index, e in failed.items():
+            self.logger.error(f"Failed to check rule {rules[index].get('id')}: {str(e)}")
+        if failed:
+            files = [
+                (file_path, [index for index in relevant if index not in failed])
+                for file_path, relevant in files
+            ]
+            files = [(file_path, relevant) for file_path, relevant in files if relevant]
+
+        file_results = await self.parallel.run(
+            ComplianceRuleSet(rules),
+            [(str(file_path), relevant) for file_path, relevant in files]
+        )
+
+        results = [[] for _ in rules]
+        for (file_path, _), rule_results in zip(files, file_results):
+            for index, result, error in rule_results:
+                if error is not None:
+                    self.logger.error(
+                        f"Failed to check rule {rules[index]['id']} for {file_path}: {error}"
+                    )
                 else:
-                    results.append({
-                        'rule_id': rule['id'],
-                        'category': rule['category'],
-                        'file': str(file_path),
-                        'compliant': True
-                    })
-                    
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to check rule {rule['id']} for {file_path}: {str(e)}"
-                )
-                
+                    results[index].append(result)
+
         return results
 
     def _is_relevant_file(self, file_path: Path, rule: Dict) -> bool:
@@ -186,19 +267,7 @@ class ComplianceChecker:
   # tools/security/compliance_checker.py (continuação)
     def _check_patterns(self, content: str, patterns: List[str]) -> List[Dict]:
         """Verifica padrões em um conteúdo"""
-        violations = []
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                violations.append({
-                    'pattern': pattern,
-                    'line': content.count('\n', 0, match.start()) + 1,
-                    'match': match.group(0),
-                    'context': self._get_context(content, match)
-                })
-                
-        return violations
+        return find_violations(content, patterns)
 
     def _get_context(self, content: str, match: re.Match, context_lines: int = 2) -> str:
         """Obtém o contexto de um match"""
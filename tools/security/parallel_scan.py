@@ -0,0 +1,77 @@
+# tools/security/parallel_scan.py
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import math
+import os
+
+# Tarefa do worker, instalada uma única vez pelo initializer do pool
+_task: Optional[Callable[[Any], Any]] = None
+
+def _install_task(task: Callable[[Any], Any]) -> None:
+    global _task
+    _task = task
+
+def _run_shard(shard: List[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+    return [(index, _task(item)) for index, item in shard]
+
+def _run_local(task: Callable[[Any], Any], shard: List[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+    return [(index, task(item)) for index, item in shard]
+
+class ParallelScanner:
+    """Distribui a análise de arquivos entre processos.
+
+    A lista de itens é dividida em lotes contíguos entre os workers de um
+    `ProcessPoolExecutor` (um por núcleo, por padrão). A tarefa - um
+    objeto picklable com as regras já compiladas - vai para cada worker
+    uma única vez, pelo `initializer`, e não a cada lote; os lotes voltam
+    conforme terminam (`stream`), sem bloquear o event loop. Listas
+    pequenas, em que subir processos não compensa, são analisadas em uma
+    thread do próprio processo.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 min_parallel_items: int = 256, shards_per_worker: int = 4):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_items = min_parallel_items
+        self.shards_per_worker = shards_per_worker
+
+    def workers_for(self, item_count: int) -> int:
+        """Número de processos usados para `item_count` itens (0: sem pool)"""
+        if self.max_workers < 2 or item_count < max(self.min_parallel_items, 2):
+            return 0
+        return min(self.max_workers, item_count)
+
+    async def stream(self, task: Callable[[Any], Any],
+                     items: Sequence[Any]) -> AsyncIterator[List[Tuple[int, Any]]]:
+        """Lotes de (índice do item, resultado), na ordem em que terminam"""
+        if not items:
+            return
+
+        loop = asyncio.get_running_loop()
+        indexed = list(enumerate(items))
+        workers = self.workers_for(len(indexed))
+
+        if not workers:
+            yield await loop.run_in_executor(None, _run_local, task, indexed)
+            return
+
+        shard_size = math.ceil(len(indexed) / (workers * self.shards_per_worker))
+        shards = [indexed[i:i + shard_size] for i in range(0, len(indexed), shard_size)]
+
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_install_task, initargs=(task,)
+        )
+        try:
+            futures = [loop.run_in_executor(pool, _run_shard, shard) for shard in shards]
+            for future in asyncio.as_completed(futures):
+                yield await future
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, task: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+        """Resultados de todos os itens, na ordem dos itens"""
+        results: Dict[int, Any] = {}
+        async for batch in self.stream(task, items):
+            results.update(batch)
+        return [results[index] for index in range(len(items))]
@@ -0,0 +1,121 @@
+# tools/security/pattern_set.py
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+from pathlib import Path, PurePath
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Âncoras e lookarounds dependem do início/fim da linha: sem pré-filtro
+_LINE_DEPENDENT = re.compile(r'(?<!\[)\^|\$|\\[AZ]|\(\?<?[=!]')
+
+def compile_pattern(pattern: Optional[str]) -> Optional[Pattern]:
+    """Compila um padrão de regra; padrões inválidos nunca casam"""
+    if pattern is None:
+        return None
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError) as e:
+        logger.warning(f"Invalid pattern {pattern!r}: {str(e)}")
+        return None
+
+class PatternSet:
+    """Padrões pré-compilados aplicados juntos às linhas de um arquivo.
+
+    Antes da busca linha a linha, cada padrão é procurado uma vez no
+    conteúdo inteiro: se um trecho casa em uma linha, casa também no
+    arquivo, então um padrão sem match no arquivo é descartado sem testar
+    nenhuma linha. Padrões com âncoras ou lookarounds, cujo resultado
+    depende dos limites da linha, não passam por esse filtro.
+    """
+
+    def __init__(self, patterns: Sequence[Pattern]):
+        self.patterns = list(patterns)
+        self._filtered = [
+            not _LINE_DEPENDENT.search(pattern.pattern) for pattern in self.patterns
+        ]
+
+    def scan(self, content: str) -> List[Tuple[int, str, List[int]]]:
+        """(número da linha, linha, índices dos padrões encontrados) por linha com match"""
+        searches = [
+            (i, pattern.search) for i, pattern in enumerate(self.patterns)
+            if not self._filtered[i] or pattern.search(content)
+        ]
+        if not searches:
+            return []
+
+        results = []
+        for number, line in enumerate(content.splitlines(), 1):
+            found = [i for i, search in searches if search(line)]
+            if found:
+                results.append((number, line, found))
+        return results
+
+# (número da linha, trecho, destinos (padrão, posição do tipo de arquivo))
+FileMatches = List[Tuple[int, str, List[Tuple[int, int]]]]
+
+class RuleMatcher:
+    """Padrões de regras, cada um com seus tipos de arquivo (globs).
+
+    Separa o que depende só do caminho (`matched_types`, barato, feito na
+    varredura da árvore) da leitura e busca no conteúdo (`__call__`). É
+    picklable, para ser enviado aos workers do `ParallelScanner` com os
+    padrões já compilados.
+    """
+
+    def __init__(self, specs: Sequence[Tuple[Optional[str], Sequence[str]]]):
+        self.specs = [(pattern, list(file_types)) for pattern, file_types in specs]
+        self.compiled = [compile_pattern(pattern) for pattern, _ in self.specs]
+        self.file_types = list(dict.fromkeys(
+            file_type for _, file_types in self.specs for file_type in file_types
+        ))
+        self._groups: Dict[Tuple[str, ...], Tuple[PatternSet, List[List[Tuple[int, int]]]]] = {}
+
+    def matched_types(self, relative: PurePath) -> Tuple[str, ...]:
+        """Tipos de arquivo (globs) que casam com o caminho relativo"""
+        return tuple(
+            file_type for file_type in self.file_types if relative.match(file_type)
+        )
+
+    def applies(self, matched_types: Tuple[str, ...]) -> bool:
+        return bool(matched_types) and bool(self.group(matched_types)[1])
+
+    def group(self, matched_types: Tuple[str, ...]) -> Tuple[PatternSet, List[List[Tuple[int, int]]]]:
+        """PatternSet dos padrões aplicáveis a um conjunto de tipos de arquivo.
+
+        `targets[i]` lista os destinos (padrão, posição do tipo) de cada
+        match do i-ésimo padrão do conjunto; um arquivo que casa com dois
+        tipos do mesmo padrão é reportado duas vezes, como na busca por glob.
+        """
+        group = self._groups.get(matched_types)
+        if group is not None:
+            return group
+
+        patterns = []
+        targets = []
+        for pattern_index, (_, file_types) in enumerate(self.specs):
+            if self.compiled[pattern_index] is None:
+                continue
+            positions = [
+                (pattern_index, position) for position, file_type in enumerate(file_types)
+                if file_type in matched_types
+            ]
+            if positions:
+                patterns.append(self.compiled[pattern_index])
+                targets.append(positions)
+        group = self._groups[matched_types] = (PatternSet(patterns), targets)
+        return group
+
+    def __call__(self, item: Tuple[str, Tuple[str, ...]]) -> Tuple[FileMatches, Optional[str]]:
+        """Matches de um arquivo (caminho, tipos casados), ou o erro de leitura"""
+        path, matched_types = item
+        pattern_set, targets = self.group(matched_types)
+        try:
+            content = Path(path).read_text()
+        except Exception as e:
+            return [], str(e)
+
+        return [
+            (number, line.strip(), [target for index in found for target in targets[index]])
+            for number, line, found in pattern_set.scan(content)
+        ], None
@@ -1,15 +1,21 @@
 # tools/security/vulnerability_scanner.py
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-import re
 import json
 
+from .parallel_scan import ParallelScanner
+from .pattern_set import RuleMatcher
+
+CODE_FILE_TYPES = ['*.cs', '*.xaml', '*.config']
+CONFIG_FILE_TYPES = ['*.config', '*.json', '*.xml', '*.settings']
+
 class VulnerabilityScanner:
-    def __init__(self):
+    def __init__(self, parallel: Optional[ParallelScanner] = None):
         self.logger = logging.getLogger(__name__)
+        self.parallel = parallel if parallel is not None else ParallelScanner()
         self.patterns_file = Path("config/security/vulnerability_patterns.json")
         self.patterns = self._load_patterns()
 
@@ -38,13 +44,19 @@ class VulnerabilityScanner:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
-            # Scan de código
-            code_results = await self._scan_code(project_path)
-            results['code_vulnerabilities'] = code_results
-
-            # Scan de configurações
-            config_results = await self._scan_configs(project_path)
-            results['config_vulnerabilities'] = config_results
+            # Scan de código e de configurações na mesma varredura da árvore
+            code_patterns = self.patterns['code_patterns']
+            config_patterns = self.patterns['config_patterns']
+            matches = await self._find_all_pattern_matches(
+                project_path,
+                self._code_specs(code_patterns) + self._config_specs(config_patterns)
+            )
+            results['code_vulnerabilities'] = self._code_vulnerabilities(
+                code_patterns, matches[:len(code_patterns)]
+            )
+            results['config_vulnerabilities'] = self._config_vulnerabilities(
+                config_patterns, matches[len(code_patterns):]
+            )
 
             # Scan de dependências
             dependency_results = await self._scan_dependencies(project_path)
@@ -58,18 +70,36 @@ class VulnerabilityScanner:
 
     async def _scan_code(self, project_path: Path) -> List[Dict]:
         """Analisa vulnerabilidades no código"""
+        patterns = self.patterns['code_patterns']
+        matches = await self._find_all_pattern_matches(
+            project_path, self._code_specs(patterns)
+        )
+        return self._code_vulnerabilities(patterns, matches)
+
+    async def _scan_configs(self, project_path: Path) -> List[Dict]:
+        """Analisa vulnerabilidades em arquivos de configuração"""
+        patterns = self.patterns['config_patterns']
+        matches = await self._find_all_pattern_matches(
+            project_path, self._config_specs(patterns)
+        )
+        return self._config_vulnerabilities(patterns, matches)
+
+    def _code_specs(self, patterns: List[Dict]) -> List[Tuple[Optional[str], List[str]]]:
+        return [
+            (pattern.get('pattern'), pattern.get('file_types', CODE_FILE_TYPES))
+            for pattern in patterns
+        ]
+
+    def _config_specs(self, patterns: List[Dict]) -> List[Tuple[Optional[str], List[str]]]:
+        return [(pattern.get('pattern'), CONFIG_FILE_TYPES) for pattern in patterns]
+
+    def _code_vulnerabilities(self, patterns: List[Dict], matches: List[List[Dict]]) -> List[Dict]:
         vulnerabilities = []
-        
-        for pattern in self.patterns['code_patterns']:
+
+        for pattern, pattern_matches in zip(patterns, matches):
             try:
-                matches = await self._find_pattern_matches(
-                    project_path,
-                    pattern['pattern'],
-                    pattern.get('file_types', ['*.cs', '*.xaml', '*.config'])
-                )
-                
-                for match in matches:
-                    vulnerabilities.append({
+                vulnerabilities.extend([
+                    {
                         'type': pattern['type'],
                         'severity': pattern['severity'],
                         'description': pattern['description'],
@@ -77,8 +107,10 @@ class VulnerabilityScanner:
                         'line': match['line'],
                         'snippet': match['snippet'],
                         'recommendation': pattern.get('recommendation', '')
-                    })
-                    
+                    }
+                    for match in pattern_matches
+                ])
+
             except Exception as e:
                 self.logger.warning(
                     f"Failed to scan for pattern {pattern['type']}: {str(e)}"
@@ -86,27 +118,13 @@ class VulnerabilityScanner:
 
         return vulnerabilities
 
-    async def _scan_configs(self, project_path: Path) -> List[Dict]:
-        """Analisa vulnerabilidades em arquivos de configuração"""
+    def _config_vulnerabilities(self, patterns: List[Dict], matches: List[List[Dict]]) -> List[Dict]:
         vulnerabilities = []
-        
-        config_files = [
-            '*.config',
-            '*.json',
-            '*.xml',
-            '*.settings'
-        ]
-        
-        for pattern in self.patterns['config_patterns']:
+
+        for pattern, pattern_matches in zip(patterns, matches):
             try:
-                matches = await self._find_pattern_matches(
-                    project_path,
-                    pattern['pattern'],
-                    config_files
-                )
-                
-                for match in matches:
-                    vulnerabilities.append({
+                vulnerabilities.extend([
+                    {
                         'type': 'config',
                         'severity': pattern['severity'],
                         'description': pattern['description'],
@@ -114,8 +132,10 @@ class VulnerabilityScanner:
                         'line': match['line'],
                         'snippet': match['snippet'],
                         'recommendation': pattern.get('recommendation', '')
-                    })
-                    
+                    }
+                    for match in pattern_matches
+                ])
+
             except Exception as e:
                 self.logger.warning(
                     f"Failed to scan config for pattern {pattern['type']}: {str(e)}"
@@ -149,25 +169,50 @@ class VulnerabilityScanner:
         file_types: List[str]
     ) -> List[Dict]:
         """Encontra matches de um padrão em arquivos"""
-        matches = []
-        
-        for file_type in file_types:
-            for file_path in project_path.glob(f'**/{file_type}'):
-                try:
-                    content = file_path.read_text()
-                    for i, line in enumerate(content.splitlines(), 1):
-                        if re.search(pattern, line):
-                            matches.append({
-                                'file': file_path,
-                                'line': i,
-                                'snippet': line.strip()
-                            })
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to scan file {file_path}: {str(e)}"
-                    )
-
-        return matches
+        matches = await self._find_all_pattern_matches(project_path, [(pattern, file_types)])
+        return matches[0]
+
+    async def _find_all_pattern_matches(
+        self,
+        project_path: Path,
+        specs: List[Tuple[Optional[str], List[str]]]
+    ) -> List[List[Dict]]:
+        """Encontra os matches de vários padrões (padrão, tipos de arquivo).
+
+        A árvore é percorrida uma única vez e cada arquivo é lido uma única
+        vez; a leitura e a busca nos arquivos são distribuídas entre
+        processos pelo `ParallelScanner`. O resultado de cada padrão mantém
+        a ordem da busca individual: por tipo de arquivo, arquivo e linha.
+        """
+        matcher = RuleMatcher(specs)
+        files = []
+        items = []
+        for file_path in project_path.rglob('*'):
+            matched_types = matcher.matched_types(file_path.relative_to(project_path))
+            if matcher.applies(matched_types):
+                files.append(file_path)
+                items.append((str(file_path), matched_types))
+
+        file_results = await self.parallel.run(matcher, items)
+
+        # matches[padrão][posição do tipo de arquivo]
+        matches = [[[] for _ in file_types] for _, file_types in specs]
+        for file_path, (file_matches, error) in zip(files, file_results):
+            if error is not None:
+                self.logger.warning(f"Failed to scan file {file_path}: {error}")
+                continue
+            for i, snippet, targets in file_matches:
+                for pattern_index, position in targets:
+                    matches[pattern_index][position].append({
+                        'file': file_path,
+                        'line': i,
+                        'snippet': snippet
+                    })
+
+        return [
+            [match for bucket in pattern_matches for match in bucket]
+            for pattern_matches in matches
+        ]
 
     # tools/security/vulnerability_scanner.py (continuação)
     async def _scan_packages_config(self, config_path: Path) -> List[Dict]:
@@ -0,0 +1,165 @@
+# tools/wpf/file_emitter.py
+from typing import Dict, List, Any, Iterable, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import os
+
+Content = Union[str, bytes]
+
+# Manifesto da última geração, gravado na raiz do projeto
+MANIFEST_NAME = '.kallista-manifest.json'
+
+# Arquivos mínimos por tarefa do pool de gravação
+FILES_PER_BATCH = 64
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+class FileEmitter:
+    """Grava um conjunto de arquivos gerados de uma só vez.
+
+    Os arquivos são coletados em memória, a árvore de diretórios é criada
+    em uma única passada e as gravações ocorrem em um pool de threads com
+    concorrência limitada. Retorna um manifesto com tamanho e hash de cada
+    arquivo.
+
+    Com o manifesto da geração anterior (`previous`), arquivos cujo hash não
+    mudou não são regravados, preservando o mtime (builds incrementais do
+    Visual Studio e histórico do git).
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    async def emit_async(self, root: Path, files: Dict[str, Content],
+                         directories: Iterable[str] = (),
+                         previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Versão assíncrona de `emit`, executada fora do event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.emit, root, files, list(directories), previous
+        )
+
+    def emit(self, root: Path, files: Dict[str, Content], directories: Iterable[str] = (),
+             previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Cria os diretórios, grava os arquivos alterados e retorna o manifesto"""
+        root = Path(root)
+        encoded = {path: self._encode(content) for path, content in files.items()}
+        previous_files = (previous or {}).get('files', {})
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        unchanged: List[str] = []
+        for path, data in encoded.items():
+            entry = previous_files.get(path)
+            if entry and entry.get('sha256') == content_hash(data) \
+                    and self._matches_disk(root / path, entry):
+                entries[path] = entry
+                unchanged.append(path)
+        pending = {path: data for path, data in encoded.items() if path not in entries}
+
+        # Uma chamada mkdir por diretório distinto (pais antes dos filhos)
+        tree = {root / directory for directory in directories}
+        tree.update((root / path).parent for path in pending)
+        for directory in sorted(tree, key=lambda directory: len(directory.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        entries.update(self._write_all(root, pending))
+
+        manifest = self.manifest(root, entries)
+        manifest['written'] = sorted(pending)
+        manifest['unchanged'] = sorted(unchanged)
+        return manifest
+
+    def prune(self, root: Path, previous: Optional[Dict[str, Any]],
+              current_paths: Iterable[str]) -> List[str]:
+        """Remove arquivos da geração anterior que não foram gerados agora"""
+        current_paths = set(current_paths)
+        deleted = []
+        for path in sorted((previous or {}).get('files', {})):
+            if path not in current_paths:
+                target = Path(root) / path
+                if target.is_file():
+                    target.unlink()
+                    deleted.append(path)
+        return deleted
+
+    def load_manifest(self, root: Path) -> Optional[Dict[str, Any]]:
+        """Manifesto da geração anterior (None se ausente ou inválido)"""
+        try:
+            with open(Path(root) / MANIFEST_NAME, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_manifest(self, root: Path, manifest: Dict[str, Any]) -> bool:
+        """Grava o manifesto apenas se a lista de arquivos mudou"""
+        stored = {'files': manifest['files']}
+        previous = self.load_manifest(root)
+        if previous is not None and previous.get('files') == stored['files']:
+            return False
+        with open(Path(root) / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, indent=4, sort_keys=True)
+        return True
+
+    def describe(self, root: Path, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Entradas de manifesto para arquivos já gravados"""
+        entries = {}
+        for path in paths:
+            target = Path(root) / path
+            data = target.read_bytes()
+            entries[path] = {
+                'size': len(data),
+                'sha256': content_hash(data),
+                'mtime_ns': target.stat().st_mtime_ns
+            }
+        return entries
+
+    @staticmethod
+    def manifest(root: Path, entries: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'root': str(root),
+            'files': dict(sorted(entries.items())),
+            'file_count': len(entries),
+            'total_size': sum(entry['size'] for entry in entries.values())
+        }
+
+    @staticmethod
+    def _matches_disk(path: Path, entry: Dict[str, Any]) -> bool:
+        """Confere (tamanho e mtime) se o arquivo no disco ainda é o do manifesto"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+    def _write_all(self, root: Path, pending: Dict[str, bytes]) -> Dict[str, Dict[str, Any]]:
+        """Grava os arquivos em lotes, um lote por tarefa do pool.
+
+        Uma tarefa por arquivo custa mais (futures, locks) do que a própria
+        gravação de arquivos pequenos; com poucos arquivos ou um único
+        worker, grava direto na thread atual.
+        """
+        items = list(pending.items())
+        workers = min(self.max_workers, (len(items) + FILES_PER_BATCH - 1) // FILES_PER_BATCH)
+        if workers <= 1:
+            return {path: self._write(root / path, data) for path, data in items}
+
+        batches = [items[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kallista-emit') as pool:
+            results = pool.map(
+                lambda batch: [(path, self._write(root / path, data)) for path, data in batch],
+                batches
+            )
+            return dict(entry for batch in results for entry in batch)
+
+    @staticmethod
+    def _encode(content: Content) -> bytes:
+        return content if isinstance(content, bytes) else content.encode('utf-8')
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> Dict[str, Any]:
+        path.write_bytes(data)
+        return {'size': len(data), 'sha256': content_hash(data), 'mtime_ns': path.stat().st_mtime_ns}
@@ -2,6 +2,7 @@
 from typing import Dict, Any
 from pathlib import Path
 from .base_generator import BaseGenerator
+from .template_cache import ProjectTypeTemplateCache
 from .style_generator import StyleGenerator
 from .template_generator import TemplateGenerator
 from .xaml_generator import XamlGenerator
@@ -17,24 +18,12 @@ class WPFProjectGenerator(BaseGenerator):
         self.output_path = Path("output")
         self.output_path.mkdir(exist_ok=True)
         
-        # Carregar templates específicos por tipo de projeto
-        self.project_types = {
-            'kanban': self._load_project_type_templates('kanban'),
-            'crud': self._load_project_type_templates('crud'),
-            'dashboard': self._load_project_type_templates('dashboard'),
-            'report': self._load_project_type_templates('report')
-        }
+        # Templates específicos por tipo de projeto: lidos no primeiro uso
+        self.project_types = ProjectTypeTemplateCache(self.templates_path / "project_types")
 
     def _load_project_type_templates(self, project_type: str) -> Dict[str, str]:
         """Carrega templates específicos para cada tipo de projeto"""
-        type_path = self.templates_path / "project_types" / project_type
-        templates = {}
-        
-        if type_path.exists():
-            for template_file in type_path.glob("*.xaml"):
-                templates[template_file.stem] = template_file.read_text(encoding='utf-8')
-        
-        return templates
+        return self.project_types.get(project_type)
 
     async def generate_project(self, project_spec: Dict) -> Dict:
         """Gera a estrutura do projeto WPF"""
@@ -96,7 +85,7 @@ class WPFProjectGenerator(BaseGenerator):
         """Gera todos os arquivos do projeto"""
         
         # Carrega templates específicos do tipo de projeto
-        type_templates = self.project_types.get(project_type, {})
+        type_templates = self._load_project_type_templates(project_type)
         
         # Mapa de arquivos para gerar
         files_to_generate = {
@@ -0,0 +1,59 @@
+# tools/wpf/generators/template_cache.py
+from typing import Dict, Tuple
+from pathlib import Path
+import threading
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+class ProjectTypeTemplateCache:
+    """Templates XAML por tipo de projeto, carregados sob demanda.
+
+    Nada é lido na construção: o diretório de um tipo só é lido na primeira
+    vez em que é pedido. As leituras seguintes reutilizam o conteúdo em
+    memória enquanto a assinatura do diretório (nome, tamanho e mtime de cada
+    arquivo) não mudar; se um template for alterado, adicionado ou removido,
+    o tipo é recarregado.
+    """
+
+    def __init__(self, root: Path, pattern: str = "*.xaml"):
+        self.root = Path(root)
+        self.pattern = pattern
+        self.lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Signature, Dict[str, str]]] = {}
+        self.loads = 0
+
+    def get(self, project_type: str) -> Dict[str, str]:
+        """Templates do tipo (stem do arquivo -> conteúdo); vazio se não houver"""
+        type_path = self.root / project_type
+        signature = self._signature(type_path)
+
+        with self.lock:
+            entry = self._entries.get(project_type)
+            if entry is not None and entry[0] == signature:
+                return dict(entry[1])
+
+        templates = {
+            Path(name).stem: (type_path / name).read_text(encoding='utf-8')
+            for name, _, _ in signature
+        }
+        with self.lock:
+            self._entries[project_type] = (signature, templates)
+            self.loads += 1
+        return dict(templates)
+
+    def invalidate(self, project_type: str = None) -> None:
+        """Descarta o cache de um tipo (ou de todos)"""
+        with self.lock:
+            if project_type is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(project_type, None)
+
+    def _signature(self, type_path: Path) -> Signature:
+        if not type_path.is_dir():
+            return ()
+        signature = []
+        for template_file in type_path.glob(self.pattern):
+            stat = template_file.stat()
+            signature.append((template_file.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(sorted(signature))
@@ -1,4 +1,7 @@
 # tools/wpf/generators/template_manager.py
+from typing import Dict, List, Optional
+from collections import OrderedDict
+import threading
 from ..templates.infrastructure.project import ProjectTemplates
 from ..templates.infrastructure.app import AppTemplates
 from ..templates.infrastructure.styles import StyleTemplates
@@ -11,7 +14,7 @@ from ..templates.viewmodels.shell_viewmodel import ShellViewModelTemplate
 from ..templates.viewmodels.main_viewmodel import MainViewModelTemplate
 
 class TemplateManager:
-    def __init__(self):
+    def __init__(self, max_rendered: int = 32):
         self.project_templates = ProjectTemplates()
         self.app_templates = AppTemplates()
         self.style_templates = StyleTemplates()
@@ -22,15 +25,43 @@ class TemplateManager:
         self.base_viewmodel = BaseViewModelTemplate()
         self.shell_viewmodel = ShellViewModelTemplate()
         self.main_viewmodel = MainViewModelTemplate()
+        # Templates que não dependem do nome do projeto, gerados uma única vez
+        self._static_templates: Optional[Dict[str, str]] = None
+        # A saída é função apenas do nome do projeto (o GUID é determinístico);
+        # LRU limitado, já que o daemon gera projetos com nomes sempre novos
+        self.max_rendered = max_rendered
+        self._rendered: 'OrderedDict[str, Dict[str, str]]' = OrderedDict()
+        self._lock = threading.Lock()
 
     def get_base_templates(self, project_name: str) -> dict:
+        with self._lock:
+            rendered = self._rendered.get(project_name)
+            if rendered is not None:
+                self._rendered.move_to_end(project_name)
+                return dict(rendered)
+
+        rendered = self._render_base_templates(project_name)
+        with self._lock:
+            self._rendered[project_name] = rendered
+            self._rendered.move_to_end(project_name)
+            while len(self._rendered) > self.max_rendered:
+                self._rendered.popitem(last=False)
+        return dict(rendered)
+
+    def write_base_templates(self, target, project_name: str) -> List[str]:
+        """Grava os templates base em `target/<nome>` (ex.: um VirtualFileSystem)"""
+        files = self.get_base_templates(project_name)
+        for path, content in files.items():
+            target.write_text(f"{project_name}/{path}", content)
+        return list(files)
+
+    def _render_base_templates(self, project_name: str) -> Dict[str, str]:
         return {
             f'{project_name}.csproj': self.project_templates.csproj(project_name, self._get_base_packages()),
-            f'{project_name}.sln': self.project_templates.solution(project_name, self._generate_guid()),
+            f'{project_name}.sln': self.project_templates.solution(project_name, self._generate_guid(project_name)),
             'App.xaml': self.app_templates.xaml(project_name),
             'App.xaml.cs': self.app_templates.code_behind(project_name),
-            'Styles/BaseStyles.xaml': self.style_templates.base_styles(),
-            'Styles/Theme.xaml': self.style_templates.theme(),
+            **self._get_static_templates(),
             'Services/Navigation/INavigationService.cs': self.navigation_interfaces.navigation_service(project_name),
             'Services/Navigation/INavigationAware.cs': self.navigation_interfaces.navigation_aware(project_name),
             'Services/Navigation/NavigationService.cs': self.navigation_service.implementation(project_name),
@@ -43,12 +74,21 @@ class TemplateManager:
             'ViewModels/MainViewModel.cs': self.main_viewmodel.implementation(project_name)
         }
 
+    def _get_static_templates(self) -> Dict[str, str]:
+        if self._static_templates is None:
+            self._static_templates = {
+                'Styles/BaseStyles.xaml': self.style_templates.base_styles(),
+                'Styles/Theme.xaml': self.style_templates.theme()
+            }
+        return self._static_templates
+
     def _get_base_packages(self) -> list:
         return [
             ('CommunityToolkit.Mvvm', '8.2.2'),
             ('Microsoft.Extensions.DependencyInjection', '8.0.0')
         ]
 
-    def _generate_guid(self) -> str:
+    def _generate_guid(self, project_name: str) -> str:
+        # Estável por projeto, para que regenerar não altere o .sln
         import uuid
-        return str(uuid.uuid4()).upper()
\ No newline at end of file
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"kallista:{project_name}")).upper()
\ No newline at end of file
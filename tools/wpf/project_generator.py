@@ -1,19 +1,55 @@
 # tools/wpf/project_generator.py
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any, Optional
 from .generators.template_manager import TemplateManager
+from .stream_writer import StreamingProjectWriter
+from .file_emitter import FileEmitter, content_hash
+from .virtual_fs import VirtualFileSystem
 
 class WPFProjectGenerator:
-    def __init__(self):
+    def __init__(self, max_write_workers: int = None, incremental: bool = True,
+                 delete_orphans: bool = False, target: Optional[VirtualFileSystem] = None):
         self.template_manager = TemplateManager()
+        self.emitter = FileEmitter(max_write_workers)
+        # Regrava apenas arquivos cujo conteúdo mudou desde a última geração
+        self.incremental = incremental
+        # Remove arquivos da geração anterior que deixaram de ser gerados
+        self.delete_orphans = delete_orphans
+        # Destino em memória: os projetos ficam em `target/<nome>` até o flush/export
+        self.target = target
         self.output_path = Path("output")
-        self.output_path.mkdir(exist_ok=True)
+        if target is None:
+            self.output_path.mkdir(exist_ok=True)
+
+    def write_file(self, project_name: str, file_path: str, content: str,
+                   output_root: Optional[Path] = None) -> Path:
+        """Grava um arquivo do projeto, criando os diretórios necessários"""
+        root = Path(output_root) if output_root else self.output_path
+        if self.target is not None:
+            self.target.write(f"{project_name}/{file_path}", content)
+            return root / project_name / file_path
+        full_path = root / project_name / file_path
+        data = content.encode('utf-8')
+        # Conteúdo idêntico não é regravado (preserva o mtime)
+        if self.incremental and full_path.is_file() and full_path.stat().st_size == len(data) \
+                and full_path.read_bytes() == data:
+            return full_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_bytes(data)
+        return full_path
+
+    def stream_writer(self, project_name: str,
+                      output_root: Optional[Path] = None) -> StreamingProjectWriter:
+        """Writer que grava os arquivos emitidos pelos agentes durante a execução"""
+        return StreamingProjectWriter(
+            lambda file_path, content: self.write_file(project_name, file_path, content, output_root)
+        )
 
     async def generate_project(self, project_spec: Dict) -> Dict:
-        """Gera a estrutura do projeto WPF"""
+        """Gera a estrutura do projeto WPF (em `project_spec['output_root']`, se informado)"""
         try:
             project_name = project_spec['metadata']['name']
-            output_path = Path("output") / project_name
+            output_path = Path(project_spec.get('output_root') or self.output_path) / project_name
             
             # Criar estrutura de diretórios
             directories = [
@@ -24,25 +60,41 @@ class WPFProjectGenerator:
                 'Styles',
                 'Properties'
             ]
-            
-            for dir_name in directories:
-                (output_path / dir_name).mkdir(parents=True, exist_ok=True)
     
             # Gerar arquivos base
             base_files = self.template_manager.get_base_templates(project_name)
             
-            # Gerar cada arquivo
-            files_generated = []
-            for file_path, content in base_files.items():
-                full_path = output_path / file_path
-                full_path.parent.mkdir(exist_ok=True)
-                full_path.write_text(content, encoding='utf-8')
-                files_generated.append(file_path)
+            # Arquivos já emitidos pelos agentes (streaming) prevalecem sobre os templates
+            streamed_files = list(project_spec.get('streamed_files', []))
+            files = {
+                file_path: content for file_path, content in base_files.items()
+                if file_path not in streamed_files
+            }
+
+            if self.target is not None:
+                return self._generate_virtual(project_name, project_spec, files, directories)
+
+            # Diretórios e arquivos gravados em lote, fora do event loop
+            previous = self.emitter.load_manifest(output_path) if self.incremental else None
+            emitted = await self.emitter.emit_async(output_path, files, directories, previous)
+            streamed = self.emitter.describe(output_path, streamed_files)
+            previous_files = (previous or {}).get('files', {})
+            streamed_unchanged = [path for path in streamed if previous_files.get(path) == streamed[path]]
+
+            manifest = self.emitter.manifest(output_path, {**emitted['files'], **streamed})
+            manifest['written'] = emitted['written'] + \
+                [path for path in streamed if path not in streamed_unchanged]
+            manifest['unchanged'] = emitted['unchanged'] + streamed_unchanged
+            manifest['deleted'] = self.emitter.prune(output_path, previous, manifest['files']) \
+                if self.delete_orphans else []
+            self.emitter.save_manifest(output_path, manifest)
+            files_generated = list(files) + streamed_files
     
             return {
                 'status': 'success',
                 'path': str(output_path),
                 'files_generated': files_generated,
+                'manifest': manifest,
                 'project_spec': project_spec  # Retornando para uso pelos agentes
             }
     
@@ -51,4 +103,25 @@ class WPFProjectGenerator:
             return {
                 'status': 'error',
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+    def _generate_virtual(self, project_name: str, project_spec: Dict,
+                          files: Dict[str, str], directories: List[str]) -> Dict:
+        """Monta o projeto no sistema de arquivos virtual (sem I/O de disco)"""
+        for directory in directories:
+            self.target.mkdir(f"{project_name}/{directory}")
+        self.target.update(files, prefix=project_name)
+
+        project_files = self.target.files(project_name)
+        manifest = self.emitter.manifest(project_name, {
+            path: {'size': len(data), 'sha256': content_hash(data)}
+            for path, data in project_files.items()
+        })
+        return {
+            'status': 'success',
+            'path': project_name,
+            'virtual': True,
+            'files_generated': list(project_files),
+            'manifest': manifest,
+            'project_spec': project_spec
+        }
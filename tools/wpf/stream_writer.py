@@ -0,0 +1,235 @@
+# tools/wpf/stream_writer.py
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
+from pathlib import PurePosixPath
+import json
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+FENCE_OPEN = re.compile(r'^\s*```\s*([\w#+.-]*)(?:\s*[: ]\s*([^\s`]+))?\s*$')
+FENCE_CLOSE = re.compile(r'^\s*```\s*$')
+# "File: Views/MainView.xaml", "**Arquivo:** `Models/User.cs`", "// File: X.cs", "<!-- File: X.xaml -->"
+FILE_HINT = re.compile(r'(?:file|arquivo)\s*:?\**\s*`?([\w./\\-]+\.\w+)`?', re.IGNORECASE)
+
+SUPPORTED_EXTENSIONS = ('.xaml', '.cs', '.csproj', '.config', '.json')
+
+_CSHARP_NOISE = re.compile(
+    r'//[^\n]*|/\*.*?\*/|@"(?:[^"]|"")*"|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])+\'',
+    re.DOTALL
+)
+
+def normalize_path(path: str) -> Optional[str]:
+    """Caminho relativo seguro dentro do projeto (None se inválido)"""
+    path = path.strip().replace('\\', '/')
+    parts = PurePosixPath(path).parts
+    if not parts or path.startswith('/') or '..' in parts or ':' in parts[0]:
+        return None
+    return str(PurePosixPath(*parts))
+
+def validate_file_block(path: str, content: str) -> Optional[str]:
+    """Valida o conteúdo de um arquivo emitido pelo agente; retorna o erro ou None"""
+    suffix = PurePosixPath(path).suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
+        return f"Extensão não suportada: {suffix or path}"
+    if not content.strip():
+        return "Arquivo vazio"
+
+    if suffix in ('.xaml', '.csproj', '.config'):
+        try:
+            ET.fromstring(content.strip())
+        except ET.ParseError as e:
+            return f"XML inválido: {str(e)}"
+    elif suffix == '.json':
+        try:
+            json.loads(content)
+        except ValueError as e:
+            return f"JSON inválido: {str(e)}"
+    elif suffix == '.cs':
+        depth = 0
+        for char in _CSHARP_NOISE.sub('', content):
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth < 0:
+                    return "Chaves desbalanceadas"
+        if depth != 0:
+            return "Chaves desbalanceadas"
+    return None
+
+class FileBlockParser:
+    """Extrai blocos de arquivo completos de um texto recebido em partes.
+
+    Um bloco é um trecho cercado por ``` cujo caminho vem da linha de
+    abertura (```csharp Models/User.cs), da linha anterior (File: ...) ou
+    da primeira linha do bloco (// File: ...). Blocos sem caminho são
+    ignorados.
+    """
+
+    def __init__(self):
+        self._pending = ''
+        self._previous_line = ''
+        self._path: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> Iterator[Tuple[Optional[str], str]]:
+        """Processa um trecho e retorna os blocos concluídos nele"""
+        self._pending += chunk
+        *lines, self._pending = self._pending.split('\n')
+        for line in lines:
+            block = self._process_line(line.rstrip('\r'))
+            if block is not None:
+                yield block
+
+    def close(self) -> Iterator[Tuple[Optional[str], str]]:
+        """Processa o restante do texto; um bloco não fechado é descartado"""
+        if self._pending:
+            block = self._process_line(self._pending.rstrip('\r'))
+            self._pending = ''
+            if block is not None:
+                yield block
+        self._lines = None
+
+    def _process_line(self, line: str) -> Optional[Tuple[Optional[str], str]]:
+        if self._lines is None:
+            match = FENCE_OPEN.match(line)
+            if match:
+                hint = FILE_HINT.search(self._previous_line)
+                self._path = match.group(2) or (hint.group(1) if hint else None)
+                self._lines = []
+            elif line.strip():
+                self._previous_line = line
+            return None
+
+        if FENCE_CLOSE.match(line):
+            lines, path = self._lines, self._path
+            self._lines, self._path, self._previous_line = None, None, ''
+            if path is None and lines:
+                hint = FILE_HINT.search(lines[0])
+                if hint and lines[0].lstrip().startswith(('//', '<!--', '#')):
+                    path, lines = hint.group(1), lines[1:]
+            if path is None:
+                return None
+            return path, '\n'.join(lines) + '\n'
+
+        self._lines.append(line)
+        return None
+
+class StreamingProjectWriter:
+    """Grava os arquivos emitidos pelos agentes assim que cada bloco termina.
+
+    Os tokens chegam durante a geração (`feed`, via
+    `core.llm.stream_callback.TokenStreamCallback`); cada origem (tarefa)
+    tem seu próprio parser, pois as tarefas executam em paralelo. Arquivos
+    válidos são gravados imediatamente pelo gerador, fora do lock principal
+    (que protege apenas parsers e registros), para que origens diferentes
+    gravem ao mesmo tempo; os inválidos são registrados em `rejected`. A saída final da tarefa (`task_callback`)
+    apenas completa o que não veio por streaming, como respostas servidas
+    do cache. A mesclagem com os templates base acontece em
+    `WPFProjectGenerator.generate_project`.
+    """
+
+    def __init__(self, write_file: Callable[[str, str], Any]):
+        self.write_file = write_file
+        self.lock = threading.Lock()
+        self.parsers: Dict[str, FileBlockParser] = {}
+        self.written: Dict[str, str] = {}
+        self._contents: Dict[str, int] = {}
+        # Serializa as gravações de um mesmo arquivo vindas de origens diferentes
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self.rejected: List[Dict[str, str]] = []
+        self.started = time.perf_counter()
+        self.first_file_time: Optional[float] = None
+
+    def feed(self, source: str, chunk: str) -> List[str]:
+        """Recebe parte da saída de um agente; retorna os arquivos gravados"""
+        with self.lock:
+            parser = self.parsers.setdefault(source, FileBlockParser())
+            blocks = self._record(source, parser.feed(chunk))
+        return self._write(blocks)
+
+    def finish(self, source: str) -> List[str]:
+        """Encerra a saída de um agente"""
+        with self.lock:
+            parser = self.parsers.pop(source, None)
+            if parser is None:
+                return []
+            blocks = self._record(source, parser.close())
+        return self._write(blocks)
+
+    def task_callback(self, source: str) -> Callable[[Any], None]:
+        """Callback de conclusão de tarefa do CrewAI para a origem informada.
+
+        Mesclagem final: arquivos já gravados com o mesmo conteúdo durante o
+        streaming não são regravados.
+        """
+        def callback(output: Any) -> None:
+            self.finish(source)
+            self.feed(source, (getattr(output, 'raw', None) or str(output)) + '\n')
+            self.finish(source)
+        return callback
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'files_written': len(self.written),
+                'files_rejected': len(self.rejected),
+                'rejected': list(self.rejected),
+                'time_to_first_file': self.first_file_time
+            }
+
+    def _accept(self, source: str, path: str, content: str) -> bool:
+        safe_path = normalize_path(path)
+        error = 'Caminho inválido' if safe_path is None else validate_file_block(safe_path, content)
+        if error:
+            rejection = {'source': source, 'path': path, 'error': error}
+            # A mesclagem final revê blocos já rejeitados durante o streaming
+            if rejection not in self.rejected:
+                self.rejected.append(rejection)
+            return False
+        return True
+
+    def _record(self, source: str,
+                blocks: Iterator[Tuple[str, str]]) -> List[Tuple[str, str, Optional[int]]]:
+        """Valida e registra os blocos (sob o lock).
+
+        Retorna (caminho, conteúdo, digest); o digest é None quando o arquivo
+        já tem esse conteúdo e não precisa ser regravado.
+        """
+        recorded = []
+        for path, content in blocks:
+            if not self._accept(source, path, content):
+                continue
+            path = normalize_path(path)
+            digest = hash(content)
+            changed = self._contents.get(path) != digest
+            self._contents[path] = digest
+            self.written[path] = source
+            self._path_locks.setdefault(path, threading.Lock())
+            recorded.append((path, content, digest if changed else None))
+        return recorded
+
+    def _write(self, blocks: List[Tuple[str, str, Optional[int]]]) -> List[str]:
+        """Grava os blocos registrados, fora do lock principal"""
+        for path, content, digest in blocks:
+            if digest is None:
+                continue
+            with self._path_locks[path]:
+                # Outra origem pode ter registrado um conteúdo mais recente
+                with self.lock:
+                    latest = self._contents.get(path) == digest
+                if latest:
+                    try:
+                        self.write_file(path, content)
+                    except Exception:
+                        with self.lock:
+                            if self._contents.get(path) == digest:
+                                del self._contents[path]
+                                self.written.pop(path, None)
+                        raise
+
+        with self.lock:
+            if blocks and self.first_file_time is None:
+                self.first_file_time = time.perf_counter() - self.started
+        return [path for path, _, _ in blocks]
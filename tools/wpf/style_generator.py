@@ -1,7 +1,8 @@
 # tools/wpf/style_generator.py
 from typing import Dict, List, Any
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+
+from .xaml_writer import format_xaml
 
 class StyleGenerator:
     def __init__(self):
@@ -103,6 +104,4 @@ class StyleGenerator:
 
     def _format_xaml(self, element: ET.Element) -> str:
         """Formata o XAML para melhor legibilidade"""
-        rough_string = ET.tostring(element, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="    ")
\ No newline at end of file
+        return format_xaml(element)
\ No newline at end of file
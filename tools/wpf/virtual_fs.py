@@ -0,0 +1,185 @@
+# tools/wpf/virtual_fs.py
+from typing import Dict, List, Any, BinaryIO, Iterator, Optional, Union
+from pathlib import Path, PurePosixPath
+import io
+import tarfile
+import zipfile
+
+from .file_emitter import FileEmitter
+from .stream_writer import normalize_path
+
+Content = Union[str, bytes]
+
+# Data fixa nos arquivos compactados: o mesmo projeto gera o mesmo arquivo
+ARCHIVE_DATE = (2024, 1, 1, 0, 0, 0)
+ARCHIVE_MTIME = 1704067200
+
+ARCHIVE_FORMATS = {
+    '.zip': 'zip',
+    '.tar': 'tar',
+    '.tar.gz': 'tar:gz',
+    '.tgz': 'tar:gz',
+    '.tar.bz2': 'tar:bz2',
+    '.tar.xz': 'tar:xz'
+}
+
+class LocalFileSystem:
+    """Destino padrão dos geradores: grava diretamente no disco"""
+
+    def mkdir(self, path: Union[str, Path]) -> None:
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    def write_text(self, path: Union[str, Path], content: str) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+class VirtualFileSystem:
+    """Árvore de arquivos gerados mantida em memória.
+
+    Os geradores escrevem aqui em vez de criar centenas de arquivos
+    pequenos; no final a árvore é descarregada de uma vez, no disco
+    (`flush`, em lote) ou como um único zip/tar gravado sequencialmente
+    (`write_zip`, `write_tar`, `export`).
+    """
+
+    def __init__(self):
+        self._files: Dict[str, bytes] = {}
+        self._directories: set = set()
+
+    def mkdir(self, path: Union[str, Path]) -> None:
+        self._directories.add(self._normalize(path))
+
+    def write(self, path: Union[str, Path], content: Content) -> str:
+        """Grava (ou substitui) um arquivo; retorna o caminho normalizado"""
+        path = self._normalize(path)
+        self._files[path] = content if isinstance(content, bytes) else content.encode('utf-8')
+        return path
+
+    def write_text(self, path: Union[str, Path], content: str) -> None:
+        self.write(path, content)
+
+    def update(self, files: Dict[str, Content], prefix: str = '') -> None:
+        for path, content in files.items():
+            self.write(f"{prefix}/{path}" if prefix else path, content)
+
+    def read(self, path: Union[str, Path]) -> bytes:
+        return self._files[self._normalize(path)]
+
+    def read_text(self, path: Union[str, Path]) -> str:
+        return self.read(path).decode('utf-8')
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        return self._normalize(path) in self._files
+
+    def remove(self, path: Union[str, Path]) -> None:
+        self._files.pop(self._normalize(path), None)
+
+    def files(self, prefix: str = '') -> Dict[str, bytes]:
+        """Arquivos (caminho -> conteúdo) sob `prefix`, com caminhos relativos a ele"""
+        if not prefix:
+            return dict(sorted(self._files.items()))
+        prefix = self._normalize(prefix) + '/'
+        return {
+            path[len(prefix):]: data for path, data in sorted(self._files.items())
+            if path.startswith(prefix)
+        }
+
+    def directories(self) -> List[str]:
+        """Diretórios explícitos e implícitos, pais antes dos filhos"""
+        directories = set(self._directories)
+        for path in self._files:
+            directories.update(str(parent) for parent in PurePosixPath(path).parents)
+        directories.discard('.')
+        return sorted(directories, key=lambda directory: (directory.count('/'), directory))
+
+    @property
+    def total_size(self) -> int:
+        return sum(len(data) for data in self._files.values())
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._files))
+
+    def flush(self, root: Union[str, Path], emitter: Optional[FileEmitter] = None,
+              previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Grava a árvore no disco em lote; retorna o manifesto do FileEmitter"""
+        return (emitter or FileEmitter()).emit(
+            Path(root), self._files, self._directories, previous
+        )
+
+    def write_zip(self, target: Union[str, Path, BinaryIO],
+                  compression: int = zipfile.ZIP_DEFLATED) -> int:
+        """Grava a árvore como zip (arquivo ou stream binário); retorna o número de arquivos"""
+        with zipfile.ZipFile(target, 'w', compression=compression) as archive:
+            for directory in self.directories():
+                archive.writestr(self._zip_info(directory + '/', 0o40755 << 16 | 0x10), b'')
+            for path, data in self.files().items():
+                archive.writestr(self._zip_info(path, 0o100644 << 16, compression), data)
+        return len(self._files)
+
+    def write_tar(self, target: Union[str, Path, BinaryIO], compression: str = 'gz') -> int:
+        """Grava a árvore como tar em modo stream (`compression`: '', 'gz', 'bz2' ou 'xz')"""
+        mode = f"w|{compression}" if compression else 'w|'
+        if isinstance(target, (str, Path)):
+            with open(target, 'wb') as f:
+                return self.write_tar(f, compression)
+
+        with tarfile.open(fileobj=target, mode=mode, format=tarfile.PAX_FORMAT) as archive:
+            for directory in self.directories():
+                archive.addfile(self._tar_info(directory, tarfile.DIRTYPE, 0o755))
+            for path, data in self.files().items():
+                info = self._tar_info(path, tarfile.REGTYPE, 0o644)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        return len(self._files)
+
+    def export(self, target: Union[str, Path]) -> Dict[str, Any]:
+        """Exporta para um arquivo compactado, com o formato deduzido da extensão"""
+        target = Path(target)
+        name = target.name.lower()
+        archive_format = next(
+            (fmt for suffix, fmt in sorted(ARCHIVE_FORMATS.items(), key=lambda item: -len(item[0]))
+             if name.endswith(suffix)),
+            None
+        )
+        if archive_format is None:
+            raise ValueError(f"Formato de arquivo não suportado: {target.name}")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if archive_format == 'zip':
+            self.write_zip(target)
+        else:
+            self.write_tar(target, archive_format.partition(':')[2])
+        return {
+            'path': str(target),
+            'format': archive_format,
+            'file_count': len(self._files),
+            'total_size': self.total_size,
+            'archive_size': target.stat().st_size
+        }
+
+    @staticmethod
+    def _normalize(path: Union[str, Path]) -> str:
+        normalized = normalize_path(str(path))
+        if normalized is None:
+            raise ValueError(f"Caminho inválido: {path}")
+        return normalized
+
+    @staticmethod
+    def _zip_info(name: str, attributes: int,
+                  compression: int = zipfile.ZIP_STORED) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=ARCHIVE_DATE)
+        info.external_attr = attributes
+        info.compress_type = compression
+        return info
+
+    @staticmethod
+    def _tar_info(name: str, kind: bytes, mode: int) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(name)
+        info.type = kind
+        info.mode = mode
+        info.mtime = ARCHIVE_MTIME
+        return info
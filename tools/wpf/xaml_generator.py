@@ -1,8 +1,9 @@
 # tools/wpf/xaml_generator.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TextIO, Union
 from pathlib import Path
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+
+from .xaml_writer import format_xaml, write_xaml
 
 class XamlGenerator:
     def __init__(self):
@@ -14,6 +15,19 @@ class XamlGenerator:
 
     def generate_window(self, config: Dict) -> str:
         """Gera XAML para uma janela WPF"""
+        return self._format_xaml(self._build_window(config))
+
+    def write_window(self, config: Dict, target: Union[str, Path, TextIO]) -> None:
+        """Gera a janela diretamente em um arquivo (caminho) ou stream"""
+        root = self._build_window(config)
+        if isinstance(target, (str, Path)):
+            with open(target, 'w', encoding='utf-8') as f:
+                write_xaml(root, f)
+        else:
+            write_xaml(root, target)
+
+    def _build_window(self, config: Dict) -> ET.Element:
+        """Monta a árvore de elementos da janela"""
         root = ET.Element('Window')
         for ns, uri in self.xmlns.items():
             root.set(f'xmlns:{ns}' if ns != 'default' else 'xmlns', uri)
@@ -32,7 +46,7 @@ class XamlGenerator:
             layout = self._create_layout(config['layout'])
             root.append(layout)
 
-        return self._format_xaml(root)
+        return root
 
     def _create_layout(self, layout_config: Dict) -> ET.Element:
         """Cria elemento de layout"""
@@ -92,6 +106,4 @@ class XamlGenerator:
 
     def _format_xaml(self, element: ET.Element) -> str:
         """Formata o XAML para melhor legibilidade"""
-        rough_string = ET.tostring(element, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="    ")
\ No newline at end of file
+        return format_xaml(element)
\ No newline at end of file
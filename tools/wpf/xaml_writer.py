@@ -0,0 +1,119 @@
+# tools/wpf/xaml_writer.py
+from typing import Dict, List, Any, Iterable, Optional, TextIO, Tuple, Union
+import io
+import xml.etree.ElementTree as ET
+
+XML_DECLARATION = '<?xml version="1.0" ?>'
+
+def escape(data: str) -> str:
+    """Mesmo escape usado pelo minidom em textos e atributos"""
+    return data.replace('&', '&amp;').replace('<', '&lt;') \
+        .replace('"', '&quot;').replace('>', '&gt;')
+
+class _OpenElement:
+    __slots__ = ('tag', 'has_children', 'text')
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.has_children = False
+        self.text: Optional[str] = None
+
+class XamlWriter:
+    """Escreve XAML indentado diretamente em um arquivo ou buffer.
+
+    A saída é idêntica à de `minidom.parseString(...).toprettyxml(indent)`,
+    sem montar string intermediária nem DOM. Aceita uma árvore do
+    ElementTree (`write_element`) ou eventos de um builder leve
+    (`start`/`text`/`end`), o que permite gerar views enormes sem
+    manter a árvore em memória.
+    """
+
+    def __init__(self, out: TextIO, indent: str = '    ', newline: str = '\n'):
+        self.out = out
+        self.indent = indent
+        self.newline = newline
+        self._stack: List[_OpenElement] = []
+
+    def declaration(self) -> None:
+        self.out.write(XML_DECLARATION + self.newline)
+
+    def start(self, tag: str, attributes: Union[Dict[str, str], Iterable[Tuple[str, str]]] = ()) -> None:
+        """Abre um elemento (atributos na ordem informada)"""
+        self._open_child()
+        items = attributes.items() if isinstance(attributes, dict) else attributes
+        parts = [self.indent * len(self._stack), '<', tag]
+        for name, value in items:
+            parts.append(f' {name}="{escape(str(value))}"')
+        self.out.write(''.join(parts))
+        self._stack.append(_OpenElement(tag))
+
+    def text(self, data: Optional[str]) -> None:
+        """Conteúdo textual do elemento aberto (trechos consecutivos são unidos)"""
+        if data and self._stack:
+            current = self._stack[-1]
+            current.text = data if current.text is None else current.text + data
+
+    def comment(self, data: str) -> None:
+        self._open_child()
+        self.out.write(f"{self.indent * len(self._stack)}<!--{data}-->{self.newline}")
+
+    def end(self) -> None:
+        """Fecha o elemento aberto mais recente"""
+        current = self._stack.pop()
+        depth = len(self._stack)
+
+        if not current.has_children:
+            if current.text is None:
+                self.out.write('/>' + self.newline)
+            else:
+                # Único filho textual: escrito na mesma linha
+                self.out.write(f">{escape(current.text)}</{current.tag}>{self.newline}")
+            return
+
+        self._flush_text(current, depth + 1)
+        self.out.write(f"{self.indent * depth}</{current.tag}>{self.newline}")
+
+    def element(self, tag: str, attributes: Union[Dict[str, str], Iterable[Tuple[str, str]]] = (),
+                text: Optional[str] = None) -> None:
+        """Elemento completo sem filhos"""
+        self.start(tag, attributes)
+        self.text(text)
+        self.end()
+
+    def write_element(self, element: ET.Element) -> None:
+        """Escreve um elemento do ElementTree e seus descendentes"""
+        self.start(element.tag, element.attrib.items())
+        self.text(element.text)
+        for child in element:
+            if child.tag is ET.Comment:
+                self.comment(child.text or '')
+            elif isinstance(child.tag, str):
+                self.write_element(child)
+            self.text(child.tail)
+        self.end()
+
+    def _open_child(self) -> None:
+        if not self._stack:
+            return
+        parent = self._stack[-1]
+        if not parent.has_children:
+            self.out.write('>' + self.newline)
+            parent.has_children = True
+        self._flush_text(parent, len(self._stack))
+
+    def _flush_text(self, element: _OpenElement, depth: int) -> None:
+        if element.text is not None:
+            self.out.write(escape(f"{self.indent * depth}{element.text}{self.newline}"))
+            element.text = None
+
+def write_xaml(element: ET.Element, out: TextIO, indent: str = '    ') -> None:
+    """Escreve o documento XAML (declaração + elemento raiz) em `out`"""
+    writer = XamlWriter(out, indent)
+    writer.declaration()
+    writer.write_element(element)
+
+def format_xaml(element: ET.Element, indent: str = '    ') -> str:
+    """Documento XAML formatado como string"""
+    buffer = io.StringIO()
+    write_xaml(element, buffer, indent)
+    return buffer.getvalue()